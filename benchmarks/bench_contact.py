@@ -0,0 +1,77 @@
+"""
+Contact Scanner Benchmark
+
+Times the linear-time contact scanners (src.contact) against the original
+EMAIL_PATTERN / PHONE_PATTERN regexes on pathological inputs of growing
+size. For a linear scanner the time per character stays flat as the input
+doubles; for a backtracking regex it grows with the input length.
+
+Usage:
+    python benchmarks/bench_contact.py
+    python benchmarks/bench_contact.py --sizes 10000 20000 40000 --regex
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import EMAIL_PATTERN, PHONE_PATTERN
+from src.contact import find_email, find_phone
+
+# Each generator builds a pathological input of roughly n characters
+INPUTS: Dict[str, Callable[[int], str]] = {
+    "word_run": lambda n: "a" * n,
+    "dotted_run": lambda n: "a." * (n // 2),
+    "at_then_dots": lambda n: "a@" + "a." * (n // 2),
+    "many_ats": lambda n: "a@" * (n // 2),
+    "base64": lambda n: "QUJD" * (n // 4) + "==",
+    "digit_run": lambda n: "1" * n,
+    "plus_digits": lambda n: "+1" * (n // 2),
+}
+
+
+def _time(func: Callable[[str], object], text: str, repeat: int = 3) -> float:
+    """Return the best wall time of func(text) over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print ns/char for each input and size."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 20000, 40000, 80000, 160000])
+    parser.add_argument("--regex", action="store_true", help="Also time the backtracking regexes (slow)")
+    args = parser.parse_args()
+
+    email_regex = re.compile(EMAIL_PATTERN, re.IGNORECASE)
+    phone_regex = re.compile(PHONE_PATTERN)
+
+    scanners = {"find_email": find_email, "find_phone": find_phone}
+    if args.regex:
+        scanners["EMAIL_PATTERN"] = email_regex.search
+        scanners["PHONE_PATTERN"] = phone_regex.search
+
+    header = f"{'input':<14}{'scanner':<15}" + "".join(f"{size:>12}" for size in args.sizes)
+    print("ns per input character")
+    print(header)
+    print("-" * len(header))
+    for name, make in INPUTS.items():
+        for scanner_name, scanner in scanners.items():
+            cells = []
+            for size in args.sizes:
+                text = make(size)
+                cells.append(f"{_time(scanner, text) / len(text) * 1e9:>12.1f}")
+            print(f"{name:<14}{scanner_name:<15}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Similarity Index Benchmark
+
+Builds a SimilarityIndex over synthetic parsed results and compares LSH
+queries with an exact scan of every vector. Results are drawn from a set of
+roles (skill clusters) so that similar candidates exist. Reports build
+time, index file size, load time, query latency (mean and p95) and recall:
+the share of LSH results scoring at least as high as the exact k-th result.
+
+Usage:
+    python benchmarks/bench_similarity.py
+    python benchmarks/bench_similarity.py --count 1000000 --bits 16 --tables 12
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SKILLS_KEYWORDS, EDUCATION_KEYWORDS, SIMILARITY_LSH_BITS, SIMILARITY_LSH_TABLES
+from src.similarity import SimilarityIndex
+
+
+def make_results(count: int, seed: int, roles: int = 20) -> pd.DataFrame:
+    """Draw results whose skills mostly come from one of a few roles."""
+    rng = random.Random(seed)
+    clusters = [rng.sample(SKILLS_KEYWORDS, 14) for _ in range(roles)]
+    rows: List[Dict[str, str]] = []
+    for i in range(count):
+        skills = rng.sample(rng.choice(clusters), rng.randint(3, 8))
+        skills += rng.sample(SKILLS_KEYWORDS, rng.randint(0, 2))
+        rows.append({
+            "FilePath": f"/resumes/{i:08d}.pdf",
+            "Skills": ", ".join(dict.fromkeys(skills)),
+            "Education": rng.choice(EDUCATION_KEYWORDS[:8]),
+        })
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    """Run the benchmark and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200000, help="Results to index")
+    parser.add_argument("--batch", type=int, default=50000, help="Results added per batch (segment)")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--bits", type=int, default=SIMILARITY_LSH_BITS)
+    parser.add_argument("--tables", type=int, default=SIMILARITY_LSH_TABLES)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = make_results(args.count, args.seed)
+    index = SimilarityIndex(bits=args.bits, tables=args.tables)
+    start = time.perf_counter()
+    for offset in range(0, len(results), args.batch):
+        index.add_frame(results.iloc[offset:offset + args.batch])
+    build_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.npz")
+        index.save(path)
+        size_mb = os.path.getsize(path) / 2 ** 20
+        start = time.perf_counter()
+        index = SimilarityIndex.load(path)
+        load_s = time.perf_counter() - start
+
+    rng = random.Random(args.seed + 1)
+    keys = [results["FilePath"].iat[rng.randrange(len(results))] for _ in range(args.queries)]
+    timings: Dict[bool, List[float]] = {False: [], True: []}
+    answers: Dict[bool, List[list]] = {False: [], True: []}
+    for exact in (False, True):
+        for key in keys:
+            start = time.perf_counter()
+            answers[exact].append(index.similar_to(key, args.k, exact=exact))
+            timings[exact].append((time.perf_counter() - start) * 1000)
+
+    recall = np.mean([
+        sum(1 for _, score in lsh if score >= exact[-1][1] - 1e-6) / args.k
+        for lsh, exact in zip(answers[False], answers[True])
+    ])
+
+    print(f"{len(index)} results, {args.bits} bits x {args.tables} tables")
+    print(f"build {build_s:.2f} s, file {size_mb:.1f} MB, load {load_s:.2f} s")
+    print(f"{'query':<8}{'mean ms':>10}{'p95 ms':>10}")
+    for exact, name in ((False, "lsh"), (True, "exact")):
+        ms = np.array(timings[exact])
+        print(f"{name:<8}{ms.mean():>10.2f}{np.percentile(ms, 95):>10.2f}")
+    print(f"recall@{args.k} of lsh: {recall:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Fuzzy Skill Matching Benchmark
+
+Measures what fuzzy skill matching costs per document and what it finds.
+Synthetic skills sections are generated from the config.py vocabulary with
+realistic variants (adjacent letters swapped, a letter dropped, words split
+or joined, punctuation removed) mixed with filler text. For each matcher it
+reports the time per document and the share of planted skills recovered:
+- exact: the default substring match
+- fuzzy: a profile built with fuzzy=True (n-gram shortlist + edit distance)
+- brute force (--brute): edit distance from every text window to every
+  skill, the approach the index avoids
+
+Usage:
+    python benchmarks/bench_skills.py
+    python benchmarks/bench_skills.py --count 2000 --skills 12 --brute
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from typing import Callable, Iterable, List, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import FILLER
+from config import SKILLS_KEYWORDS
+from src.fuzzy import SkillIndex, _WORD, edit_distance, normalize_term
+from src.parser import extract_skills
+from src.profiles import ParserProfile
+
+
+def _variant(skill: str, rng: random.Random) -> str:
+    """Misspell or re-space a skill the way PDFs and candidates do."""
+    letters = [i for i, c in enumerate(skill) if c.isalpha()]
+    kind = rng.choice(["swap", "drop", "split", "strip", "same"])
+    if kind == "swap" and len(letters) >= 6:
+        i = rng.choice(letters[1:-2])
+        return skill[:i] + skill[i + 1] + skill[i] + skill[i + 2:]
+    if kind == "drop" and len(letters) >= 6:
+        i = rng.choice(letters[1:-1])
+        return skill[:i] + skill[i + 1:]
+    if kind == "split" and " " not in skill and len(skill) >= 6:
+        i = rng.randint(2, len(skill) - 3)
+        return skill[:i] + " " + skill[i:]
+    if kind == "strip":
+        return skill.replace(".", " ").replace("-", " ")
+    return skill
+
+
+def make_documents(count: int, skills_per_doc: int, seed: int) -> List[Tuple[str, Set[str]]]:
+    """Build (skills section text, planted skills) pairs."""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        planted = rng.sample(SKILLS_KEYWORDS, skills_per_doc)
+        parts = [_variant(skill, rng) for skill in planted]
+        text = "SKILLS " + ", ".join(parts) + ". " + FILLER * rng.randint(1, 3)
+        documents.append((text, set(planted)))
+    return documents
+
+
+def brute_force(skills: Iterable[str]) -> Callable[[str], Set[str]]:
+    """Compare every text window with every skill (the unindexed baseline)."""
+    index = SkillIndex(skills)
+
+    def find(text: str) -> Set[str]:
+        words = _WORD.findall(text.lower())
+        found = set()
+        for start in range(len(words)):
+            for size in range(1, index.max_words + 1):
+                term = "".join(words[start:start + size])
+                for skill, skill_term, k in zip(index.skills, index.terms, index.edits):
+                    if edit_distance(term, skill_term, k) <= k:
+                        found.add(skill)
+        return found
+
+    return find
+
+
+def run_matcher(find: Callable[[str], Iterable[str]], documents: List[Tuple[str, Set[str]]]) -> Tuple[float, float]:
+    """Return (microseconds per document, recall of planted skills)."""
+    hits = planted = 0
+    start = time.perf_counter()
+    results = [set(find(text)) for text, _ in documents]
+    elapsed = time.perf_counter() - start
+    for found, (_, truth) in zip(results, documents):
+        hits += len(found & truth)
+        planted += len(truth)
+    return elapsed / len(documents) * 1e6, hits / planted
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000, help="Documents to generate")
+    parser.add_argument("--skills", type=int, default=8, help="Skills planted per document")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--brute", action="store_true", help="Also time the unindexed brute force (slow)")
+    args = parser.parse_args()
+
+    documents = make_documents(args.count, args.skills, args.seed)
+    exact = ParserProfile(fuzzy=False)
+
+    start = time.perf_counter()
+    fuzzy = ParserProfile(fuzzy=True)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    matchers = {
+        "exact": lambda text: extract_skills(text, exact),
+        "fuzzy (cold cache)": lambda text: extract_skills(text, fuzzy),
+        "fuzzy (warm cache)": lambda text: extract_skills(text, fuzzy),
+    }
+    if args.brute:
+        matchers["brute force"] = brute_force(SKILLS_KEYWORDS)
+
+    index = fuzzy.skill_index
+    print(f"{len(documents)} documents, {args.skills} skills each; index of {len(index.terms)} skills "
+          f"and {len(index.postings)} n-grams built in {build_ms:.1f} ms")
+    print(f"{'matcher':<20}{'us/doc':>10}{'extra':>10}{'recall':>10}")
+    print("-" * 50)
+    baseline = None
+    for name, find in matchers.items():
+        us, recall = run_matcher(find, documents)
+        baseline = us if baseline is None else baseline
+        print(f"{name:<20}{us:>10.1f}{us - baseline:>+10.1f}{recall:>10.1%}")
+
+    words = sum(len(_WORD.findall(text.lower())) for text, _ in documents) / len(documents)
+    shortlist = [len(index.shortlist(normalize_term(w))) for text, _ in documents[:50] for w in text.split()]
+    print(f"\n{words:.0f} words per document; mean shortlist {sum(shortlist) / len(shortlist):.2f} "
+          f"of {len(index.terms)} skills per window")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Worker Startup Benchmark
+
+Starts worker processes with each start method and measures how long a
+worker takes to become ready (process start plus the imports and pattern
+compilation its first document needs), and how much memory only it uses
+(USS, private pages) after parsing documents from the synthetic corpus of
+benchmarks/corpus.py and running a full garbage collection. Workers are
+kept alive together so that pages shared with the template or with each
+other are not counted.
+
+Variants:
+- spawn: every worker starts a fresh interpreter
+- fork: forked from the main process as it is (no warm-up, no gc.freeze)
+- forkserver: forked from the preloaded, frozen template server
+- fork+template: the main process is preloaded and frozen, then forked
+
+Usage:
+    python benchmarks/bench_workers.py
+    python benchmarks/bench_workers.py --workers 8 --docs 100 --corpus /tmp/corpus
+"""
+
+import os
+import gc
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import generate_corpus
+from src.bootstrap import worker_context
+from src.pipeline import process_resume
+from src.memory import unique_memory
+
+MB = 2 ** 20
+
+
+def _first_document(path: str) -> int:
+    """Parse one document (the first task of a worker) and return the pid."""
+    process_resume(path, use_cache=False)
+    return os.getpid()
+
+
+def _parse_all(paths: List[str]) -> int:
+    """
+    Parse documents and return how many produced a result.
+
+    Ends with a full collection, as a long-running worker eventually runs
+    one: it touches every object the collector tracks.
+    """
+    parsed = sum(process_resume(path, use_cache=False) is not None for path in paths)
+    gc.collect()
+    return parsed
+
+
+def run_variant(
+    context: multiprocessing.context.BaseContext, workers: int, paths: List[str]
+) -> Tuple[List[float], List[int]]:
+    """
+    Start workers one by one, then parse paths on every worker.
+
+    Returns:
+        Tuple[List[float], List[int]]: Milliseconds until each worker had
+            parsed its first document, and each worker's USS in bytes.
+    """
+    executors: List[ProcessPoolExecutor] = []
+    startup: List[float] = []
+    pids: List[int] = []
+    try:
+        for _ in range(workers):
+            start = time.perf_counter()
+            executor = ProcessPoolExecutor(max_workers=1, mp_context=context)
+            pids.append(executor.submit(_first_document, paths[0]).result())
+            startup.append((time.perf_counter() - start) * 1000)
+            executors.append(executor)
+        for executor in executors:
+            executor.submit(_parse_all, paths).result()
+        return startup, [unique_memory(pid) for pid in pids]
+    finally:
+        for executor in executors:
+            executor.shutdown()
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Existing corpus directory (default: generate a temporary one)")
+    parser.add_argument("--docs", type=int, default=50, help="Documents parsed by each worker")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if not unique_memory():
+        print("USS is not available on this platform (/proc/<pid>/smaps_rollup)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus or tmp
+        if not args.corpus:
+            generate_corpus(corpus_dir, args.docs)
+        paths = sorted(
+            os.path.join(corpus_dir, f) for f in os.listdir(corpus_dir) if f.endswith(".pdf")
+        )[:args.docs]
+
+        # fork+template freezes this process, so it runs after plain fork
+        variants: Dict[str, object] = {
+            "spawn": lambda: multiprocessing.get_context("spawn"),
+            "fork": lambda: multiprocessing.get_context("fork"),
+            "forkserver": lambda: worker_context("forkserver"),
+            "fork+template": lambda: worker_context("fork"),
+        }
+        print(f"{args.workers} workers, {len(paths)} documents each")
+        print(f"{'start method':<16}{'first ms':>10}{'next ms':>10}{'USS MB':>10}")
+        print("-" * 46)
+        for name, make_context in variants.items():
+            if name.split("+")[0] not in multiprocessing.get_all_start_methods():
+                continue
+            start = time.perf_counter()
+            context = make_context()
+            setup_ms = (time.perf_counter() - start) * 1000
+            startup, uss = run_variant(context, args.workers, paths)
+            # The first worker of a method also pays for preparing its template
+            first = startup[0] + setup_ms
+            rest = sum(startup[1:]) / max(len(startup) - 1, 1)
+            print(f"{name:<16}{first:>10.0f}{rest:>10.1f}{sum(uss) / len(uss) / MB:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Synthetic Resume Corpus
+
+Generates a reproducible corpus of resume PDFs for benchmarks. Each resume
+has a name, contact details, education, skills and experience sections, a
+repeated page header/footer, and spans one to three pages; some carry a
+reviewer annotation. Skills and degrees are drawn from the vocabularies in
+config.py, and the ground truth is written to truth.csv next to the PDFs.
+
+Usage:
+    python benchmarks/corpus.py out_dir/ --count 200
+"""
+
+import os
+import sys
+import csv
+import random
+import argparse
+from typing import Dict, List
+
+import fitz  # PyMuPDF
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SKILLS_KEYWORDS, EDUCATION_KEYWORDS
+
+FIRST_NAMES = ["Aarav", "Priya", "John", "Maria", "Wei", "Fatima", "Lukas", "Aisha", "Diego", "Emma"]
+LAST_NAMES = ["Sharma", "Smith", "Garcia", "Chen", "Khan", "Muller", "Okafor", "Rossi", "Silva", "Brown"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries"]
+FILLER = (
+    "Delivered features end to end, worked with product and design, reviewed "
+    "code, mentored junior engineers and improved reliability of services. "
+)
+
+
+def _resume(rng: random.Random, index: int) -> Dict[str, object]:
+    """Draw the fields of one synthetic resume."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "Name": f"{first} {last}",
+        "Email": f"{first.lower()}.{last.lower()}{index}@example.com",
+        "Phone": "".join(rng.choice("0123456789") for _ in range(10)),
+        "Education": rng.choice(EDUCATION_KEYWORDS[:8]),
+        "Skills": rng.sample(SKILLS_KEYWORDS, rng.randint(3, 10)),
+        "pages": rng.choice([1, 1, 2, 3]),
+        "annotated": rng.random() < 0.3,
+    }
+
+
+def _lines(fields: Dict[str, object], rng: random.Random) -> List[str]:
+    """Lay out the body text of a resume."""
+    lines = [
+        str(fields["Name"]),
+        f"{fields['Email']} | {fields['Phone']}",
+        "",
+        "EDUCATION",
+        f"{fields['Education']} in Computer Science, State University",
+        "",
+        "SKILLS",
+        ", ".join(fields["Skills"]),
+        "",
+        "EXPERIENCE",
+    ]
+    for _ in range(int(fields["pages"]) * 4):
+        lines.append(f"{rng.choice(COMPANIES)} - Software Engineer")
+        lines.extend([FILLER[:90], FILLER[90:]])
+    return lines
+
+
+def write_resume(path: str, fields: Dict[str, object], rng: random.Random) -> None:
+    """Write one resume PDF."""
+    doc = fitz.open()
+    lines = _lines(fields, rng)
+    per_page = (len(lines) + int(fields["pages"]) - 1) // int(fields["pages"])
+    for page_num in range(int(fields["pages"])):
+        page = doc.new_page()
+        page.insert_text((72, 36), "Confidential - Candidate Profile", fontsize=8)
+        page.insert_text((72, 820), f"{fields['Name']} - page {page_num + 1}", fontsize=8)
+        body = "\n".join(lines[page_num * per_page:(page_num + 1) * per_page])
+        page.insert_textbox(fitz.Rect(72, 72, 523, 790), body, fontsize=10)
+        if fields["annotated"] and page_num == 0:
+            page.add_freetext_annot(fitz.Rect(350, 72, 520, 110), "Recruiter: strong Python, call back")
+    doc.save(path)
+    doc.close()
+
+
+def generate_corpus(out_dir: str, count: int = 200, seed: int = 0) -> List[str]:
+    """
+    Generate the corpus and its ground truth.
+
+    Args:
+        out_dir (str): Directory to write PDFs and truth.csv to.
+        count (int): Number of resumes.
+        seed (int): Random seed (same seed, same corpus).
+
+    Returns:
+        List[str]: Paths of the generated PDFs.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    paths = []
+    with open(os.path.join(out_dir, "truth.csv"), "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["File", "Name", "Email", "Phone", "Education", "Skills"])
+        for index in range(count):
+            fields = _resume(rng, index)
+            path = os.path.join(out_dir, f"resume_{index:05d}.pdf")
+            write_resume(path, fields, rng)
+            writer.writerow([
+                os.path.basename(path), fields["Name"], fields["Email"], fields["Phone"],
+                fields["Education"], ", ".join(fields["Skills"]),
+            ])
+            paths.append(path)
+    return paths
+
+
+def main() -> None:
+    """Generate a corpus from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("out_dir")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    paths = generate_corpus(args.out_dir, args.count, args.seed)
+    print(f"Wrote {len(paths)} resumes to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
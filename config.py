@@ -7,7 +7,7 @@ Modify these settings to customize behavior without changing core code.
 
 import os
 import logging
-from typing import List
+from typing import Dict, List
 
 """
 Configuration module for resume parser.
@@ -18,7 +18,7 @@ Modify these settings to customize behavior without changing core code.
 
 import os
 import logging
-from typing import List
+from typing import Dict, List
 
 # ==============================================================================
 # DIRECTORIES
@@ -122,6 +122,45 @@ EDUCATION_KEYWORDS: List[str] = [
     "Diploma",
 ]
 
+# ==============================================================================
+# SECTION HEADERS
+# ==============================================================================
+# Header phrases used to segment a resume into sections. Headers are matched
+# case-sensitively in their written, Title Case and UPPER CASE forms so that
+# ordinary lowercase prose ("experience in ...") is not mistaken for a header.
+SECTION_HEADERS: Dict[str, List[str]] = {
+    "education": [
+        "Education",
+        "Academic Background",
+        "Academic Qualifications",
+        "Educational Qualifications",
+        "Qualifications",
+    ],
+    "experience": [
+        "Experience",
+        "Work Experience",
+        "Professional Experience",
+        "Employment History",
+        "Work History",
+    ],
+    "skills": [
+        "Skills",
+        "Technical Skills",
+        "Key Skills",
+        "Core Competencies",
+    ],
+    "projects": [
+        "Projects",
+        "Academic Projects",
+        "Personal Projects",
+    ],
+    "contact": [
+        "Contact",
+        "Contact Information",
+        "Contact Details",
+    ],
+}
+
 # ==============================================================================
 # LOGGING CONFIGURATION
 # ==============================================================================
@@ -129,9 +168,52 @@ LOG_LEVEL = logging.INFO
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_FILE = os.path.join(BASE_DIR, "logs", "resume_parser.log")
 
+# Write log records from a background thread (`run.py --async-logging`)
+LOG_ASYNC = False
+
+# Fraction of documents whose INFO/DEBUG records are kept; WARNING and
+# above are always kept (`run.py --log-sample-rate`)
+LOG_SAMPLE_RATE = 1.0
+
 # Create logs directory if it doesn't exist
 os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
 
+# ==============================================================================
+# PARSER PROFILES
+# ==============================================================================
+# Maximum number of compiled parser profiles (per-client vocabularies) kept in
+# the in-process LRU cache
+PROFILE_CACHE_SIZE = 64
+
+# ==============================================================================
+# FUZZY SKILL MATCHING
+# ==============================================================================
+# Also match skills with typos or different spacing ("Pyhton", "Node JS");
+# profiles can override this with get_profile(fuzzy=...)
+SKILLS_FUZZY = False
+
+# Normalized skill lengths at which one, two, ... edits are tolerated; shorter
+# skills ("Go", "AWS", "Excel") only match exactly after normalization
+FUZZY_EDIT_THRESHOLDS: List[int] = [6, 10]
+
+# Character n-gram size of the index used to shortlist candidate skills
+FUZZY_NGRAM = 3
+
+# Largest number of adjacent words joined into one candidate ("Postgre SQL")
+FUZZY_MAX_WORDS = 3
+
+# Number of looked-up text windows remembered per profile
+FUZZY_CACHE_SIZE = 100000
+
+# ==============================================================================
+# PROFILING
+# ==============================================================================
+# Seconds between stack samples taken by `run.py --profile`
+PROFILE_SAMPLE_INTERVAL = 0.005
+
+# Number of entries kept in the profile's "top" lists (files, allocation sites)
+PROFILE_TOP_N = 10
+
 # ==============================================================================
 # PARSER SETTINGS
 # ==============================================================================
@@ -141,6 +223,9 @@ MAX_TEXT_LENGTH = 100000
 # Whether to stop on first error or continue processing
 STOP_ON_ERROR = False
 
+# Number of texts parsed together by the batch API (src.batch.parse_resumes)
+BATCH_SIZE = 10000
+
 # Email regex pattern
 EMAIL_PATTERN = r'[\w\.-]+@[\w\.-]+\.\w+'
 
@@ -150,12 +235,284 @@ PHONE_PATTERN = r'\b\d{10}\b|\+\d{1,3}[-.\s]?\d{10}\b|\(\d{3}\)\s?\d{3}[-.\s]?\d
 # ==============================================================================
 # PDF PROCESSING
 # ==============================================================================
-# Supported file extensions
-SUPPORTED_EXTENSIONS = [".pdf"]
+# Supported file extensions; each needs an extractor in src/extractors.py
+SUPPORTED_EXTENSIONS = [".pdf", ".docx", ".txt"]
+
+# Encoding of .txt resumes (undecodable bytes are replaced)
+TEXT_FILE_ENCODING = "utf-8"
 
 # Whether to skip malformed PDFs or raise errors
 SKIP_MALFORMED_PDFS = True
 
+# Archive members larger than this are skipped when reading ZIP/TAR input
+ARCHIVE_MAX_MEMBER_BYTES = 50 * 1024 * 1024
+
+# Text extraction mode: "text" (plain text), "blocks" (text blocks in reading
+# order, image blocks dropped) or "words" (words re-joined line by line)
+EXTRACT_MODE = "text"
+
+# PyMuPDF TEXT_* flags (names without the prefix, e.g. "preserve_whitespace").
+# None uses PyMuPDF's defaults for the mode, which also preserve ligatures
+# and handle images the parser does not need.
+EXTRACT_FLAGS = None
+
+# Clip extraction to the page body: (left, top, right, bottom) margins in
+# points, or None for the whole page
+EXTRACT_CLIP_MARGINS = None
+
+# Extract only page content, not annotations or form fields (they are
+# deleted from the opened document before extraction; the file is untouched)
+EXTRACT_SKIP_ANNOTATIONS = False
+
+# Drop page headers/footers (name, contact line, page numbers) repeated on
+# most pages, keeping their first occurrence: a line counts as repeated when
+# it has the same text (page numbers ignored) and the same rank among the
+# first or last REPEATED_LINE_EDGE lines on at least REPEATED_LINE_MIN_PAGES
+# pages and on more than half of the pages
+EXTRACT_STRIP_REPEATED = False
+REPEATED_LINE_EDGE = 3
+REPEATED_LINE_MIN_PAGES = 2
+
+# MuPDF resource store: disable device caching (less memory, more decoding
+# work on repeated resources), and free this percentage of the store after
+# each document (0 keeps it, 100 empties it)
+MUPDF_LOW_MEMORY = False
+MUPDF_STORE_SHRINK_PERCENT = 0
+
+# In pool and queue worker processes, empty the MuPDF store after a document
+# when the process RSS is above this many MB (0 disables). MuPDF's own store
+# limit (256 MB) is fixed when PyMuPDF creates its context and cannot be
+# changed from Python, so the store is bounded through process memory instead
+MUPDF_STORE_RSS_LIMIT_MB = 512
+
+# After emptying the store, empty it again only once RSS has grown this many
+# MB above what remained (RSS that stays above the limit, e.g. heap
+# fragmentation, would otherwise empty the store after every document)
+MUPDF_STORE_RSS_HEADROOM_MB = 128
+
+# ==============================================================================
+# STORAGE
+# ==============================================================================
+# Endpoint of the S3-compatible object store used for s3://bucket/prefix input
+# (path-style addressing, so MinIO/Ceph endpoints work as well)
+S3_ENDPOINT_URL = os.environ.get("S3_ENDPOINT_URL", "https://s3.amazonaws.com")
+
+# Region used to sign requests; credentials come from AWS_ACCESS_KEY_ID,
+# AWS_SECRET_ACCESS_KEY and AWS_SESSION_TOKEN (unsigned requests without them)
+S3_REGION = os.environ.get("AWS_REGION", "us-east-1")
+
+# Maximum number of kept-alive HTTP connections to the object store
+STORAGE_POOL_SIZE = 8
+
+# Threads fetching objects ahead of extraction, and how many fetched or
+# in-flight objects may be buffered ahead of the consumer
+STORAGE_PREFETCH_WORKERS = 8
+STORAGE_PREFETCH_DEPTH = 16
+
+# Socket timeout (seconds) and attempts per request for object store calls
+STORAGE_TIMEOUT = 30.0
+STORAGE_RETRIES = 3
+
+# ==============================================================================
+# TRIAGE
+# ==============================================================================
+# Probe each PDF before full extraction and skip scanned/suspicious files
+# (`--triage`); off by default so every document is parsed
+TRIAGE_ENABLED = False
+
+# Number of leading pages inspected by the probe
+TRIAGE_PROBE_PAGES = 2
+
+# Documents with more pages than this are not treated as resumes
+TRIAGE_MAX_PAGES = 20
+
+# Also extract the probed pages' text and require an email, phone number or
+# section header (in any case) in it. Costs a second text extraction of those
+# pages and can skip unusual resumes, so it is off by default
+TRIAGE_REQUIRE_RESUME_MARKERS = False
+
+# With resume markers required: below this many text characters per probed
+# page a PDF counts as scanned (if it has images) or empty
+TRIAGE_MIN_CHARS_PER_PAGE = 50
+
+# ==============================================================================
+# WATCH MODE
+# ==============================================================================
+# Maximum seconds between directory checks in `run.py --watch`
+WATCH_POLL_INTERVAL = 1.0
+
+# Seconds a file's size and mtime must stay unchanged before it is parsed,
+# so files still being copied into the input directory are skipped
+WATCH_SETTLE_SECONDS = 2.0
+
+# Parse the files already in the input directory when watching starts (False:
+# only files that arrive or change afterwards)
+WATCH_INCLUDE_EXISTING = True
+
+# ==============================================================================
+# JOB QUEUE
+# ==============================================================================
+# Seconds a leased job stays owned by a worker without a heartbeat; a crashed
+# worker's jobs become available again after this long
+QUEUE_LEASE_SECONDS = 300
+
+# Attempts per job (including lease expiries) before it is marked failed
+QUEUE_MAX_ATTEMPTS = 3
+
+# Seconds an idle worker waits before retrying while other workers hold leases
+QUEUE_POLL_INTERVAL = 5.0
+
+# ==============================================================================
+# ASYNC API
+# ==============================================================================
+# Executor for aprocess_resume/aprocess_many: "process" or "thread".
+# PyMuPDF is not thread-safe, so "process" is the safe default.
+ASYNC_EXECUTOR = "process"
+
+# Executor pool size (None lets the executor pick based on CPU count)
+ASYNC_MAX_WORKERS = None
+
+# Maximum documents in flight per aprocess_many call
+ASYNC_CONCURRENCY = 8
+
+# ==============================================================================
+# WORKERS
+# ==============================================================================
+# Worker processes for run.py: a number, or "auto" to tune the number of
+# extraction and prefetch workers while the batch runs (`--workers`)
+WORKERS = 1
+
+# Upper bound for --workers auto, as a multiple of the CPUs available to the
+# process (cgroup quota and affinity aware); >1 helps I/O-bound inputs
+WORKERS_MAX_PER_CPU = 4
+
+# Upper bound on objects prefetched ahead of extraction in auto mode
+WORKERS_MAX_PREFETCH = 64
+
+# Seconds between tuning decisions, and the relative throughput change that
+# counts as better or worse (smaller changes are treated as noise)
+WORKERS_ADJUST_INTERVAL = 5.0
+WORKERS_TOLERANCE = 0.05
+
+# Fraction of the memory limit (cgroup limit or physical memory) that worker
+# processes together may use
+WORKERS_MEMORY_FRACTION = 0.8
+
+# Replace a worker process (--workers N|auto, or a --queue --worker) after
+# this many documents, or once its RSS stays above this many MB after a
+# document, so memory lost to fragmentation is returned (0 disables)
+WORKER_MAX_DOCUMENTS = 1000
+WORKER_MAX_RSS_MB = 1024
+
+# How worker processes start: "forkserver" forks them from a template
+# process that has imported and warmed up the parser and frozen its GC heap,
+# so they start in milliseconds and share its memory; "fork" uses the main
+# process as the template; "spawn" starts each one from scratch
+WORKER_START_METHOD = "forkserver"
+
+# ==============================================================================
+# STREAMING
+# ==============================================================================
+# Input of `run.py --stdin` when no format is given: "paths" (one file path
+# per line) or "bytes" (length-prefixed documents, see src/stream.py)
+STREAM_INPUT_FORMAT = "paths"
+
+# Largest document accepted in "bytes" input; a bigger frame header is
+# treated as corrupt input
+STREAM_MAX_FRAME_BYTES = 50 * 1024 * 1024
+
+# ==============================================================================
+# ANALYTICS
+# ==============================================================================
+# Rows read from a results CSV at a time by `run.py --analyze`
+ANALYTICS_CHUNK_SIZE = 50000
+
+# Number of skills, skill pairs and per-education skills listed in reports
+ANALYTICS_TOP_N = 20
+
+# Report file written to the output directory; it can be passed back to
+# --analyze to merge shards
+ANALYTICS_OUTPUT_FILE = "skill_analytics.json"
+
+# ==============================================================================
+# CANDIDATE SIMILARITY
+# ==============================================================================
+# Index file written to the output directory by `run.py --index-similar`
+SIMILARITY_INDEX_FILE = "similarity_index.npz"
+
+# Weight of the education dimension relative to one skill
+SIMILARITY_EDUCATION_WEIGHT = 0.5
+
+# Random-projection LSH: hyperplanes (code bits) per table and number of
+# tables. More bits make buckets smaller (faster, lower recall); more tables
+# raise recall at the cost of more lookups
+SIMILARITY_LSH_BITS = 16
+SIMILARITY_LSH_TABLES = 12
+
+# Seed of the random hyperplanes (stored in the index file)
+SIMILARITY_SEED = 0
+
+# Every added batch is a segment; above this many they are merged into one
+SIMILARITY_MAX_SEGMENTS = 16
+
+# Number of similar candidates returned by `run.py --similar`
+SIMILARITY_TOP_K = 10
+
+# ==============================================================================
+# RESULT CACHE
+# ==============================================================================
+# Reuse process_resume results for files with the same content (keyed by a
+# hash of the bytes and the parser configuration)
+RESULT_CACHE_ENABLED = False
+
+# Byte limits of the in-memory LRU and of the on-disk tier
+RESULT_CACHE_MEMORY_MB = 64
+RESULT_CACHE_DISK_MB = 1024
+
+# Directory of the on-disk tier; may be shared by several processes
+RESULT_CACHE_DIR = os.path.join(BASE_DIR, "data", "cache")
+
+# Bump when a parser change should invalidate cached results
+RESULT_CACHE_VERSION = 1
+
+# ==============================================================================
+# DELTA OUTPUT
+# ==============================================================================
+# Write a change file next to the results CSV with the records inserted,
+# updated or deleted since the previous run's output (`--delta`)
+DELTA_ENABLED = False
+
+# Inserted before the extension of the output file name:
+# parsed_resumes.csv -> parsed_resumes.delta.csv
+DELTA_FILE_SUFFIX = ".delta"
+
+# Rows of the previous output read at a time while building the hash table
+DELTA_CHUNK_SIZE = 50000
+
+# ==============================================================================
+# CAPACITY PLANNING
+# ==============================================================================
+# Documents processed by `run.py --plan` to measure per-stage costs
+PLAN_SAMPLE_SIZE = 200
+
+# Candidates drawn (uniformly) per sampled document; their size and page
+# count define the strata the sample is drawn from
+PLAN_CANDIDATE_FACTOR = 5
+
+# Strata: file size quantile bins x page count classes (upper bounds; the
+# last class is everything above the last bound)
+PLAN_SIZE_BINS = 4
+PLAN_PAGE_CLASSES = [1, 2, 5]
+
+# Worker counts the plan predicts wall time and memory for
+PLAN_WORKER_COUNTS = [1, 2, 4, 8, 16, 32, 64]
+
+# Random seed for candidate and sample selection (same input, same sample)
+PLAN_SEED = 0
+
+# Plan report written to the output directory
+PLAN_OUTPUT_FILE = "capacity_plan.json"
+
 # ==============================================================================
 # OUTPUT SETTINGS
 # ==============================================================================
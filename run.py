@@ -1,49 +1,116 @@
 """
 Resume Parser - Main Entry Point
 
-This script processes all resume PDFs in the data/raw_resumes directory
-and generates a structured CSV output with parsed information.
+This script processes all resumes (PDF, DOCX, TXT) in the data/raw_resumes
+directory and generates a structured CSV output with parsed information.
 
 Usage:
     python run.py                    # Run with default settings
     python run.py --debug           # Run with debug logging
     python run.py --input <dir>     # Specify input directory
+    python run.py --input <archive> # Read PDFs from a .zip/.tar(.gz) archive
+    python run.py --input s3://bucket/prefix  # Read PDFs from an object store
     python run.py --output <file>   # Specify output file
+    python run.py --profile <dir>   # Write CPU/memory profiles to <dir>
+    python run.py --watch           # Parse new resumes as they arrive
+    python run.py --async-logging   # Write logs from a background thread
+    python run.py --triage          # Skip scanned and non-resume PDFs
+    python run.py --queue <db> --enqueue  # Queue input resumes for workers
+    python run.py --queue <db> --worker   # Process queued resumes
+    python run.py --analyze <csv...>      # Skill frequency/co-occurrence report
+    python run.py --index-similar [csv...] # Add results to the similarity index
+    python run.py --similar <filepath>    # Candidates most similar to one result
+    python run.py --workers auto    # Tune worker processes while the batch runs
+    python run.py --delta           # Also write changes since the previous output
+    python run.py --plan [N]        # Predict wall time/CPU/memory from N samples
+    find . -name '*.pdf' | python run.py --stdin   # NDJSON results on stdout
 """
 
 import os
+
+# PyMuPDF prints its messages to stdout by default; keep stdout for results.
+# Set before any import that may load fitz
+if "PYMUPDF_MESSAGE" not in os.environ:
+    os.environ["PYMUPDF_MESSAGE"] = "fd:2"
+
 import sys
+import json
+import atexit
+import signal
 import argparse
 import logging
+import threading
+import time
 import pandas as pd
-from typing import List, Dict, Any
+from contextlib import nullcontext
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple, Union
 
-from config import INPUT_DIR, OUTPUT_DIR, OUTPUT_FILE, LOG_LEVEL, LOG_FORMAT
+from config import (
+    INPUT_DIR, OUTPUT_DIR, OUTPUT_FILE, LOG_LEVEL, LOG_FORMAT, LOG_FILE,
+    LOG_ASYNC, LOG_SAMPLE_RATE, TRIAGE_ENABLED, ANALYTICS_OUTPUT_FILE, ANALYTICS_TOP_N,
+    WORKERS, WORKERS_MAX_PREFETCH, STORAGE_PREFETCH_WORKERS, STORAGE_PREFETCH_DEPTH,
+    DELTA_ENABLED, DELTA_FILE_SUFFIX, PLAN_SAMPLE_SIZE, PLAN_OUTPUT_FILE, STREAM_INPUT_FORMAT,
+    SIMILARITY_INDEX_FILE, SIMILARITY_TOP_K, MUPDF_STORE_RSS_LIMIT_MB,
+)
+from src.logging_setup import configure_logging, log_document
 from src.pipeline import process_resume
+from src.extract_text import set_mupdf_store_limit
+from src.extractors import is_supported, file_type
+from src.profiling import RunProfiler, stage
+from src.triage import probe_pdf, SCANNED, SUSPICIOUS
+from src.archive import is_archive, iter_archive_members, count_archive_members, member_path
+from src.watch import watch_directory
+from src.jobqueue import JobQueue, run_worker, default_worker_id, DONE, SKIPPED, FAILED
+from src.analytics import aggregate_results
+from src.similarity import SimilarityIndex
+from src.storage import is_remote, open_storage, prefetch
+from src.memory import current_rss
+from src.workers import AdaptiveController, run_pool, recycle_reason
+from src.delta import compute_delta, delta_to_frame, delta_path
+from src.planner import plan_capacity, format_plan
+from src.stream import STREAM_FORMATS, PATHS, read_paths, read_frames, stream_record, open_result_stream, write_record
 
-# Configure logging
-logging.basicConfig(
-    level=LOG_LEVEL,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(os.path.join(os.path.dirname(__file__), "logs", "resume_parser.log")),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
+def worker_count(value: str) -> Union[int, str]:
+    """Parse a --workers value: a positive integer or "auto"."""
+    if value == "auto":
+        return value
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer or 'auto', got {value!r}")
+    return count
+
+
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
-        description="Resume Parser - Extract structured data from PDF resumes",
+        description="Resume Parser - Extract structured data from PDF, DOCX and TXT resumes",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python run.py                          # Process all PDFs in data/raw_resumes/
+  python run.py                          # Process all resumes in data/raw_resumes/
   python run.py --debug                  # Enable debug logging
   python run.py --input path/to/resumes  # Specify custom input directory
+  python run.py --input export.zip       # Stream PDFs out of an archive
+  python run.py --input s3://hr-inbox/resumes/  # Fetch PDFs from an object store
   python run.py --output results.csv     # Specify custom output file
+  python run.py --profile prof/ --profile-rate 0.1  # Profile 10% of files
+  python run.py --watch                  # Keep running, append new resumes
+  python run.py --async-logging --log-sample-rate 0.01  # Low-overhead logs
+  python run.py --queue /shared/jobs.sqlite --enqueue --input /shared/resumes
+  python run.py --queue /shared/jobs.sqlite --worker --output-dir /shared/out
+  python run.py --analyze /shared/out/*.csv  # Stream skill analytics over results
+  python run.py --index-similar out/batch_07.csv  # Add a new batch to the similarity index
+  python run.py --similar /data/raw_resumes/john.pdf --top 20  # Candidates like this one
+  python run.py --workers auto           # Tune worker processes, log settings to pin
+  python run.py --delta                  # Write parsed_resumes.delta.csv for downstream loads
+  python run.py --plan 300 --input s3://hr-archive/2019/  # Size a backfill before running it
+  find /srv/cv -name '*.pdf' | python run.py --stdin | jq -c 'select(.Skills | length > 2)'
         """
     )
     
@@ -56,7 +123,7 @@ Examples:
         "--input",
         type=str,
         default=INPUT_DIR,
-        help=f"Input directory with PDF resumes (default: {INPUT_DIR})"
+        help=f"Input directory, .zip/.tar(.gz) archive or s3://bucket/prefix with resumes (default: {INPUT_DIR})"
     )
     parser.add_argument(
         "--output",
@@ -70,97 +137,453 @@ Examples:
         default=OUTPUT_DIR,
         help=f"Output directory for CSV file (default: {OUTPUT_DIR})"
     )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        metavar="DIR",
+        default=None,
+        help="Write cProfile, collapsed-stack and tracemalloc profiles to DIR"
+    )
+    parser.add_argument(
+        "--profile-rate",
+        type=float,
+        default=1.0,
+        help="Fraction of files profiled in detail with --profile (default: 1.0)"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and append results for new or changed files in the input directory"
+    )
+    parser.add_argument(
+        "--async-logging",
+        action="store_true",
+        default=LOG_ASYNC,
+        help="Queue log records and write them from a background thread"
+    )
+    parser.add_argument(
+        "--log-sample-rate",
+        type=float,
+        default=LOG_SAMPLE_RATE,
+        help=f"Fraction of documents whose INFO/DEBUG logs are kept; warnings and errors are always kept (default: {LOG_SAMPLE_RATE})"
+    )
+    parser.add_argument(
+        "--triage",
+        dest="triage",
+        action="store_true",
+        default=TRIAGE_ENABLED,
+        help=f"Probe PDFs first and skip scanned and suspicious files (default: {TRIAGE_ENABLED})"
+    )
+    parser.add_argument(
+        "--no-triage",
+        dest="triage",
+        action="store_false",
+        help="Do not probe PDFs first; fully process scanned and suspicious files too"
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        metavar="DB",
+        default=None,
+        help="SQLite job queue file shared by workers (use with --enqueue or --worker)"
+    )
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Add the resumes in the input directory to the --queue and exit"
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Lease and process jobs from the --queue until it is drained"
+    )
+    parser.add_argument(
+        "--analyze",
+        nargs="+",
+        metavar="FILE",
+        default=None,
+        help=f"Aggregate skill statistics over results CSVs (or merge saved {ANALYTICS_OUTPUT_FILE} shards) and exit"
+    )
+    parser.add_argument(
+        "--index-similar",
+        nargs="*",
+        metavar="CSV",
+        default=None,
+        help=f"Add results CSVs (default: the output file) to {SIMILARITY_INDEX_FILE} in the output directory, creating it if needed, and exit"
+    )
+    parser.add_argument(
+        "--similar",
+        metavar="FILEPATH",
+        default=None,
+        help="List the indexed candidates most similar to this result (its FilePath) and exit"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=SIMILARITY_TOP_K,
+        metavar="K",
+        help=f"Number of candidates listed by --similar (default: {SIMILARITY_TOP_K})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=worker_count,
+        metavar="N|auto",
+        default=WORKERS,
+        help=f"Worker processes, or 'auto' to tune workers and prefetch depth while running (default: {WORKERS})"
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        default=DELTA_ENABLED,
+        help=f"Also write the records inserted, updated or deleted since the previous output (<output>{DELTA_FILE_SUFFIX}.csv)"
+    )
+    parser.add_argument(
+        "--plan",
+        type=int,
+        nargs="?",
+        const=PLAN_SAMPLE_SIZE,
+        default=None,
+        metavar="N",
+        help=f"Process a stratified sample of N documents (default: {PLAN_SAMPLE_SIZE}), predict wall time, CPU-hours and memory per worker count, write {PLAN_OUTPUT_FILE} and exit"
+    )
+    parser.add_argument(
+        "--stdin",
+        nargs="?",
+        const=STREAM_INPUT_FORMAT,
+        default=None,
+        choices=STREAM_FORMATS,
+        help=f"Read file paths (one per line) or length-prefixed documents ('bytes') from stdin and write one JSON object per document to stdout as it completes (default format: {STREAM_INPUT_FORMAT})"
+    )
     
     return parser.parse_args()
 
 
 def validate_input_directory(input_dir: str) -> bool:
     """
-    Validate that input directory exists and contains PDF files.
+    Validate that input directory (or archive) exists and contains resume files.
+    
+    Object store locations are not checked here; listing them happens once,
+    when processing starts.
     
     Args:
-        input_dir (str): Path to input directory.
+        input_dir (str): Path to input directory or archive, or s3:// URI.
         
     Returns:
         bool: True if valid, False otherwise.
     """
+    if is_remote(input_dir):
+        return True
+    
     if not os.path.exists(input_dir):
         logger.error(f"Input directory does not exist: {input_dir}")
         return False
     
+    if is_archive(input_dir):
+        count = count_archive_members(input_dir)
+        if count is not None:
+            logger.info(f"Found {count} resume file(s) in archive {input_dir}")
+        return True
+    
     if not os.path.isdir(input_dir):
         logger.error(f"Input path is not a directory: {input_dir}")
         return False
     
-    pdf_files = [f for f in os.listdir(input_dir) if f.endswith('.pdf')]
-    if not pdf_files:
-        logger.warning(f"No PDF files found in {input_dir}")
+    resume_files = list_resume_files(input_dir)
+    if not resume_files:
+        logger.warning(f"No resume files found in {input_dir}")
         return True  # Still valid, just no files to process
     
-    logger.info(f"Found {len(pdf_files)} PDF file(s) to process")
+    logger.info(f"Found {len(resume_files)} resume file(s) to process")
     return True
 
 
-def process_resumes(input_dir: str) -> List[Dict[str, Any]]:
+def list_resume_files(input_dir: str) -> List[str]:
     """
-    Process all PDFs in the input directory.
+    List the files of a directory that have a supported resume type.
     
     Args:
-        input_dir (str): Path to directory containing resume PDFs.
+        input_dir (str): Directory path.
+        
+    Returns:
+        List[str]: Sorted file names (.pdf, .docx, .txt as configured).
+    """
+    return sorted(
+        f for f in os.listdir(input_dir)
+        if is_supported(f) and os.path.isfile(os.path.join(input_dir, f))
+    )
+
+
+def iter_input_documents(
+    input_dir: str,
+    prefetch_workers: int = STORAGE_PREFETCH_WORKERS,
+    prefetch_depth: Union[int, Callable[[], int]] = STORAGE_PREFETCH_DEPTH,
+) -> Tuple[Optional[int], Iterator[Tuple[str, str, Optional[bytes]]]]:
+    """
+    List the documents of an input directory, archive or object store.
+    
+    Args:
+        input_dir (str): Path to a directory or a ZIP/TAR archive, or an
+            s3://bucket/prefix URI.
+        prefetch_workers (int): Fetch threads for object store input.
+        prefetch_depth (Union[int, Callable[[], int]]): Objects fetched
+            ahead for object store input, or a callable returning it.
+        
+    Returns:
+        Tuple[Optional[int], Iterator[Tuple[str, str, Optional[bytes]]]]:
+            Number of documents (None if unknown without reading a TAR
+            stream) and an iterator of (name, path, data). For archives
+            ``path`` is the member display path and ``data`` its contents;
+            for directories ``data`` is None. Object store documents are
+            prefetched concurrently; if one cannot be fetched its ``data``
+            is the fetch error.
+    """
+    if is_remote(input_dir):
+        storage = open_storage(input_dir)
+        keys = list(storage.list())
+        
+        def fetched():
+            with storage:
+                for key, data, error in prefetch(storage, keys, prefetch_workers, prefetch_depth):
+                    yield key, storage.display_path(key), data if error is None else error
+        
+        return len(keys), fetched()
+    
+    if is_archive(input_dir):
+        documents = (
+            (name, member_path(input_dir, name), data)
+            for name, data in iter_archive_members(input_dir)
+        )
+        return count_archive_members(input_dir), documents
+    
+    resume_files = list_resume_files(input_dir)
+    return len(resume_files), ((f, os.path.join(input_dir, f), None) for f in resume_files)
+
+
+def process_document(
+    filename: str,
+    pdf_path: str,
+    pdf_data: Any = None,
+    triage: bool = TRIAGE_ENABLED,
+) -> Tuple[str, Any]:
+    """
+    Triage and parse one document.
+    
+    Runs in the main process or in a worker process (``--workers``), so it
+    never raises: errors are logged and reported as an outcome.
+    
+    Args:
+        filename (str): Name used in logs and the summary.
+        pdf_path (str): File path or display path.
+        pdf_data (Any): File contents, None to read pdf_path, or the
+            exception raised while fetching the document.
+        triage (bool): Probe PDFs and skip scanned/suspicious ones.
+        
+    Returns:
+        Tuple[str, Any]: ("ok", parsed data), ("failed", None),
+            ("error", message) or (SCANNED/SUSPICIOUS, reason).
+    """
+    with log_document(filename):
+        try:
+            if isinstance(pdf_data, Exception):
+                raise pdf_data
+            
+            if triage and file_type(filename) == ".pdf":
+                with stage("triage"):
+                    probe = probe_pdf(pdf_path, data=pdf_data)
+                if probe["category"] in (SCANNED, SUSPICIOUS):
+                    logger.info("Skipping %s file %s: %s", probe["category"], filename, probe["reason"])
+                    return probe["category"], probe["reason"]
+            
+            data = process_resume(pdf_path, data=pdf_data)
+            if data:
+                logger.debug("✓ Successfully processed: %s", filename)
+                return "ok", data
+            logger.warning("✗ Failed to extract data from: %s", filename)
+            return "failed", None
+            
+        except Exception as e:
+            logger.error(f"✗ Error processing {filename}: {str(e)}", exc_info=True)
+            return "error", str(e)
+
+
+def iter_outcomes(
+    documents: Iterable[Tuple[str, str, Any]],
+    triage: bool = TRIAGE_ENABLED,
+    workers: Union[int, str] = WORKERS,
+    controller: Optional[AdaptiveController] = None,
+    profiler: Optional[RunProfiler] = None,
+    total: Optional[int] = None,
+) -> Iterator[Tuple[int, str, str, Tuple[str, Any]]]:
+    """
+    Run process_document over documents, in this process or on a worker pool.
+    
+    Documents are pulled from the iterator only as the main process or a
+    worker becomes free, so at most ``workers`` documents are in flight.
+    
+    Args:
+        documents (Iterable[Tuple[str, str, Any]]): (name, path, data) tuples.
+        triage (bool): Probe PDFs and skip scanned/suspicious ones.
+        workers (Union[int, str]): Worker processes (1: this process), or "auto".
+        controller (Optional[AdaptiveController]): Tunes workers for "auto".
+        profiler (Optional[RunProfiler]): Profile each document (one worker only).
+        total (Optional[int]): Number of documents, for progress logs.
+        
+    Yields:
+        Tuple[int, str, str, Tuple[str, Any]]: (input index, name, path,
+            process_document outcome) in completion order.
+    """
+    if workers == 1:
+        for index, (filename, pdf_path, pdf_data) in enumerate(documents):
+            with log_document(filename):
+                logger.info("[%d/%s] Processing: %s", index + 1, total or "?", filename)
+            with profiler.document(filename) if profiler else nullcontext():
+                outcome = process_document(filename, pdf_path, pdf_data, triage)
+            yield index, filename, pdf_path, outcome
+        return
+    
+    if workers == "auto" and controller is None:
+        controller = AdaptiveController()
+    names: Dict[int, Tuple[str, str]] = {}
+    
+    def items():
+        for index, (filename, pdf_path, pdf_data) in enumerate(documents):
+            names[index] = (filename, pdf_path)
+            yield filename, pdf_path, pdf_data, triage
+    
+    pool = run_pool(items(), process_document, 0 if controller else workers, controller)
+    for done, (index, outcome) in enumerate(pool, 1):
+        filename, pdf_path = names.pop(index)
+        if isinstance(outcome, Exception):
+            # The worker process died (e.g. killed for memory)
+            logger.error(f"✗ Error processing {filename}: {outcome}")
+            outcome = ("error", str(outcome))
+        logger.info("[%d/%s] Processed: %s", done, total or "?", filename)
+        yield index, filename, pdf_path, outcome
+
+
+def process_resumes(
+    input_dir: str,
+    profiler: Optional[RunProfiler] = None,
+    triage: bool = TRIAGE_ENABLED,
+    workers: Union[int, str] = WORKERS,
+) -> List[Dict[str, Any]]:
+    """
+    Process all resumes in the input directory or archive.
+    
+    With triage enabled every PDF is probed first (DOCX and TXT files are
+    not); scanned and suspicious files are listed separately in the summary
+    and skip full processing.
+    
+    With more than one worker, documents are processed by a pool of worker
+    processes; with ``workers="auto"`` the number of workers and the object
+    store prefetch depth are tuned while the batch runs, and the settings
+    reached are logged so they can be pinned with ``--workers N``. Results
+    are returned in input order either way. Profiling always runs in the
+    main process.
+    
+    Args:
+        input_dir (str): Directory, ZIP/TAR archive or s3:// URI containing resumes.
+        profiler (Optional[RunProfiler]): Active profiler; each file is
+            profiled as one document when given.
+        triage (bool): Probe files and skip scanned/suspicious ones.
+        workers (Union[int, str]): Worker processes, or "auto".
         
     Returns:
         List[Dict[str, Any]]: List of parsed resume data dictionaries.
     """
     results = []
     failed_files = []
+    triaged_files: Dict[str, List[str]] = {SCANNED: [], SUSPICIOUS: []}
     
-    if not os.path.exists(input_dir):
+    if not is_remote(input_dir) and not os.path.exists(input_dir):
         logger.error(f"Input directory not found: {input_dir}")
         return results
     
-    pdf_files = [f for f in os.listdir(input_dir) if f.endswith('.pdf')]
-    total_files = len(pdf_files)
+    if profiler and workers != 1:
+        logger.warning("Profiling runs in the main process; ignoring --workers %s", workers)
+        workers = 1
+    
+    controller = AdaptiveController() if workers == "auto" else None
+    if controller:
+        total_files, documents = iter_input_documents(input_dir, WORKERS_MAX_PREFETCH, controller.prefetch.get)
+    else:
+        total_files, documents = iter_input_documents(input_dir)
     
     if total_files == 0:
-        logger.warning(f"No PDF files found in {input_dir}")
+        logger.warning(f"No resume files found in {input_dir}")
         return results
     
-    logger.info(f"Starting batch processing of {total_files} resume(s)...")
+    logger.info(f"Starting batch processing of {total_files if total_files is not None else 'all'} resume(s)...")
     
-    for idx, filename in enumerate(pdf_files, 1):
-        try:
-            pdf_path = os.path.join(input_dir, filename)
-            logger.info(f"[{idx}/{total_files}] Processing: {filename}")
-            
-            data = process_resume(pdf_path)
-            
-            if data:
-                results.append(data)
-                logger.debug(f"✓ Successfully processed: {filename}")
-            else:
-                failed_files.append(filename)
-                logger.warning(f"✗ Failed to extract data from: {filename}")
-                
-        except Exception as e:
+    started = time.perf_counter()
+    outcomes = sorted(
+        (index, filename, *outcome)
+        for index, filename, _, outcome in iter_outcomes(
+            documents, triage, workers, controller, profiler, total_files
+        )
+    )
+    
+    for _, filename, status, value in outcomes:
+        if status == "ok":
+            results.append(value)
+        elif status in triaged_files:
+            triaged_files[status].append(filename)
+        else:
             failed_files.append(filename)
-            logger.error(f"✗ Error processing {filename}: {str(e)}", exc_info=True)
+    elapsed = time.perf_counter() - started
     
     # Log summary
     logger.info("=" * 60)
     logger.info(f"Processing Summary:")
-    logger.info(f"  Total files: {total_files}")
+    logger.info(f"  Total files: {len(outcomes)}")
     logger.info(f"  Successfully processed: {len(results)}")
     logger.info(f"  Failed: {len(failed_files)}")
+    if triage:
+        logger.info(f"  Scanned (skipped): {len(triaged_files[SCANNED])}")
+        logger.info(f"  Suspicious (skipped): {len(triaged_files[SUSPICIOUS])}")
+    if elapsed > 0:
+        logger.info(f"  Throughput: {len(outcomes) / elapsed:.1f} docs/s")
+    if controller:
+        settings = controller.settings()
+        logger.info(
+            f"  Concurrency settings: workers={settings['workers']} prefetch={settings['prefetch']} "
+            f"(peak worker RSS {settings['peak_rss_mb']} MB); pin with --workers {settings['workers']}"
+        )
     
     if failed_files:
         logger.warning(f"Failed files: {', '.join(failed_files)}")
+    if triaged_files[SCANNED]:
+        logger.warning(f"Scanned files: {', '.join(triaged_files[SCANNED])}")
+    if triaged_files[SUSPICIOUS]:
+        logger.warning(f"Suspicious files: {', '.join(triaged_files[SUSPICIOUS])}")
     
     logger.info("=" * 60)
     
     return results
 
 
-def save_results(results: List[Dict[str, Any]], output_dir: str, output_file: str) -> bool:
+def results_to_frame(results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Convert parsed results to a DataFrame ready for CSV output.
+    
+    Args:
+        results (List[Dict]): List of parsed resume data.
+        
+    Returns:
+        pd.DataFrame: One row per result, with Skills joined into a string.
+    """
+    df = pd.DataFrame(results)
+    
+    # Ensure Skills column is string type (for CSV compatibility)
+    if 'Skills' in df.columns:
+        df['Skills'] = df['Skills'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
+    
+    return df
+
+
+def save_results(
+    results: List[Dict[str, Any]], output_dir: str, output_file: str, keep_empty: bool = False
+) -> bool:
     """
     Save parsed results to CSV file.
     
@@ -168,26 +591,30 @@ def save_results(results: List[Dict[str, Any]], output_dir: str, output_file: st
         results (List[Dict]): List of parsed resume data.
         output_dir (str): Output directory path.
         output_file (str): Output filename.
+        keep_empty (bool): Without results, replace a previous output with
+            an empty one (same columns) instead of leaving it in place, so
+            the next delta does not report the same deletions again.
         
     Returns:
         bool: True if save successful, False otherwise.
     """
     try:
+        output_path = os.path.join(output_dir, output_file)
+        
         if not results:
-            logger.warning("No results to save")
-            return False
+            if not keep_empty or not os.path.exists(output_path):
+                logger.warning("No results to save")
+                return keep_empty
+            columns = pd.read_csv(output_path, nrows=0).columns
+            pd.DataFrame(columns=columns).to_csv(output_path, index=False)
+            logger.info(f"✓ No results: emptied {output_path}")
+            return True
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
         # Convert results to DataFrame
-        df = pd.DataFrame(results)
-        
-        # Ensure Skills column is string type (for CSV compatibility)
-        if 'Skills' in df.columns:
-            df['Skills'] = df['Skills'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
-        
-        output_path = os.path.join(output_dir, output_file)
+        df = results_to_frame(results)
         
         # Save to CSV
         df.to_csv(output_path, index=False)
@@ -203,12 +630,356 @@ def save_results(results: List[Dict[str, Any]], output_dir: str, output_file: st
         return False
 
 
+def save_delta(results: List[Dict[str, Any]], output_dir: str, output_file: str) -> bool:
+    """
+    Write the changes since the previous output to a delta CSV.
+    
+    Must run before save_results overwrites the previous output. Without a
+    previous output every record is written as an insert.
+    
+    Args:
+        results (List[Dict]): List of parsed resume data.
+        output_dir (str): Output directory path.
+        output_file (str): Output filename of the full results.
+        
+    Returns:
+        bool: True if the delta was written, False otherwise.
+    """
+    try:
+        output_path = os.path.join(output_dir, output_file)
+        delta = compute_delta(results, output_path)
+        
+        os.makedirs(output_dir, exist_ok=True)
+        path = delta_path(output_path, DELTA_FILE_SUFFIX)
+        delta_to_frame(delta).to_csv(path, index=False)
+        
+        logger.info(f"✓ Delta saved to: {path}")
+        logger.info(
+            f"  Inserted: {len(delta.inserted)}, updated: {len(delta.updated)}, "
+            f"deleted: {len(delta.deleted)}, unchanged: {delta.unchanged}"
+        )
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error saving delta: {str(e)}", exc_info=True)
+        return False
+
+
+def append_results(results: List[Dict[str, Any]], output_dir: str, output_file: str) -> bool:
+    """
+    Append parsed results to a CSV file, writing the header for a new file.
+    
+    Args:
+        results (List[Dict]): List of parsed resume data.
+        output_dir (str): Output directory path.
+        output_file (str): Output filename.
+        
+    Returns:
+        bool: True if append successful, False otherwise.
+    """
+    try:
+        if not results:
+            return True
+        
+        os.makedirs(output_dir, exist_ok=True)
+        output_path = os.path.join(output_dir, output_file)
+        write_header = not os.path.exists(output_path) or os.path.getsize(output_path) == 0
+        
+        results_to_frame(results).to_csv(output_path, mode="a", header=write_header, index=False)
+        logger.info(f"✓ Appended {len(results)} record(s) to: {output_path}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error appending results: {str(e)}", exc_info=True)
+        return False
+
+
+def install_stop_handlers() -> threading.Event:
+    """
+    Install SIGTERM/SIGINT handlers that request a clean stop.
+    
+    Returns:
+        threading.Event: Set when a stop signal is received.
+    """
+    stop_event = threading.Event()
+    
+    def request_stop(signum, frame):
+        logger.info(f"Received signal {signum}, finishing current work and stopping")
+        stop_event.set()
+    
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    return stop_event
+
+
+def run_queue_worker(queue: JobQueue, output_dir: str, output_file: str, triage: bool = TRIAGE_ENABLED) -> bool:
+    """
+    Process jobs from a shared queue until it is drained.
+    
+    Each worker appends to its own CSV (``<name>.<worker id>.csv``) so
+    workers on different machines never write to the same file.
+    
+    Args:
+        queue (JobQueue): Queue to lease jobs from.
+        output_dir (str): Output directory path.
+        output_file (str): Output filename; the worker id is inserted before the extension.
+        triage (bool): Probe files and skip scanned/suspicious ones.
+        
+    Returns:
+        bool: True if the worker stopped to be recycled (see
+            WORKER_MAX_DOCUMENTS and WORKER_MAX_RSS_MB) rather than because
+            the queue is drained or a stop signal arrived.
+    """
+    worker_id = default_worker_id()
+    stem, ext = os.path.splitext(output_file)
+    worker_file = f"{stem}.{worker_id}{ext or '.csv'}"
+    stop_event = install_stop_handlers()
+    set_mupdf_store_limit(MUPDF_STORE_RSS_LIMIT_MB)
+    documents = 0
+    recycle = False
+    
+    def handle(pdf_path: str):
+        nonlocal documents, recycle
+        filename = os.path.basename(pdf_path)
+        try:
+            with log_document(filename):
+                if triage and file_type(pdf_path) == ".pdf":
+                    probe = probe_pdf(pdf_path)
+                    if probe["category"] in (SCANNED, SUSPICIOUS):
+                        return SKIPPED, f"{probe['category']}: {probe['reason']}"
+                data = process_resume(pdf_path)
+            if not data:
+                return FAILED, "No data extracted"
+            if not append_results([data], output_dir, worker_file):
+                return FAILED, "Could not write result"
+            return DONE, None
+        finally:
+            documents += 1
+            reason = recycle_reason(documents, current_rss())
+            if reason and not stop_event.is_set():
+                logger.info(f"Recycling worker process: {reason}")
+                recycle = True
+                stop_event.set()
+    
+    handled = run_worker(queue, handle, stop_event, worker_id=worker_id)
+    logger.info(f"Worker results written to: {os.path.join(output_dir, worker_file)}")
+    logger.info(f"Queue status: {queue.stats()} (this worker: {handled})")
+    return recycle
+
+
+def run_watch(input_dir: str, output_dir: str, output_file: str) -> None:
+    """
+    Parse new or changed resumes as they land in the input directory.
+    
+    Runs until SIGTERM or SIGINT. The batch in progress when the signal
+    arrives is finished and written before returning.
+    
+    Args:
+        input_dir (str): Directory to watch.
+        output_dir (str): Output directory path.
+        output_file (str): Output filename results are appended to.
+    """
+    stop_event = install_stop_handlers()
+    
+    def handle(paths: List[str]) -> None:
+        results = []
+        for pdf_path in paths:
+            filename = os.path.basename(pdf_path)
+            with log_document(filename):
+                data = process_resume(pdf_path)
+            if data:
+                results.append(data)
+            else:
+                logger.warning("✗ Failed to extract data from: %s", filename)
+        append_results(results, output_dir, output_file)
+    
+    logger.info(f"Watching {input_dir} for new resumes (Ctrl+C or SIGTERM to stop)")
+    watch_directory(input_dir, handle, stop_event)
+
+
+def run_analytics(paths: List[str], output_dir: str) -> None:
+    """
+    Aggregate skill statistics over results files and write a JSON report.
+    
+    Args:
+        paths (List[str]): Results CSVs and/or previously written reports.
+        output_dir (str): Directory for the report file.
+    """
+    aggregate = aggregate_results(paths)
+    
+    os.makedirs(output_dir, exist_ok=True)
+    report_path = os.path.join(output_dir, ANALYTICS_OUTPUT_FILE)
+    aggregate.save(report_path)
+    
+    logger.info("=" * 60)
+    logger.info(f"Skill analytics over {aggregate.documents} resume(s)")
+    for skill, count in aggregate.top_skills(ANALYTICS_TOP_N):
+        logger.info(f"  {skill}: {count}")
+    logger.info("Top skill pairs:")
+    for first, second, count in aggregate.top_pairs(ANALYTICS_TOP_N):
+        logger.info(f"  {first} + {second}: {count}")
+    logger.info(f"Report written to: {report_path}")
+    logger.info("=" * 60)
+
+
+def run_index_similar(paths: List[str], output_dir: str) -> bool:
+    """
+    Add results CSVs to the similarity index in the output directory.
+    
+    Args:
+        paths (List[str]): Results CSVs, e.g. each new batch's output.
+        output_dir (str): Directory holding the index file.
+        
+    Returns:
+        bool: True if the index was written.
+    """
+    index_path = os.path.join(output_dir, SIMILARITY_INDEX_FILE)
+    try:
+        index = SimilarityIndex.load(index_path) if os.path.exists(index_path) else SimilarityIndex()
+        for path in paths:
+            added = index.add_csv(path)
+            logger.info(f"Indexed {added} result(s) from {path}")
+        os.makedirs(output_dir, exist_ok=True)
+        index.save(index_path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Error updating similarity index {index_path}: {e}")
+        return False
+    
+    logger.info(f"Similarity index: {len(index)} candidate(s) in {index_path}")
+    return True
+
+
+def run_similar(filepath: str, output_dir: str, k: int = SIMILARITY_TOP_K) -> bool:
+    """
+    Log the indexed candidates most similar to one result.
+    
+    Args:
+        filepath (str): FilePath of an indexed result (relative paths are
+            resolved as in the results CSV).
+        output_dir (str): Directory holding the index file.
+        k (int): Number of candidates.
+        
+    Returns:
+        bool: True if the result was found in the index.
+    """
+    index_path = os.path.join(output_dir, SIMILARITY_INDEX_FILE)
+    if not os.path.exists(index_path):
+        logger.error(f"No similarity index at {index_path}; build one with --index-similar")
+        return False
+    index = SimilarityIndex.load(index_path)
+    
+    key = filepath if filepath in index or "://" in filepath else os.path.abspath(filepath)
+    if key not in index:
+        logger.error(f"{filepath} is not in the similarity index")
+        return False
+    
+    start = time.perf_counter()
+    matches = index.similar_to(key, k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    logger.info("=" * 60)
+    logger.info(f"Candidates most similar to {key} ({elapsed_ms:.1f} ms over {len(index)}):")
+    for match, score in matches:
+        logger.info(f"  {score:.3f}  {match}")
+    logger.info("=" * 60)
+    return True
+
+
+def run_stream(input_format: str, workers: Union[int, str] = WORKERS, triage: bool = TRIAGE_ENABLED) -> bool:
+    """
+    Filter mode: documents from stdin, NDJSON results to stdout.
+    
+    Each result is written and flushed as soon as its document is done
+    (in completion order with several workers). At most ``workers``
+    documents are read ahead of the output, so memory stays bounded on
+    endless input. Logs go to stderr and the log file.
+    
+    Args:
+        input_format (str): "paths" or "bytes" (see src/stream.py).
+        workers (Union[int, str]): Worker processes, or "auto".
+        triage (bool): Probe PDFs and skip scanned/suspicious ones.
+        
+    Returns:
+        bool: True if stdin was read to the end, False on malformed input.
+    """
+    out = open_result_stream()
+    if input_format == PATHS:
+        documents = read_paths(sys.stdin)
+    else:
+        documents = read_frames(sys.stdin.buffer)
+    
+    written = 0
+    try:
+        for _, filename, pdf_path, (status, value) in iter_outcomes(documents, triage, workers):
+            write_record(out, stream_record(filename, pdf_path, status, value))
+            written += 1
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`): stop quietly
+        logger.info(f"Output closed after {written} record(s)")
+        return True
+    except ValueError as e:
+        logger.error(f"Invalid input on stdin: {str(e)}")
+        return False
+    
+    logger.info(f"Wrote {written} record(s) to stdout")
+    return True
+
+
+def run_plan(input_dir: str, output_dir: str, sample_size: int, triage: bool = TRIAGE_ENABLED) -> bool:
+    """
+    Predict the cost of processing the input and write a JSON plan.
+    
+    Args:
+        input_dir (str): Input directory or s3:// URI.
+        output_dir (str): Directory for the plan file.
+        sample_size (int): Documents to measure.
+        triage (bool): Probe files first, as the batch run would.
+        
+    Returns:
+        bool: True if the plan was written, False otherwise.
+    """
+    if is_archive(input_dir):
+        logger.error(f"--plan needs an input directory or object store location: {input_dir}")
+        return False
+    
+    try:
+        with open_storage(input_dir) as storage:
+            plan = plan_capacity(storage, sample_size=sample_size, triage=triage)
+    except Exception as e:
+        logger.error(f"Error planning capacity: {str(e)}", exc_info=True)
+        return False
+    
+    os.makedirs(output_dir, exist_ok=True)
+    plan_path = os.path.join(output_dir, PLAN_OUTPUT_FILE)
+    with open(plan_path, "w", encoding="utf-8") as fh:
+        json.dump(plan, fh, indent=2)
+    
+    logger.info("=" * 60)
+    logger.info("Capacity plan:")
+    for line in format_plan(plan):
+        logger.info(f"  {line}")
+    logger.info(f"Plan written to: {plan_path}")
+    logger.info("=" * 60)
+    return True
+
+
 def main():
     """Main entry point."""
     try:
         # Parse arguments
         args = parse_arguments()
         
+        # Configure logging
+        listener = configure_logging(
+            LOG_LEVEL,
+            LOG_FORMAT,
+            log_file=LOG_FILE,
+            async_logging=args.async_logging,
+            sample_rate=args.log_sample_rate,
+        )
+        if listener is not None:
+            atexit.register(listener.stop)
+        
         # Set logging level
         if args.debug:
             logging.getLogger().setLevel(logging.DEBUG)
@@ -227,17 +998,73 @@ def main():
         logger.info(f"Output directory: {output_dir}")
         logger.info(f"Output file: {output_file}")
         
+        # Filter mode: stdin to stdout, then exit
+        if args.stdin:
+            sys.exit(0 if run_stream(args.stdin, workers=args.workers, triage=args.triage) else 1)
+        
+        # Skill analytics over existing results, then exit
+        if args.analyze:
+            run_analytics(args.analyze, output_dir)
+            sys.exit(0)
+        
+        # Similarity index: add batches or query, then exit
+        if args.index_similar is not None:
+            paths = args.index_similar or [os.path.join(output_dir, output_file)]
+            sys.exit(0 if run_index_similar(paths, output_dir) else 1)
+        if args.similar:
+            sys.exit(0 if run_similar(args.similar, output_dir, args.top) else 1)
+        
+        # Shared job queue: enqueue or work, then exit
+        if args.queue:
+            queue = JobQueue(args.queue)
+            if args.enqueue:
+                if not os.path.isdir(args.input):
+                    logger.error(f"--enqueue needs an input directory: {args.input}")
+                    sys.exit(1)
+                resume_files = list_resume_files(args.input)
+                queue.enqueue(os.path.abspath(os.path.join(args.input, f)) for f in resume_files)
+                logger.info(f"Queue status: {queue.stats()}")
+            elif args.worker:
+                if run_queue_worker(queue, output_dir, output_file, triage=args.triage):
+                    # Start over as a fresh process with the same arguments
+                    if listener is not None:
+                        listener.stop()
+                    logging.shutdown()
+                    os.execv(sys.executable, [sys.executable] + sys.argv)
+            else:
+                logger.error("--queue requires --enqueue or --worker")
+                sys.exit(1)
+            sys.exit(0)
+        
         # Validate input
         if not validate_input_directory(args.input):
             logger.error("Input validation failed")
             sys.exit(1)
         
+        if args.plan is not None:
+            sys.exit(0 if run_plan(args.input, output_dir, args.plan, triage=args.triage) else 1)
+        
+        if args.watch:
+            if not os.path.isdir(args.input):
+                logger.error(f"--watch needs an input directory: {args.input}")
+                sys.exit(1)
+            run_watch(args.input, output_dir, output_file)
+            sys.exit(0)
+        
         # Process resumes
-        results = process_resumes(args.input)
+        if args.profile:
+            with RunProfiler(args.profile, sample_rate=args.profile_rate) as profiler:
+                results = process_resumes(args.input, profiler=profiler, triage=args.triage, workers=args.workers)
+        else:
+            results = process_resumes(args.input, triage=args.triage, workers=args.workers)
         
-        # Save results
-        if results:
-            if save_results(results, output_dir, output_file):
+        # Save results (with --delta also when nothing was parsed, so
+        # removed or failing inputs are reported as deletions)
+        if args.delta and not save_delta(results, output_dir, output_file):
+            logger.error("✗ Failed to save delta")
+            sys.exit(1)
+        if results or args.delta:
+            if save_results(results, output_dir, output_file, keep_empty=args.delta):
                 logger.info("✓ Batch processing completed successfully")
                 sys.exit(0)
             else:
@@ -15,5 +15,15 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
 from src.pipeline import process_resume
+from src.batch import parse_resumes
+from src.aio import aprocess_resume, aprocess_many
+from src.profiles import ParserProfile, get_profile
 
-__all__ = ["process_resume"]
+__all__ = [
+    "process_resume",
+    "parse_resumes",
+    "aprocess_resume",
+    "aprocess_many",
+    "ParserProfile",
+    "get_profile",
+]
@@ -0,0 +1,175 @@
+"""
+Asyncio Processing Module
+
+This module exposes the resume pipeline to asyncio applications (e.g. a
+FastAPI service) without blocking the event loop. The CPU-bound work of
+process_resume runs on an executor; callers can bound the number of
+documents in flight and cancel work they no longer need.
+
+A process pool is the default executor: PyMuPDF holds the GIL while
+decoding and is not safe to call from several threads at once. On a thread
+pool, PyMuPDF calls are serialized by MUPDF_LOCK (src.extract_text), so a
+thread pool is safe but only helps when documents are small or I/O
+dominates.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Optional, Tuple, Union
+
+from config import ASYNC_EXECUTOR, ASYNC_MAX_WORKERS, ASYNC_CONCURRENCY
+from src.bootstrap import init_worker, worker_context
+from src.logging_setup import worker_logging_settings
+from src.pipeline import process_resume
+
+logger = logging.getLogger(__name__)
+
+_default_executor: Optional[Executor] = None
+_default_executor_lock = threading.Lock()
+
+
+def create_executor(kind: str = ASYNC_EXECUTOR, max_workers: Optional[int] = ASYNC_MAX_WORKERS) -> Executor:
+    """
+    Create an executor for the CPU-bound pipeline stages.
+
+    Worker processes are forked from the preloaded template (see
+    src.bootstrap).
+
+    Args:
+        kind (str): "process" or "thread" (PyMuPDF calls are serialized).
+        max_workers (Optional[int]): Pool size (None for the library default).
+
+    Returns:
+        Executor: A new executor; the caller is responsible for shutting it down.
+
+    Raises:
+        ValueError: If kind is not "process" or "thread".
+    """
+    if kind == "process":
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=worker_context(),
+            initializer=init_worker,
+            initargs=(worker_logging_settings(),),
+        )
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="resume")
+    raise ValueError(f"Unknown executor kind: {kind!r} (expected 'process' or 'thread')")
+
+
+def get_default_executor() -> Executor:
+    """Return the shared executor configured by ASYNC_EXECUTOR, creating it on first use."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = create_executor()
+        return _default_executor
+
+
+def shutdown_default_executor() -> None:
+    """Shut down the shared executor (e.g. on application shutdown)."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is not None:
+            _default_executor.shutdown(cancel_futures=True)
+            _default_executor = None
+
+
+async def aprocess_resume(pdf_path: str, executor: Optional[Executor] = None) -> Optional[Dict[str, Any]]:
+    """
+    Process a single resume without blocking the event loop.
+
+    Args:
+        pdf_path (str): Full path to the resume PDF file.
+        executor (Optional[Executor]): Executor to run on (default: shared
+            executor from get_default_executor).
+
+    Returns:
+        Optional[Dict[str, Any]]: Same result as process_resume.
+
+    Example:
+        >>> result = await aprocess_resume("john_resume.pdf")
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or get_default_executor(), process_resume, pdf_path)
+
+
+async def _aiter_paths(paths: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[str]:
+    """Iterate over a sync or async iterable of paths."""
+    if hasattr(paths, "__aiter__"):
+        async for path in paths:
+            yield path
+    else:
+        for path in paths:
+            yield path
+
+
+async def aprocess_many(
+    paths: Union[Iterable[str], AsyncIterable[str]],
+    executor: Optional[Executor] = None,
+    concurrency: int = ASYNC_CONCURRENCY,
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Process many resumes concurrently, yielding results as they complete.
+
+    At most ``concurrency`` documents are in flight; new paths are pulled
+    from ``paths`` only as earlier ones finish. If the consumer stops
+    iterating or the surrounding task is cancelled, queued work is
+    cancelled (documents already running on the executor finish in the
+    background and their results are discarded).
+
+    Args:
+        paths (Union[Iterable[str], AsyncIterable[str]]): Resume PDF paths.
+        executor (Optional[Executor]): Executor to run on (default: shared executor).
+        concurrency (int): Maximum number of documents in flight.
+
+    Yields:
+        Tuple[str, Optional[Dict[str, Any]]]: (path, process_resume result),
+            in completion order.
+
+    Raises:
+        ValueError: If concurrency is not positive.
+
+    Example:
+        >>> async for path, result in aprocess_many(paths, concurrency=8):
+        ...     await store(path, result)
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+    executor = executor or get_default_executor()
+    loop = asyncio.get_running_loop()
+
+    async def run(path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        return path, await loop.run_in_executor(executor, process_resume, path)
+
+    source = _aiter_paths(paths).__aiter__()
+    pending = set()
+    exhausted = False
+
+    async def refill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(pending) < concurrency:
+            try:
+                path = await source.__anext__()
+            except StopAsyncIteration:
+                exhausted = True
+                return
+            pending.add(asyncio.ensure_future(run(path)))
+
+    try:
+        await refill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                yield task.result()
+            await refill()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.debug("Cancelled %d in-flight document(s)", len(pending))
@@ -0,0 +1,307 @@
+"""
+Skill Analytics Module
+
+This module aggregates parsed results into skill statistics without loading
+a whole results file into memory. Results CSVs are read in chunks and each
+chunk is folded into a SkillAggregate holding:
+- skill counts
+- a skill x skill co-occurrence matrix (NumPy) over the profile vocabulary
+- education x skill counts
+
+Aggregates over the same vocabulary can be merged, so shards (e.g. the
+per-worker CSVs of a queue run) can be aggregated separately and combined.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import ANALYTICS_CHUNK_SIZE, ANALYTICS_TOP_N, CSV_ENCODING
+from src.profiles import ParserProfile, DEFAULT_PROFILE
+
+logger = logging.getLogger(__name__)
+
+# Education row for results whose education is missing or not in the vocabulary
+UNKNOWN_EDUCATION = "(unknown)"
+
+
+def split_skills(value: Any) -> List[str]:
+    """
+    Turn a Skills value into a list.
+
+    Args:
+        value (Any): A list of skills (parser output) or a comma-joined
+            string (results CSV cell); anything else counts as no skills.
+
+    Returns:
+        List[str]: Skill names.
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str) and value:
+        return [s.strip() for s in value.split(",") if s.strip()]
+    return []
+
+
+class SkillAggregate:
+    """
+    Mergeable skill statistics over a fixed vocabulary.
+
+    Args:
+        skills (Optional[Sequence[str]]): Skill vocabulary (default: the
+            default parser profile).
+        education (Optional[Sequence[str]]): Education vocabulary (default:
+            the default parser profile).
+
+    Example:
+        >>> agg = SkillAggregate()
+        >>> for chunk in iter_result_chunks("parsed_resumes.csv"):
+        ...     agg.add_frame(chunk)
+        >>> agg.top_pairs(5)
+    """
+
+    def __init__(self, skills: Optional[Sequence[str]] = None, education: Optional[Sequence[str]] = None):
+        self.skills: Tuple[str, ...] = tuple(DEFAULT_PROFILE.skills if skills is None else skills)
+        self.education: Tuple[str, ...] = tuple(DEFAULT_PROFILE.education if education is None else education)
+        self._skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self._education_index = {keyword: i for i, keyword in enumerate(self.education)}
+
+        n_skills = len(self.skills)
+        n_education = len(self.education) + 1  # last row: UNKNOWN_EDUCATION
+        self.documents = 0
+        self.unknown_skills = 0
+        self.skill_counts = np.zeros(n_skills, dtype=np.int64)
+        self.cooccurrence = np.zeros((n_skills, n_skills), dtype=np.int64)
+        self.education_counts = np.zeros(n_education, dtype=np.int64)
+        self.education_skill = np.zeros((n_education, n_skills), dtype=np.int64)
+
+    @classmethod
+    def for_profile(cls, profile: ParserProfile) -> "SkillAggregate":
+        """Create an empty aggregate over a parser profile's vocabularies."""
+        return cls(profile.skills, profile.education)
+
+    @property
+    def education_labels(self) -> List[str]:
+        """Row labels of education_counts and education_skill."""
+        return list(self.education) + [UNKNOWN_EDUCATION]
+
+    def add_frame(self, df: pd.DataFrame) -> None:
+        """
+        Fold a chunk of results into the aggregate.
+
+        Args:
+            df (pd.DataFrame): Results with Skills (list or comma-joined
+                string) and Education columns.
+        """
+        n_rows = len(df)
+        if n_rows == 0:
+            return
+
+        # Document x skill indicator matrix
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, value in enumerate(df["Skills"]):
+            for skill in split_skills(value):
+                col = self._skill_index.get(skill)
+                if col is None:
+                    self.unknown_skills += 1
+                else:
+                    rows.append(row)
+                    cols.append(col)
+        hits = np.zeros((n_rows, len(self.skills)), dtype=np.float64)
+        hits[rows, cols] = 1.0
+
+        # Document x education one-hot matrix
+        unknown_row = len(self.education)
+        edu_rows = np.fromiter(
+            (self._education_index.get(value, unknown_row) for value in df["Education"]),
+            dtype=np.intp,
+            count=n_rows,
+        )
+        edu = np.zeros((n_rows, unknown_row + 1), dtype=np.float64)
+        edu[np.arange(n_rows), edu_rows] = 1.0
+
+        # Float matmuls run on BLAS and are exact for counts below 2**53
+        self.documents += n_rows
+        self.skill_counts += hits.sum(axis=0).astype(np.int64)
+        self.cooccurrence += np.rint(hits.T @ hits).astype(np.int64)
+        self.education_counts += np.bincount(edu_rows, minlength=unknown_row + 1)
+        self.education_skill += np.rint(edu.T @ hits).astype(np.int64)
+
+    def add(self, skills: Iterable[str], education: Optional[str] = None) -> None:
+        """Fold a single result into the aggregate."""
+        self.add_frame(pd.DataFrame({"Skills": [list(skills)], "Education": [education]}))
+
+    def merge(self, other: "SkillAggregate") -> "SkillAggregate":
+        """
+        Add another aggregate's counts into this one.
+
+        Args:
+            other (SkillAggregate): Aggregate over the same vocabularies.
+
+        Returns:
+            SkillAggregate: self, for chaining.
+
+        Raises:
+            ValueError: If the vocabularies differ.
+        """
+        if other.skills != self.skills or other.education != self.education:
+            raise ValueError("Cannot merge aggregates built over different vocabularies")
+        self.documents += other.documents
+        self.unknown_skills += other.unknown_skills
+        self.skill_counts += other.skill_counts
+        self.cooccurrence += other.cooccurrence
+        self.education_counts += other.education_counts
+        self.education_skill += other.education_skill
+        return self
+
+    def top_skills(self, n: int = ANALYTICS_TOP_N) -> List[Tuple[str, int]]:
+        """Return the n most frequent skills with their counts."""
+        order = np.argsort(-self.skill_counts, kind="stable")[:n]
+        return [(self.skills[i], int(self.skill_counts[i])) for i in order if self.skill_counts[i] > 0]
+
+    def top_pairs(self, n: int = ANALYTICS_TOP_N) -> List[Tuple[str, str, int]]:
+        """Return the n most frequent skill pairs with their counts."""
+        upper_i, upper_j = np.triu_indices(len(self.skills), k=1)
+        counts = self.cooccurrence[upper_i, upper_j]
+        order = np.argsort(-counts, kind="stable")[:n]
+        return [
+            (self.skills[upper_i[k]], self.skills[upper_j[k]], int(counts[k]))
+            for k in order
+            if counts[k] > 0
+        ]
+
+    def education_breakdown(self, n: int = ANALYTICS_TOP_N) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize skills per education level.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Education label to its document count
+                and top n skills, for education levels that occur.
+        """
+        breakdown = {}
+        for row, label in enumerate(self.education_labels):
+            if self.education_counts[row] == 0:
+                continue
+            counts = self.education_skill[row]
+            order = np.argsort(-counts, kind="stable")[:n]
+            breakdown[label] = {
+                "documents": int(self.education_counts[row]),
+                "top_skills": [(self.skills[i], int(counts[i])) for i in order if counts[i] > 0],
+            }
+        return breakdown
+
+    def report(self, n: int = ANALYTICS_TOP_N) -> Dict[str, Any]:
+        """Return a JSON-serializable summary of the aggregate."""
+        return {
+            "documents": self.documents,
+            "unknown_skills": self.unknown_skills,
+            "top_skills": self.top_skills(n),
+            "top_pairs": self.top_pairs(n),
+            "education": self.education_breakdown(n),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the full aggregate state (for merging later)."""
+        return {
+            "skills": list(self.skills),
+            "education": list(self.education),
+            "documents": self.documents,
+            "unknown_skills": self.unknown_skills,
+            "skill_counts": self.skill_counts.tolist(),
+            "cooccurrence": self.cooccurrence.tolist(),
+            "education_counts": self.education_counts.tolist(),
+            "education_skill": self.education_skill.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "SkillAggregate":
+        """Rebuild an aggregate from to_dict output."""
+        agg = cls(state["skills"], state["education"])
+        agg.documents = int(state["documents"])
+        agg.unknown_skills = int(state["unknown_skills"])
+        agg.skill_counts[:] = state["skill_counts"]
+        agg.cooccurrence[:] = state["cooccurrence"]
+        agg.education_counts[:] = state["education_counts"]
+        agg.education_skill[:] = state["education_skill"]
+        return agg
+
+    def save(self, path: str, n: int = ANALYTICS_TOP_N) -> None:
+        """Write the aggregate state and a readable report to a JSON file."""
+        payload = self.to_dict()
+        payload["report"] = self.report(n)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "SkillAggregate":
+        """Read an aggregate written by save."""
+        with open(path, "r", encoding="utf-8") as fh:
+            return cls.from_dict(json.load(fh))
+
+
+def iter_result_chunks(csv_path: str, chunksize: int = ANALYTICS_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Read the Skills and Education columns of a results CSV in chunks.
+
+    Args:
+        csv_path (str): Results CSV written by run.py.
+        chunksize (int): Rows per chunk.
+
+    Yields:
+        pd.DataFrame: Chunks with Skills and Education columns (missing
+            values as empty strings).
+    """
+    reader = pd.read_csv(
+        csv_path,
+        usecols=["Skills", "Education"],
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunksize,
+        encoding=CSV_ENCODING,
+    )
+    with reader:
+        for chunk in reader:
+            yield chunk
+
+
+def aggregate_results(
+    paths: Iterable[str],
+    chunksize: int = ANALYTICS_CHUNK_SIZE,
+    profile: Optional[ParserProfile] = None,
+) -> SkillAggregate:
+    """
+    Aggregate results CSVs and saved aggregates into one SkillAggregate.
+
+    Args:
+        paths (Iterable[str]): Results CSVs and/or JSON files written by
+            SkillAggregate.save (merged as shards).
+        chunksize (int): Rows read per CSV chunk.
+        profile (Optional[ParserProfile]): Vocabularies (default: config.py).
+
+    Returns:
+        SkillAggregate: Combined aggregate.
+
+    Example:
+        >>> agg = aggregate_results(glob.glob("out/parsed_resumes.*.csv"))
+        >>> agg.top_skills(10)
+    """
+    total = SkillAggregate.for_profile(profile or DEFAULT_PROFILE)
+    for path in paths:
+        if path.lower().endswith(".json"):
+            total.merge(SkillAggregate.load(path))
+            logger.info("Merged aggregate %s", path)
+            continue
+
+        shard = SkillAggregate(total.skills, total.education)
+        for chunk in iter_result_chunks(path, chunksize):
+            shard.add_frame(chunk)
+        total.merge(shard)
+        logger.info("Aggregated %d result(s) from %s", shard.documents, path)
+
+    if total.unknown_skills:
+        logger.warning("%d skill mention(s) were not in the vocabulary and were ignored", total.unknown_skills)
+    return total
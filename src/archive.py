@@ -0,0 +1,129 @@
+"""
+Archive Input Module
+
+This module reads resumes directly from ZIP and TAR (optionally gzip, bzip2
+or xz compressed) archives without unpacking them to disk. Members are
+streamed one at a time, so only a single document is held in memory, and
+their bytes can be handed straight to PyMuPDF.
+"""
+
+import os
+import logging
+import tarfile
+import zipfile
+from typing import Iterable, Iterator, Optional, Tuple
+
+from config import SUPPORTED_EXTENSIONS, ARCHIVE_MAX_MEMBER_BYTES
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_EXTENSIONS = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+
+def is_archive(path: str) -> bool:
+    """Return True if path names a supported archive file."""
+    return path.lower().endswith(ARCHIVE_EXTENSIONS) and os.path.isfile(path)
+
+
+def member_path(archive_path: str, member_name: str) -> str:
+    """
+    Build the display path of an archive member.
+
+    Args:
+        archive_path (str): Path to the archive.
+        member_name (str): Member name inside the archive.
+
+    Returns:
+        str: Absolute archive path joined with the member name, e.g.
+            "/data/export.zip/batch1/john.pdf".
+    """
+    return os.path.join(os.path.abspath(archive_path), member_name)
+
+
+def _wanted(name: str, size: int, extensions: Tuple[str, ...], max_member_bytes: int, warn: bool = True) -> bool:
+    """Return True if a member should be read."""
+    if not name.lower().endswith(extensions) or os.path.basename(name).startswith("."):
+        return False
+    if size > max_member_bytes:
+        if warn:
+            logger.warning("Skipping archive member %s: %d bytes exceeds limit of %d", name, size, max_member_bytes)
+        return False
+    return True
+
+
+def count_archive_members(
+    archive_path: str,
+    extensions: Iterable[str] = SUPPORTED_EXTENSIONS,
+    max_member_bytes: int = ARCHIVE_MAX_MEMBER_BYTES,
+) -> Optional[int]:
+    """
+    Count the members iter_archive_members would yield, without reading them.
+
+    Only ZIP files have a central directory that makes this cheap; for TAR
+    archives this returns None rather than scanning the whole stream.
+
+    Args:
+        archive_path (str): Path to the archive.
+        extensions (Iterable[str]): Member extensions to count.
+        max_member_bytes (int): Members larger than this are not counted.
+
+    Returns:
+        Optional[int]: Number of matching members, or None if unknown.
+    """
+    if not zipfile.is_zipfile(archive_path):
+        return None
+    suffixes = tuple(ext.lower() for ext in extensions)
+    with zipfile.ZipFile(archive_path) as zf:
+        return sum(
+            1 for info in zf.infolist()
+            if not info.is_dir() and _wanted(info.filename, info.file_size, suffixes, max_member_bytes, warn=False)
+        )
+
+
+def iter_archive_members(
+    archive_path: str,
+    extensions: Iterable[str] = SUPPORTED_EXTENSIONS,
+    max_member_bytes: int = ARCHIVE_MAX_MEMBER_BYTES,
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Stream matching members of a ZIP or TAR archive one at a time.
+
+    TAR archives are read sequentially (no seeking), so compressed tarballs
+    are decompressed in a single pass.
+
+    Args:
+        archive_path (str): Path to the archive.
+        extensions (Iterable[str]): Member extensions to yield.
+        max_member_bytes (int): Members larger than this are skipped.
+
+    Yields:
+        Tuple[str, bytes]: (member name, member contents).
+
+    Raises:
+        ValueError: If the file is not a ZIP or TAR archive.
+
+    Example:
+        >>> for name, data in iter_archive_members("export.zip"):
+        ...     result = process_resume(member_path("export.zip", name), data=data)
+    """
+    suffixes = tuple(ext.lower() for ext in extensions)
+
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                if info.is_dir() or not _wanted(info.filename, info.file_size, suffixes, max_member_bytes):
+                    continue
+                yield info.filename, zf.read(info)
+        return
+
+    if tarfile.is_tarfile(archive_path):
+        with tarfile.open(archive_path, mode="r|*") as tf:
+            for member in tf:
+                if not member.isfile() or not _wanted(member.name, member.size, suffixes, max_member_bytes):
+                    continue
+                fh = tf.extractfile(member)
+                if fh is not None:
+                    yield member.name, fh.read()
+        return
+
+    raise ValueError(f"Not a ZIP or TAR archive: {archive_path}")
@@ -0,0 +1,157 @@
+"""
+Batch Parsing Module
+
+This module parses many resume texts at once and returns columnar results.
+Patterns are compiled once, texts are processed in fixed-size batches, and
+the keyword passes run as pandas string operations over a whole batch
+instead of one Python call chain per document. Contact fields use the
+linear-time scanners from src.contact.
+"""
+
+import logging
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import BATCH_SIZE
+from src.contact import find_email, find_phone
+from src.parser import extract_name
+from src.profiles import ParserProfile, DEFAULT_PROFILE
+from src.sections import find_sections, get_section
+
+logger = logging.getLogger(__name__)
+
+RESULT_COLUMNS = ["Name", "Email", "Phone", "Education", "Skills"]
+
+
+def _parse_batch(texts: List[str], profile: ParserProfile) -> pd.DataFrame:
+    """
+    Parse one batch of normalized texts with vectorized string operations.
+
+    Produces the same fields as parse_resume for every text.
+
+    Args:
+        texts (List[str]): Normalized resume texts.
+        profile (ParserProfile): Vocabularies to match.
+
+    Returns:
+        pd.DataFrame: One row per text with RESULT_COLUMNS.
+    """
+    series = pd.Series([t if isinstance(t, str) else "" for t in texts], dtype=object)
+
+    sections = [find_sections(text, profile.header_pattern) for text in series]
+    education_text = pd.Series(
+        [get_section(t, s, "education") for t, s in zip(series, sections)], dtype=object
+    ).str.lower()
+    skills_text = pd.Series(
+        [get_section(t, s, "skills") for t, s in zip(series, sections)], dtype=object
+    ).str.lower()
+
+    emails = [find_email(text) for text in series]
+    phones = [find_phone(text) for text in series]
+
+    # First education keyword in list order, matching extract_education
+    education = np.full(len(series), None, dtype=object)
+    for keyword, keyword_lower in profile.education_lower:
+        pending = pd.isna(education)
+        if not pending.any():
+            break
+        hits = education_text.str.contains(keyword_lower, regex=False).to_numpy(dtype=bool)
+        education[pending & hits] = keyword
+
+    # Boolean document x skill matrix, one vectorized pass per skill
+    skill_hits = np.zeros((len(series), len(profile.skills)), dtype=bool)
+    for idx, (_, skill_lower) in enumerate(profile.skills_lower):
+        skill_hits[:, idx] = skills_text.str.contains(skill_lower, regex=False).to_numpy(dtype=bool)
+
+    if profile.skill_index:
+        columns = {skill: idx for idx, skill in enumerate(profile.skills)}
+        for row, text in enumerate(skills_text):
+            for skill in profile.skill_index.find(text):
+                skill_hits[row, columns[skill]] = True
+
+    skills = [[profile.skills[j] for j in np.flatnonzero(row)] for row in skill_hits]
+
+    return pd.DataFrame(
+        {
+            "Name": [extract_name(text) for text in series],
+            "Email": [email.lower() if email else None for email in emails],
+            "Phone": phones,
+            "Education": list(education),
+            "Skills": skills,
+        },
+        columns=RESULT_COLUMNS,
+        dtype=object,
+    )
+
+
+def iter_parse_resumes(
+    texts: Iterable[str],
+    batch_size: int = BATCH_SIZE,
+    profile: Optional[ParserProfile] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse resume texts lazily, yielding one DataFrame per batch.
+
+    Use this for very large corpora so only one batch is held in memory.
+
+    Args:
+        texts (Iterable[str]): Normalized resume texts.
+        batch_size (int): Number of texts per batch.
+        profile (Optional[ParserProfile]): Vocabularies to use (default: config.py).
+
+    Yields:
+        pd.DataFrame: Parsed fields for each batch, in input order.
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    profile = profile or DEFAULT_PROFILE
+    iterator = iter(texts)
+    batch_num = 0
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            break
+        batch_num += 1
+        logger.debug("Parsing batch %d (%d texts)", batch_num, len(batch))
+        yield _parse_batch(batch, profile)
+
+
+def parse_resumes(
+    texts: Iterable[str],
+    batch_size: int = BATCH_SIZE,
+    profile: Optional[ParserProfile] = None,
+) -> pd.DataFrame:
+    """
+    Parse many resume texts and return a single columnar result.
+
+    Equivalent to calling parse_resume on every text, but patterns are
+    compiled once and matching runs batch-wise over pandas Series.
+
+    Args:
+        texts (Iterable[str]): Normalized resume texts.
+        batch_size (int): Number of texts per batch.
+        profile (Optional[ParserProfile]): Vocabularies to use (default: config.py).
+
+    Returns:
+        pd.DataFrame: One row per input text with columns Name, Email,
+            Phone, Education and Skills (a list per row).
+
+    Example:
+        >>> df = parse_resumes(["John Smith john@example.com Python"])
+        >>> df.loc[0, "Email"]
+        'john@example.com'
+    """
+    frames = list(iter_parse_resumes(texts, batch_size, profile))
+    if not frames:
+        return pd.DataFrame(columns=RESULT_COLUMNS, dtype=object)
+
+    result = pd.concat(frames, ignore_index=True)
+    logger.info("Parsed %d resume(s) in %d batch(es)", len(result), len(frames))
+    return result
@@ -0,0 +1,179 @@
+"""
+Worker Bootstrap Module
+
+This module prepares the template process that worker processes are forked
+from. The template imports PyMuPDF, pandas, config and the parser, builds
+the compiled matchers by running one small generated document through
+every stage, then freezes its garbage collector heap (gc.freeze). Forked
+workers start with all of this in place and share the template's memory
+pages copy-on-write: frozen objects are never traversed by the children's
+collections, so their pages are not copied.
+
+With the "forkserver" start method the template is a separate,
+single-threaded server process started once per run; with "fork" it is the
+main process itself. "spawn" starts every worker from scratch. Pool
+executors run init_worker in each worker as it starts.
+"""
+
+import os
+import gc
+import time
+import logging
+import importlib
+import multiprocessing
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from config import BASE_DIR, WORKER_START_METHOD, MUPDF_STORE_RSS_LIMIT_MB
+from src.logging_setup import configure_worker_logging
+
+logger = logging.getLogger(__name__)
+
+# Imported into the template before it is frozen
+PRELOAD_MODULES: List[str] = [
+    "fitz",
+    "numpy",
+    "pandas",
+    "config",
+    "src.extractors",
+    "src.triage",
+    "src.pipeline",
+    "src.batch",
+    "src.workers",
+]
+
+# Module whose import runs preload() in the fork server
+TEMPLATE_MODULE = "src.worker_template"
+
+_WARM_UP_TEXT = (
+    "John Smith\n"
+    "john.smith@example.com | +1 (555) 010-0199\n"
+    "EDUCATION\n"
+    "Bachelor of Science in Computer Science\n"
+    "SKILLS\n"
+    "Python, SQL, Docker, Machine Learning\n"
+    "EXPERIENCE\n"
+    "Software Engineer, 2019 - 2024\n"
+)
+
+_preloaded_seconds: Optional[float] = None
+
+
+def _warm_up() -> None:
+    """Run a small generated PDF through triage, extraction and parsing."""
+    import fitz
+    from src.extractors import extract_text
+    from src.preprocess import normalize_text
+    from src.parser import parse_resume
+    from src.triage import probe_pdf
+
+    doc = fitz.open()
+    try:
+        doc.new_page().insert_text((72, 72), _WARM_UP_TEXT)
+        data = doc.tobytes()
+    finally:
+        doc.close()
+    probe_pdf("warm_up.pdf", data=data)
+    parse_resume(normalize_text(extract_text("warm_up.pdf", data=data)))
+
+
+def preload(modules: Optional[List[str]] = None, freeze: bool = True) -> float:
+    """
+    Turn the current process into a worker template (once per process).
+
+    Args:
+        modules (Optional[List[str]]): Modules to import (default: PRELOAD_MODULES).
+        freeze (bool): Move every object alive afterwards to the permanent
+            GC generation.
+
+    Returns:
+        float: Seconds spent the first time; later calls return the same value.
+    """
+    global _preloaded_seconds
+    if _preloaded_seconds is not None:
+        return _preloaded_seconds
+
+    started = time.perf_counter()
+    for name in modules or PRELOAD_MODULES:
+        importlib.import_module(name)
+    try:
+        _warm_up()
+    except Exception as e:
+        logger.warning("Worker template warm-up failed: %s", e)
+    if freeze:
+        # Collect first so garbage from the imports is not frozen with them
+        gc.collect()
+        gc.freeze()
+    _preloaded_seconds = time.perf_counter() - started
+    return _preloaded_seconds
+
+
+@contextmanager
+def _python_path(path: str) -> Iterator[None]:
+    """Temporarily put path first on PYTHONPATH for child interpreters."""
+    old = os.environ.get("PYTHONPATH")
+    os.environ["PYTHONPATH"] = os.pathsep.join(p for p in (path, old) if p)
+    try:
+        yield
+    finally:
+        if old is None:
+            del os.environ["PYTHONPATH"]
+        else:
+            os.environ["PYTHONPATH"] = old
+
+
+def worker_context(method: str = WORKER_START_METHOD) -> multiprocessing.context.BaseContext:
+    """
+    Return the multiprocessing context worker pools should use.
+
+    For "forkserver" the fork server is started here, with the entry
+    script and the template module preloaded; for "fork" the main process
+    is preloaded. Start methods the platform lacks fall back to "spawn".
+
+    Args:
+        method (str): "forkserver", "fork" or "spawn".
+
+    Returns:
+        multiprocessing.context.BaseContext: Context for ProcessPoolExecutor(mp_context=...).
+
+    Raises:
+        ValueError: If method is not a start method.
+    """
+    if method not in ("forkserver", "fork", "spawn"):
+        raise ValueError(f"Unknown start method: {method!r} (expected 'forkserver', 'fork' or 'spawn')")
+    if method not in multiprocessing.get_all_start_methods():
+        logger.debug("Start method %s is not available, using spawn", method)
+        method = "spawn"
+
+    context = multiprocessing.get_context(method)
+    if method == "forkserver":
+        # "__main__" preloads the modules the entry script (e.g. run.py)
+        # imports, so workers do not import them again when they unpickle
+        # functions defined there
+        context.set_forkserver_preload(["__main__", TEMPLATE_MODULE])
+        # The server is a fresh interpreter: make the package importable
+        # wherever run.py was started from
+        from multiprocessing import forkserver
+        with _python_path(BASE_DIR):
+            forkserver.ensure_running()
+    elif method == "fork":
+        seconds = preload()
+        logger.debug("Worker template preloaded in %.2f s", seconds)
+    return context
+
+
+def init_worker(logging_settings: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Prepare a pool worker process (use as the executor initializer).
+
+    Configures logging from the parent's settings and bounds the MuPDF
+    store (MUPDF_STORE_RSS_LIMIT_MB), which only long-running workers need.
+
+    Args:
+        logging_settings (Optional[Dict[str, Any]]): worker_logging_settings()
+            of the parent process.
+    """
+    from src.extract_text import set_mupdf_store_limit
+
+    configure_worker_logging(logging_settings)
+    set_mupdf_store_limit(MUPDF_STORE_RSS_LIMIT_MB)
@@ -0,0 +1,401 @@
+"""
+Result Cache Module
+
+This module caches process_resume results by document content, so the same
+file parsed again (e.g. a PDF uploaded to several openings) is answered
+without extracting or parsing it. Keys combine a hash of the file bytes with
+a version of the parser configuration (extractor, profile vocabularies,
+extraction options, RESULT_CACHE_VERSION); changing any of them makes old
+entries unreachable.
+
+There are two tiers, each bounded in bytes and evicting least recently used
+entries:
+- memory: an in-process LRU of JSON-encoded results
+- disk: one JSON file per entry under a directory that several processes
+  may share; a disk hit is promoted to memory
+
+The disk limit holds for the directory as a whole, not per process. Every
+process updates one shared usage record (entries and bytes, kept in the
+directory's lock file) under an exclusive file lock; when it goes over the
+limit, the directory is rescanned and the least recently used files (by
+modification time, refreshed on every hit) are removed down to
+DISK_LOW_WATERMARK of the limit, so rescans stay rare. Without fcntl
+(Windows) the lock is skipped and the limit is approximate.
+
+Cached results do not include File and FilePath, which process_resume adds
+for the path it was called with. Cache errors are logged and counted, never
+raised.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from config import (
+    RESULT_CACHE_ENABLED,
+    RESULT_CACHE_MEMORY_MB,
+    RESULT_CACHE_DISK_MB,
+    RESULT_CACHE_DIR,
+    RESULT_CACHE_VERSION,
+    REPEATED_LINE_EDGE,
+    REPEATED_LINE_MIN_PAGES,
+)
+from src.extract_text import DEFAULT_OPTIONS
+from src.profiles import ParserProfile, DEFAULT_PROFILE
+
+logger = logging.getLogger(__name__)
+
+MB = 2 ** 20
+
+# Lock file of a disk tier directory; it also holds "<entries> <bytes>"
+LOCK_FILE = ".lock"
+
+# Fraction of the disk limit an over-full directory is evicted down to
+DISK_LOW_WATERMARK = 0.9
+
+_versions: Dict[Tuple[str, str], str] = {}
+
+
+def parser_version(profile: Optional[ParserProfile] = None, extractor: str = "") -> str:
+    """
+    Identify the parser configuration a result was produced with.
+
+    Args:
+        profile (Optional[ParserProfile]): Parser vocabularies (default: config.py).
+        extractor (str): Qualified name of the text extractor, so the same
+            bytes read as another file type get another key.
+
+    Returns:
+        str: Short hex digest of the extractor, profile hash, extraction
+            options and RESULT_CACHE_VERSION.
+    """
+    profile = profile or DEFAULT_PROFILE
+    version = _versions.get((profile.hash, extractor))
+    if version is None:
+        settings = [
+            RESULT_CACHE_VERSION, extractor, profile.hash, repr(DEFAULT_OPTIONS),
+            REPEATED_LINE_EDGE, REPEATED_LINE_MIN_PAGES,
+        ]
+        version = hashlib.blake2b(repr(settings).encode("utf-8"), digest_size=8).hexdigest()
+        _versions[(profile.hash, extractor)] = version
+    return version
+
+
+def content_key(data: bytes, profile: Optional[ParserProfile] = None, extractor: str = "") -> str:
+    """
+    Cache key of a document: content hash plus parser version.
+
+    Args:
+        data (bytes): File contents.
+        profile (Optional[ParserProfile]): Parser vocabularies (default: config.py).
+        extractor (str): Qualified name of the text extractor (see parser_version).
+
+    Returns:
+        str: Hex key, safe to use as a file name.
+    """
+    return f"{hashlib.blake2b(data, digest_size=20).hexdigest()}-{parser_version(profile, extractor)}"
+
+
+class ResultCache:
+    """
+    Two-tier, size-bounded cache of parsed results.
+
+    Args:
+        memory_bytes (int): Byte limit of the in-memory tier (0 disables it).
+        disk_dir (Optional[str]): Directory of the on-disk tier (None
+            disables it).
+        disk_bytes (int): Byte limit of the on-disk tier.
+
+    Example:
+        >>> cache = ResultCache(64 * MB, "/var/cache/resumes", 1024 * MB)
+        >>> result = process_resume("resume.pdf", cache=cache)
+        >>> cache.stats()["memory_hits"]
+    """
+
+    def __init__(
+        self,
+        memory_bytes: int = RESULT_CACHE_MEMORY_MB * MB,
+        disk_dir: Optional[str] = RESULT_CACHE_DIR,
+        disk_bytes: int = RESULT_CACHE_DISK_MB * MB,
+    ):
+        self.memory_bytes = memory_bytes
+        self.disk_dir = disk_dir
+        self.disk_bytes = disk_bytes
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.memory_evictions = 0
+        self.disk_evictions = 0
+        self.errors = 0
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+
+        if disk_dir:
+            try:
+                os.makedirs(disk_dir, exist_ok=True)
+                with self._disk_locked() as fh:
+                    self._evict_disk(fh)
+            except OSError as e:
+                self.errors += 1
+                logger.warning("Cannot use result cache directory %s: %s", disk_dir, e)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.json")
+
+    @contextmanager
+    def _disk_locked(self) -> Iterator[IO[bytes]]:
+        """Hold the directory's lock file, shared by every process using it."""
+        with open(os.path.join(self.disk_dir, LOCK_FILE), "a+b") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            yield fh
+
+    @staticmethod
+    def _read_usage(fh: IO[bytes]) -> Optional[Tuple[int, int]]:
+        """Read the shared (entries, bytes) record, or None if it is missing or damaged."""
+        fh.seek(0)
+        try:
+            entries, used = (int(value) for value in fh.read().split())
+        except ValueError:
+            return None
+        return entries, used
+
+    @staticmethod
+    def _write_usage(fh: IO[bytes], entries: int, used: int) -> None:
+        fh.seek(0)
+        fh.truncate()
+        fh.write(f"{entries} {used}".encode("ascii"))
+        fh.flush()
+
+    def _scan_disk(self) -> List[Tuple[int, str, int]]:
+        """List disk entries as (mtime, path, size), least recently used first."""
+        entries = []
+        for prefix in os.scandir(self.disk_dir):
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                if entry.name.endswith(".json"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime_ns, entry.path, stat.st_size))
+        entries.sort()
+        return entries
+
+    def _evict_disk(self, fh: IO[bytes], limit: Optional[int] = None) -> None:
+        """
+        Rescan the directory and remove least recently used entries (lock held).
+
+        Brings the directory down to DISK_LOW_WATERMARK of the limit when it
+        is over the limit, and rewrites the shared usage record.
+        """
+        limit = self.disk_bytes if limit is None else limit
+        entries = self._scan_disk()
+        used = sum(size for _, _, size in entries)
+        target = limit if used <= limit else int(limit * DISK_LOW_WATERMARK)
+        kept = len(entries)
+        for _, path, size in entries:
+            if used <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.errors += 1
+                logger.warning("Cannot evict result cache entry %s: %s", path, e)
+                continue
+            used -= size
+            kept -= 1
+            self.disk_evictions += 1
+        self._write_usage(fh, kept, used)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a result.
+
+        Args:
+            key (str): Key from content_key.
+
+        Returns:
+            Optional[Dict[str, Any]]: A fresh copy of the cached result, or None.
+        """
+        with self._lock:
+            encoded = self._memory.get(key)
+            if encoded is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return json.loads(encoded)
+
+        encoded = self._read_disk(key) if self.disk_dir else None
+        with self._lock:
+            if encoded is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store_memory(key, encoded)
+        return json.loads(encoded)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a result in both tiers.
+
+        Args:
+            key (str): Key from content_key.
+            result (Dict[str, Any]): Parsed fields (JSON-serializable).
+        """
+        encoded = json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            self.stores += 1
+            self._store_memory(key, encoded)
+        if self.disk_dir:
+            self._write_disk(key, encoded)
+
+    def _store_memory(self, key: str, encoded: bytes) -> None:
+        """Insert into the memory tier and evict to its limit (lock held)."""
+        if len(encoded) > self.memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_used -= len(old)
+        self._memory[key] = encoded
+        self._memory_used += len(encoded)
+        while self._memory_used > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_used -= len(evicted)
+            self.memory_evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        """Read a disk entry (possibly written by another process) and mark it used."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                encoded = fh.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            with self._lock:
+                self.errors += 1
+            logger.warning("Cannot read result cache entry %s: %s", path, e)
+            return None
+        return encoded
+
+    def _write_disk(self, key: str, encoded: bytes) -> None:
+        """Write a disk entry atomically and evict to the directory's limit."""
+        if len(encoded) > self.disk_bytes:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                fh.write(encoded)
+            with self._disk_locked() as lock:
+                try:
+                    replaced = os.stat(path).st_size
+                except FileNotFoundError:
+                    replaced = None
+                os.replace(tmp_path, path)
+
+                usage = self._read_usage(lock)
+                if usage is None:
+                    self._evict_disk(lock)
+                    return
+                entries, used = usage
+                entries += replaced is None
+                used += len(encoded) - (replaced or 0)
+                if used > self.disk_bytes:
+                    self._evict_disk(lock)
+                else:
+                    self._write_usage(lock, entries, used)
+        except OSError as e:
+            with self._lock:
+                self.errors += 1
+            logger.warning("Cannot write result cache entry %s: %s", path, e)
+
+    def clear(self) -> None:
+        """Empty both tiers (the disk tier for every process) and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_used = 0
+        if self.disk_dir:
+            try:
+                with self._disk_locked() as lock:
+                    self._evict_disk(lock, limit=0)
+            except OSError as e:
+                self.errors += 1
+                logger.warning("Cannot clear result cache directory %s: %s", self.disk_dir, e)
+        with self._lock:
+            self.memory_hits = self.disk_hits = self.misses = self.stores = 0
+            self.memory_evictions = self.disk_evictions = self.errors = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report hit/miss counters and tier sizes.
+
+        Returns:
+            Dict[str, Any]: memory_hits, disk_hits, misses, hit_rate, stores,
+                memory/disk entries, bytes and evictions, and errors. Disk
+                entries and bytes are those of the whole directory.
+        """
+        usage = None
+        if self.disk_dir:
+            try:
+                with self._disk_locked() as lock:
+                    usage = self._read_usage(lock)
+            except OSError:
+                pass
+        disk_entries, disk_used = usage or (0, 0)
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "stores": self.stores,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_used,
+                "memory_evictions": self.memory_evictions,
+                "disk_entries": disk_entries,
+                "disk_bytes": disk_used,
+                "disk_evictions": self.disk_evictions,
+                "errors": self.errors,
+            }
+
+
+_default_cache: Optional[ResultCache] = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> Optional[ResultCache]:
+    """
+    Return the process-wide cache configured in config.py.
+
+    Returns:
+        Optional[ResultCache]: The shared cache, or None if
+            RESULT_CACHE_ENABLED is False.
+    """
+    global _default_cache
+    if not RESULT_CACHE_ENABLED:
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResultCache()
+        return _default_cache
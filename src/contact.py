@@ -0,0 +1,148 @@
+"""
+Contact Scanning Module
+
+This module finds email addresses and phone numbers in linear time.
+Extracted PDF text often contains long runs of word characters and dots
+(base64 blobs, URLs, table garbage) on which a backtracking regex such as
+``[\\w\\.-]+@[\\w\\.-]+\\.\\w+`` degrades to quadratic time. The scanners here
+anchor on '@' characters and digit runs instead, and only ever look at the
+characters between neighbouring anchors, so every character is visited a
+bounded number of times.
+
+The results are identical to the first match of EMAIL_PATTERN and
+PHONE_PATTERN from config.py.
+"""
+
+import re
+from typing import Optional
+
+# Character-class runs only; a single-class star never backtracks
+_EMAIL_RUN = re.compile(r"[\w.-]*")
+_WORD_RUN = re.compile(r"\w*")
+_DIGIT_RUN = re.compile(r"\d+")
+_DIGITS_AT = re.compile(r"\d*")
+
+
+def _is_word(ch: str) -> bool:
+    """Return True if ch is a regex word character (\\w)."""
+    return ch.isalnum() or ch == "_"
+
+
+def _is_phone_separator(ch: str) -> bool:
+    """Return True if ch matches [-.\\s]."""
+    return ch == "-" or ch == "." or ch.isspace()
+
+
+def find_email(text: str) -> Optional[str]:
+    """
+    Find the first email address in text in linear time.
+
+    Equivalent to ``re.search(EMAIL_PATTERN, text)``: the local part and the
+    domain are maximal runs of [\\w.-] on either side of an '@', and the
+    domain must contain a dot followed by at least one word character.
+
+    Args:
+        text (str): Text to scan.
+
+    Returns:
+        Optional[str]: The matched address as written, or None.
+
+    Example:
+        >>> find_email("Contact: jane.doe@example.com, +1 555")
+        'jane.doe@example.com'
+    """
+    if not text:
+        return None
+
+    at = text.find("@")
+    if at < 0:
+        return None
+
+    reversed_text = text[::-1]
+    length = len(text)
+
+    while at >= 0:
+        # Local part: run of [\w.-] immediately left of '@' (scanned on the
+        # reversed text, so it stops at the previous '@')
+        local_length = _EMAIL_RUN.match(reversed_text, length - at).end() - (length - at)
+        if local_length:
+            # Domain: run of [\w.-] right of '@', stopping at the next '@'
+            domain_end = _EMAIL_RUN.match(text, at + 1).end()
+            domain = text[at + 1:domain_end]
+
+            # Last dot (not the first domain char) followed by a word char
+            dot = domain.rfind(".")
+            while dot >= 1 and not (dot + 1 < len(domain) and _is_word(domain[dot + 1])):
+                dot = domain.rfind(".", 0, dot)
+
+            if dot >= 1:
+                tld_end = _WORD_RUN.match(text, at + 2 + dot).end()
+                return text[at - local_length:tld_end]
+
+        at = text.find("@", at + 1)
+
+    return None
+
+
+def find_phone(text: str) -> Optional[str]:
+    """
+    Find the first phone number in text in linear time.
+
+    Equivalent to ``re.search(PHONE_PATTERN, text)``, which accepts:
+    - 10 digits on their own: 1234567890
+    - International: +<1-3 digits>[-. ]<10 digits> or +<11-13 digits>
+    - Formatted: (123) 456-7890
+
+    Only maximal digit runs are visited, and each check looks at the run,
+    the character before it and at most two following runs.
+
+    Args:
+        text (str): Text to scan.
+
+    Returns:
+        Optional[str]: The matched phone number as written, or None.
+
+    Example:
+        >>> find_phone("Call (123) 456-7890 today")
+        '(123) 456-7890'
+    """
+    if not text:
+        return None
+
+    length = len(text)
+
+    for run in _DIGIT_RUN.finditer(text):
+        start, end = run.span()
+        digits = end - start
+        before = text[start - 1] if start > 0 else ""
+        boundary_after = end == length or not _is_word(text[end])
+
+        if before == "+":
+            # +\d{1,3}\d{10}\b
+            if 11 <= digits <= 13 and boundary_after:
+                return text[start - 1:end]
+            # +\d{1,3}[-.\s]\d{10}\b
+            if digits <= 3 and end < length and _is_phone_separator(text[end]):
+                second_end = _DIGITS_AT.match(text, end + 1).end()
+                if second_end - (end + 1) == 10 and (second_end == length or not _is_word(text[second_end])):
+                    return text[start - 1:second_end]
+
+        elif before == "(" and digits == 3 and end < length and text[end] == ")":
+            # \(\d{3}\)\s?\d{3}[-.\s]?\d{4}
+            pos = end + 1
+            if pos < length and text[pos].isspace():
+                pos += 1
+            middle_end = _DIGITS_AT.match(text, pos).end()
+            middle = middle_end - pos
+            if middle >= 7:
+                return text[start - 1:pos + 7]
+            if middle == 3 and middle_end < length and _is_phone_separator(text[middle_end]):
+                last_end = _DIGITS_AT.match(text, middle_end + 1).end()
+                if last_end - (middle_end + 1) >= 4:
+                    return text[start - 1:middle_end + 5]
+
+        # \b\d{10}\b
+        if digits == 10 and boundary_after and not _is_word(before or " "):
+            return text[start:end]
+
+    return None
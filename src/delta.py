@@ -0,0 +1,223 @@
+"""
+Delta Output Module
+
+This module compares a run's results with the previous run's output CSV and
+reports only what changed, so downstream loads are proportional to the
+change rather than to the corpus:
+- insert: a FilePath that was not in the previous output
+- update: a FilePath whose record content changed (with the changed fields)
+- delete: a FilePath that is no longer in the output
+
+Records are matched on FilePath and compared by a content hash of their
+fields (a hash join). The previous output is streamed in chunks into a
+table of FilePath -> 16-byte digest; its full rows are only read back for
+the FilePaths that changed.
+"""
+
+import os
+import math
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from config import DELTA_CHUNK_SIZE, CSV_ENCODING
+
+logger = logging.getLogger(__name__)
+
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+KEY_COLUMN = "FilePath"
+CHANGE_COLUMN = "Change"
+CHANGED_FIELDS_COLUMN = "ChangedFields"
+
+
+class Delta(NamedTuple):
+    """
+    Changes between two runs.
+
+    Attributes:
+        inserted (List[Dict[str, str]]): New records.
+        updated (List[Tuple[Dict[str, str], List[str]]]): New version of
+            each changed record and the names of the fields that changed.
+        deleted (List[str]): FilePaths no longer present.
+        unchanged (int): Number of records that did not change.
+    """
+
+    inserted: List[Dict[str, str]]
+    updated: List[Tuple[Dict[str, str], List[str]]]
+    deleted: List[str]
+    unchanged: int
+
+    @property
+    def changes(self) -> int:
+        """Total number of inserted, updated and deleted records."""
+        return len(self.inserted) + len(self.updated) + len(self.deleted)
+
+
+def _cell(value: Any) -> str:
+    """Render a field the way it reads back from the results CSV."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, list):
+        return ", ".join(value)
+    return str(value)
+
+
+def normalize_record(record: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Convert a parsed result to the string form stored in the results CSV.
+
+    Args:
+        record (Dict[str, Any]): Result from process_resume or a CSV row.
+
+    Returns:
+        Dict[str, str]: Field values as strings (missing values as "").
+    """
+    return {column: _cell(value) for column, value in record.items()}
+
+
+def record_hash(record: Dict[str, str], columns: Sequence[str]) -> bytes:
+    """
+    Hash the content of a normalized record.
+
+    Args:
+        record (Dict[str, str]): Normalized record.
+        columns (Sequence[str]): Columns to hash, in a fixed order; missing
+            columns hash as empty values.
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for column in columns:
+        digest.update(record.get(column, "").encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.digest()
+
+
+def iter_previous_records(csv_path: str, chunksize: int = DELTA_CHUNK_SIZE) -> Iterator[Dict[str, str]]:
+    """
+    Stream the rows of a previous results CSV.
+
+    Args:
+        csv_path (str): Results CSV written by run.py.
+        chunksize (int): Rows read at a time.
+
+    Yields:
+        Dict[str, str]: One row (missing values as empty strings).
+    """
+    reader = pd.read_csv(csv_path, dtype=str, keep_default_na=False, chunksize=chunksize, encoding=CSV_ENCODING)
+    with reader:
+        for chunk in reader:
+            yield from chunk.to_dict("records")
+
+
+def _previous_columns(csv_path: str) -> List[str]:
+    return list(pd.read_csv(csv_path, nrows=0, encoding=CSV_ENCODING).columns)
+
+
+def compute_delta(
+    results: Iterable[Dict[str, Any]],
+    previous_path: Optional[str],
+    chunksize: int = DELTA_CHUNK_SIZE,
+) -> Delta:
+    """
+    Compare new results with the previous output.
+
+    Args:
+        results (Iterable[Dict[str, Any]]): Parsed results of this run.
+        previous_path (Optional[str]): Previous results CSV; if None or
+            missing, every result is an insert.
+        chunksize (int): Rows of the previous output read at a time.
+
+    Returns:
+        Delta: Inserted, updated and deleted records.
+
+    Raises:
+        ValueError: If the previous output has no FilePath column.
+
+    Example:
+        >>> delta = compute_delta(results, "data/processed_output/parsed_resumes.csv")
+        >>> print(len(delta.inserted), len(delta.updated), len(delta.deleted))
+    """
+    records = [normalize_record(r) for r in results]
+    if not previous_path or not os.path.exists(previous_path):
+        return Delta(records, [], [], 0)
+
+    previous_columns = _previous_columns(previous_path)
+    if KEY_COLUMN not in previous_columns:
+        raise ValueError(f"{previous_path} has no {KEY_COLUMN} column")
+
+    new_columns: Dict[str, None] = {}
+    for record in records:
+        new_columns.update(dict.fromkeys(record))
+    columns = sorted(set(previous_columns) | set(new_columns))
+
+    # Build side: FilePath -> content hash of the previous output
+    previous: Dict[str, bytes] = {}
+    for row in iter_previous_records(previous_path, chunksize):
+        previous[row[KEY_COLUMN]] = record_hash(row, columns)
+
+    # Probe side: this run's results
+    inserted = []
+    changed: Dict[str, Dict[str, str]] = {}
+    unchanged = 0
+    for record in records:
+        key = record.get(KEY_COLUMN, "")
+        old_hash = previous.pop(key, None)
+        if old_hash is None:
+            inserted.append(record)
+        elif old_hash != record_hash(record, columns):
+            changed[key] = record
+        else:
+            unchanged += 1
+    deleted = list(previous)
+
+    # Second pass: read back only the previous rows that changed
+    updated = []
+    if changed:
+        pending: Set[str] = set(changed)
+        for row in iter_previous_records(previous_path, chunksize):
+            key = row[KEY_COLUMN]
+            if key in pending:
+                record = changed[key]
+                fields = [c for c in columns if row.get(c, "") != record.get(c, "")]
+                updated.append((record, fields))
+                pending.discard(key)
+                if not pending:
+                    break
+
+    logger.info(
+        "Delta: %d inserted, %d updated, %d deleted, %d unchanged",
+        len(inserted), len(updated), len(deleted), unchanged,
+    )
+    return Delta(inserted, updated, deleted, unchanged)
+
+
+def delta_to_frame(delta: Delta) -> pd.DataFrame:
+    """
+    Lay out a delta as one row per change.
+
+    Inserted and updated rows carry the full new record; deleted rows only
+    their FilePath. ChangedFields lists the changed columns of updates.
+
+    Args:
+        delta (Delta): Changes to write.
+
+    Returns:
+        pd.DataFrame: Change, ChangedFields and the record columns.
+    """
+    rows = [{CHANGE_COLUMN: INSERT, CHANGED_FIELDS_COLUMN: "", **r} for r in delta.inserted]
+    rows += [{CHANGE_COLUMN: UPDATE, CHANGED_FIELDS_COLUMN: ", ".join(f), **r} for r, f in delta.updated]
+    rows += [{CHANGE_COLUMN: DELETE, CHANGED_FIELDS_COLUMN: "", KEY_COLUMN: k} for k in delta.deleted]
+    return pd.DataFrame(rows, columns=None if rows else [CHANGE_COLUMN, CHANGED_FIELDS_COLUMN, KEY_COLUMN])
+
+
+def delta_path(output_path: str, suffix: str) -> str:
+    """Insert suffix before the extension: out.csv -> out.delta.csv."""
+    stem, ext = os.path.splitext(output_path)
+    return f"{stem}{suffix}{ext or '.csv'}"
@@ -3,21 +3,241 @@ PDF Text Extraction Module
 
 This module handles extraction of text content from PDF files using PyMuPDF.
 It provides robust error handling for corrupted or unusual PDF files.
+
+How text is extracted is controlled by ExtractOptions: the PyMuPDF output
+mode, the TEXT_* flags, clipping to the page body, skipping annotations and
+stripping headers/footers repeated on most pages. The defaults come from
+config.py; benchmarks/bench_extract.py compares the options on a synthetic
+corpus.
+
+PyMuPDF is not safe to call from several threads at once, so documents are
+opened and extracted under MUPDF_LOCK; threads only overlap in the
+pure-Python stages.
+
+MuPDF keeps decoded resources in a process-wide store. After each document
+the store is shrunk by MUPDF_STORE_SHRINK_PERCENT; worker processes also
+empty it when their RSS is above a limit (see set_mupdf_store_limit).
 """
 
+import ctypes
+import ctypes.util
 import logging
-from typing import Optional
+import threading
+from typing import Iterable, NamedTuple, Optional, Tuple
 import fitz  # PyMuPDF
 
+from config import (
+    EXTRACT_MODE,
+    EXTRACT_FLAGS,
+    EXTRACT_CLIP_MARGINS,
+    EXTRACT_SKIP_ANNOTATIONS,
+    EXTRACT_STRIP_REPEATED,
+    MUPDF_LOW_MEMORY,
+    MUPDF_STORE_SHRINK_PERCENT,
+    MUPDF_STORE_RSS_HEADROOM_MB,
+)
+from src.preprocess import strip_repeated_lines
+from src.memory import current_rss
+
 logger = logging.getLogger(__name__)
 
+# PyMuPDF's default flags for each supported output mode
+MODE_FLAGS = {
+    "text": fitz.TEXTFLAGS_TEXT,
+    "blocks": fitz.TEXTFLAGS_BLOCKS,
+    "words": fitz.TEXTFLAGS_WORDS,
+}
+
+
+def text_flags(names: Iterable[str]) -> int:
+    """
+    Combine PyMuPDF TEXT_* flags given by name.
+
+    Args:
+        names (Iterable[str]): Flag names without the TEXT_ prefix, in any
+            case (e.g. ["preserve_whitespace", "mediabox_clip"]).
+
+    Returns:
+        int: Bitwise OR of the flags.
+
+    Raises:
+        ValueError: If a name is not a PyMuPDF text flag.
+    """
+    flags = 0
+    for name in names:
+        value = getattr(fitz, f"TEXT_{name.upper()}", None)
+        if not isinstance(value, int):
+            raise ValueError(f"Unknown PyMuPDF text flag: {name}")
+        flags |= value
+    return flags
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+
+class ExtractOptions(NamedTuple):
+    """
+    Options for extract_text_from_pdf.
+
+    Attributes:
+        mode (str): "text", "blocks" or "words".
+        flags (Optional[int]): PyMuPDF TEXT_* flags (None: mode default).
+        clip_margins (Optional[Tuple[float, float, float, float]]): Left,
+            top, right and bottom margins (points) excluded from extraction.
+        skip_annotations (bool): Ignore annotations and form fields.
+        strip_repeated (bool): Drop lines repeated at the top or bottom of
+            most pages, keeping their first occurrence.
+    """
+
+    mode: str = EXTRACT_MODE
+    flags: Optional[int] = None if EXTRACT_FLAGS is None else text_flags(EXTRACT_FLAGS)
+    clip_margins: Optional[Tuple[float, float, float, float]] = EXTRACT_CLIP_MARGINS
+    skip_annotations: bool = EXTRACT_SKIP_ANNOTATIONS
+    strip_repeated: bool = EXTRACT_STRIP_REPEATED
+
+
+DEFAULT_OPTIONS = ExtractOptions()
+
+# Held around every use of PyMuPDF that may run on a thread pool
+MUPDF_LOCK = threading.RLock()
+
+fitz.TOOLS.set_low_memory(MUPDF_LOW_MEMORY)
+
+
+def release_mupdf_store(percent: int = 100) -> None:
+    """
+    Free part of MuPDF's resource store (decoded fonts, images, objects).
+
+    Args:
+        percent (int): Percentage of the store to free; 100 empties it.
+    """
+    fitz.TOOLS.store_shrink(percent)
+
+
+def _load_malloc_trim():
+    """Return glibc's malloc_trim, or None on other C libraries."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+        return libc.malloc_trim
+    except (OSError, AttributeError):
+        return None
+
+
+_malloc_trim = _load_malloc_trim()
+
+# RSS limit set by set_mupdf_store_limit (0: off), and the RSS above which
+# limit_mupdf_store next empties the store
+_store_rss_limit = 0
+_store_rss_threshold = 0
+_store_rss_headroom = 0
+
+
+def set_mupdf_store_limit(rss_limit_mb: float, headroom_mb: float = MUPDF_STORE_RSS_HEADROOM_MB) -> None:
+    """
+    Bound the MuPDF store through the RSS of this process.
+
+    Off by default: worker processes turn it on when they start (see
+    src.bootstrap.init_worker), and short-lived processes do not need it.
+
+    Args:
+        rss_limit_mb (float): RSS in MB above which the store is emptied
+            after a document (0 turns the limit off).
+        headroom_mb (float): Growth in MB, above the RSS left after
+            emptying, before the store is emptied again.
+    """
+    global _store_rss_limit, _store_rss_threshold, _store_rss_headroom
+    _store_rss_limit = _store_rss_threshold = int(rss_limit_mb * 2 ** 20)
+    _store_rss_headroom = int(headroom_mb * 2 ** 20)
+
+
+def limit_mupdf_store() -> bool:
+    """
+    Empty the MuPDF store if the process RSS is above the limit.
+
+    PyMuPDF does not expose the store size or its limit, so process RSS is
+    used as the signal. After emptying, freed heap pages are handed back to
+    the OS where the C library supports it (glibc malloc_trim). Memory the
+    heap cannot return keeps RSS above the limit, so the next threshold is
+    the RSS left after emptying plus the headroom; it falls back to the
+    limit once RSS drops below it.
+
+    Returns:
+        bool: True if the store was emptied.
+    """
+    global _store_rss_threshold
+    if not _store_rss_limit:
+        return False
+    rss = current_rss()
+    if rss <= _store_rss_limit:
+        _store_rss_threshold = _store_rss_limit
+        return False
+    if rss <= _store_rss_threshold:
+        return False
+    release_mupdf_store(100)
+    if _malloc_trim is not None:
+        _malloc_trim(0)
+    remaining = current_rss()
+    _store_rss_threshold = max(_store_rss_limit, remaining + _store_rss_headroom)
+    logger.debug(
+        "Emptied MuPDF store (RSS %d MB, %d MB after)", rss // 2 ** 20, remaining // 2 ** 20
+    )
+    return True
+
+
+def _drop_annotations(page: "fitz.Page") -> None:
+    """Delete the annotations and form fields of an open page (never saved)."""
+    annot = page.first_annot
+    while annot:
+        annot = page.delete_annot(annot)
+    widget = page.first_widget
+    while widget:
+        widget = page.delete_widget(widget)
+
+
+def _page_text(page: "fitz.Page", options: ExtractOptions) -> str:
+    """Extract the text of one page according to options."""
+    clip = None
+    if options.clip_margins:
+        left, top, right, bottom = options.clip_margins
+        # PyMuPDF reports text in unrotated page coordinates, so clip in those
+        rect = page.cropbox
+        clip = fitz.Rect(rect.x0 + left, rect.y0 + top, rect.x1 - right, rect.y1 - bottom)
+
+    if options.skip_annotations:
+        _drop_annotations(page)
+
+    output = page.get_text(options.mode, clip=clip, flags=options.flags)
+    if options.mode == "text":
+        return output
+
+    if options.mode == "blocks":
+        # (x0, y0, x1, y1, text, block_no, block_type); type 1 is an image
+        return "".join(block[4].rstrip("\n") + "\n" for block in output if block[6] == 0)
+
+    # words: (x0, y0, x1, y1, word, block_no, line_no, word_no)
+    lines = []
+    current = None
+    for word in output:
+        line = (word[5], word[6])
+        if line != current:
+            lines.append([])
+            current = line
+        lines[-1].append(word[4])
+    return "".join(" ".join(words) + "\n" for words in lines)
+
+
+def extract_text_from_pdf(
+    pdf_path: str,
+    data: Optional[bytes] = None,
+    options: Optional[ExtractOptions] = None,
+) -> str:
     """
     Extract text from a single PDF file.
     
     Args:
-        pdf_path (str): Path to the PDF file to extract text from.
+        pdf_path (str): Path to the PDF file to extract text from. When
+            ``data`` is given it is only used to label log messages.
+        data (Optional[bytes]): PDF contents already in memory (e.g. an
+            archive member); opened directly without touching the disk.
+        options (Optional[ExtractOptions]): Extraction options (default:
+            config.py settings).
         
     Returns:
         str: Extracted text from all pages of the PDF.
@@ -34,27 +254,41 @@ def extract_text_from_pdf(pdf_path: str) -> str:
         if not pdf_path or not pdf_path.strip():
             raise ValueError("PDF path cannot be empty")
             
-        text = ""
-        with fitz.open(pdf_path) as doc:
-            total_pages = len(doc)
-            logger.debug(f"Opened PDF with {total_pages} pages: {pdf_path}")
+        options = options or DEFAULT_OPTIONS
+        if options.mode not in MODE_FLAGS:
+            raise ValueError(f"Unknown extraction mode: {options.mode}")
+        
+        pages = []
+        with MUPDF_LOCK:
+            source = fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(pdf_path)
+            with source as doc:
+                total_pages = len(doc)
+                logger.debug("Opened PDF with %d pages: %s", total_pages, pdf_path)
+                
+                for page_num, page in enumerate(doc, 1):
+                    try:
+                        page_text = _page_text(page, options)
+                        pages.append(page_text)
+                        logger.debug("Extracted %d chars from page %d/%d", len(page_text), page_num, total_pages)
+                    except Exception as e:
+                        logger.warning("Error extracting page %d: %s", page_num, e)
+                        continue
             
-            for page_num, page in enumerate(doc, 1):
-                try:
-                    page_text = page.get_text()
-                    text += page_text
-                    logger.debug(f"Extracted {len(page_text)} chars from page {page_num}/{total_pages}")
-                except Exception as e:
-                    logger.warning(f"Error extracting page {page_num}: {str(e)}")
-                    continue
+            if MUPDF_STORE_SHRINK_PERCENT > 0:
+                release_mupdf_store(MUPDF_STORE_SHRINK_PERCENT)
+            limit_mupdf_store()
+        
+        if options.strip_repeated:
+            pages = strip_repeated_lines(pages)
+        text = "".join(pages)
         
-        logger.info(f"Successfully extracted {len(text)} characters from {pdf_path}")
+        logger.info("Successfully extracted %d characters from %s", len(text), pdf_path)
         return text
         
     except FileNotFoundError as e:
-        logger.error(f"PDF file not found: {pdf_path}")
+        logger.error("PDF file not found: %s", pdf_path)
         raise
     except Exception as e:
-        logger.error(f"Error extracting text from PDF {pdf_path}: {str(e)}")
+        logger.error("Error extracting text from PDF %s: %s", pdf_path, e)
         raise RuntimeError(f"Failed to extract text from {pdf_path}: {str(e)}")
 
@@ -0,0 +1,240 @@
+"""
+Document Extractors Module
+
+This module maps file types to text extractors so resumes can be read in
+their uploaded format without converting them to PDF first:
+- .pdf: PyMuPDF (src.extract_text)
+- .docx: streaming read of word/document.xml from the DOCX zip
+- .txt: decoded as-is
+
+Only extensions listed in SUPPORTED_EXTENSIONS are accepted, so a file type
+can be switched off in config.py. Files whose extension has no extractor
+(temporary uploads, "resume", "resume.PDF.bak") are recognized by their
+leading bytes instead. process_resume dispatches through extract_text.
+"""
+
+import io
+import os
+import logging
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict, Optional
+
+from config import SUPPORTED_EXTENSIONS, TEXT_FILE_ENCODING, ARCHIVE_MAX_MEMBER_BYTES
+from src.extract_text import extract_text_from_pdf
+
+logger = logging.getLogger(__name__)
+
+Extractor = Callable[..., str]
+
+# Bytes read to recognize a file without a known extension (PDF readers
+# accept a header preceded by up to 1024 bytes of junk)
+_SNIFF_BYTES = 1024
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_TEXT = {
+    _W + "tab": "\t",
+    _W + "br": "\n",
+    _W + "cr": "\n",
+    _W + "noBreakHyphen": "-",
+}
+
+
+def extract_text_from_docx(docx_path: str, data: Optional[bytes] = None) -> str:
+    """
+    Extract text from a DOCX file.
+
+    word/document.xml is parsed incrementally straight from the zip, and
+    each paragraph is discarded once its text has been collected, so large
+    documents are never held as a full XML tree. Deleted tracked changes
+    and field codes are not included.
+
+    Args:
+        docx_path (str): Path to the DOCX file (label only when data is given).
+        data (Optional[bytes]): DOCX contents already in memory.
+
+    Returns:
+        str: Document text, one line per paragraph.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        RuntimeError: If the file is not a valid DOCX.
+    """
+    try:
+        source = io.BytesIO(data) if data is not None else docx_path
+        with zipfile.ZipFile(source) as zf:
+            info = zf.getinfo("word/document.xml")
+            if info.file_size > ARCHIVE_MAX_MEMBER_BYTES:
+                raise ValueError(f"document.xml is {info.file_size} bytes (limit {ARCHIVE_MAX_MEMBER_BYTES})")
+
+            parts = []
+            with zf.open(info) as fh:
+                for _, elem in ET.iterparse(fh, events=("end",)):
+                    tag = elem.tag
+                    if tag == _W + "t":
+                        parts.append(elem.text or "")
+                    elif tag == _W + "p":
+                        parts.append("\n")
+                        elem.clear()
+                    elif tag in _DOCX_TEXT:
+                        parts.append(_DOCX_TEXT[tag])
+
+        text = "".join(parts)
+        logger.info("Successfully extracted %d characters from %s", len(text), docx_path)
+        return text
+
+    except FileNotFoundError:
+        logger.error("DOCX file not found: %s", docx_path)
+        raise
+    except Exception as e:
+        logger.error("Error extracting text from DOCX %s: %s", docx_path, e)
+        raise RuntimeError(f"Failed to extract text from {docx_path}: {str(e)}")
+
+
+def extract_text_from_txt(txt_path: str, data: Optional[bytes] = None) -> str:
+    """
+    Read a plain-text resume.
+
+    Args:
+        txt_path (str): Path to the text file (label only when data is given).
+        data (Optional[bytes]): File contents already in memory.
+
+    Returns:
+        str: Decoded text (a UTF-8 byte order mark is dropped).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    if data is None:
+        with open(txt_path, "rb") as fh:
+            data = fh.read()
+    encoding = "utf-8-sig" if TEXT_FILE_ENCODING.lower().replace("_", "-") in ("utf-8", "utf8") else TEXT_FILE_ENCODING
+    text = data.decode(encoding, errors="replace")
+    logger.info("Read %d characters from %s", len(text), txt_path)
+    return text
+
+
+EXTRACTORS: Dict[str, Extractor] = {
+    ".pdf": extract_text_from_pdf,
+    ".docx": extract_text_from_docx,
+    ".txt": extract_text_from_txt,
+}
+
+
+def register_extractor(extension: str, extractor: Extractor) -> None:
+    """
+    Register (or replace) the extractor for a file extension.
+
+    The extension must also be listed in SUPPORTED_EXTENSIONS to be used.
+
+    Args:
+        extension (str): Extension including the dot, e.g. ".odt".
+        extractor (Extractor): Callable taking (path, data=None) and returning text.
+    """
+    EXTRACTORS[extension.lower()] = extractor
+
+
+def file_type(path: str) -> str:
+    """Return the lower-cased extension of a path, e.g. ".pdf"."""
+    return os.path.splitext(path)[1].lower()
+
+
+def is_supported(path: str) -> bool:
+    """Return True if path has a supported extension with a registered extractor."""
+    extension = file_type(path)
+    return extension in SUPPORTED_EXTENSIONS and extension in EXTRACTORS
+
+
+def sniff_file_type(path: str, data: Optional[bytes] = None) -> str:
+    """
+    Recognize a PDF or DOCX file from its leading bytes.
+
+    Args:
+        path (str): File path (not read when data is given).
+        data (Optional[bytes]): File contents already in memory.
+
+    Returns:
+        str: ".pdf", ".docx", or "" if the type is not recognized or the
+            file cannot be read.
+    """
+    if data is None:
+        try:
+            with open(path, "rb") as fh:
+                head = fh.read(_SNIFF_BYTES)
+        except OSError:
+            return ""
+    else:
+        head = data[:_SNIFF_BYTES]
+
+    if b"%PDF-" in head:
+        return ".pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return ".docx"
+    return ""
+
+
+def detect_file_type(path: str, data: Optional[bytes] = None) -> str:
+    """
+    Return the type a file is extracted as.
+
+    This is the file's extension when an extractor is registered for it,
+    otherwise the type recognized from its leading bytes.
+
+    Args:
+        path (str): File path or display path.
+        data (Optional[bytes]): File contents already in memory.
+
+    Returns:
+        str: Extension including the dot, or "" if the type is unknown.
+    """
+    extension = file_type(path)
+    if extension in EXTRACTORS:
+        return extension
+    sniffed = sniff_file_type(path, data)
+    if sniffed:
+        logger.debug("Treating %s as %s (recognized from its contents)", path, sniffed)
+    return sniffed or extension
+
+
+def get_extractor(path: str, data: Optional[bytes] = None) -> Extractor:
+    """
+    Look up the extractor for a file.
+
+    Args:
+        path (str): File path or display path.
+        data (Optional[bytes]): File contents already in memory, used to
+            recognize files without a known extension.
+
+    Returns:
+        Extractor: Extractor for the file's type.
+
+    Raises:
+        ValueError: If the file type is not supported.
+    """
+    extension = detect_file_type(path, data)
+    if extension not in SUPPORTED_EXTENSIONS or extension not in EXTRACTORS:
+        raise ValueError(f"Unsupported file type: {extension or path}")
+    return EXTRACTORS[extension]
+
+
+def extract_text(path: str, data: Optional[bytes] = None) -> str:
+    """
+    Extract text from a resume of any supported type.
+
+    Args:
+        path (str): File path (or display path when data is given).
+        data (Optional[bytes]): File contents already in memory.
+
+    Returns:
+        str: Extracted text.
+
+    Raises:
+        ValueError: If the file type is not supported.
+
+    Example:
+        >>> text = extract_text("resume.docx")
+    """
+    extractor = get_extractor(path, data)
+    if data is None:
+        return extractor(path)
+    return extractor(path, data=data)
@@ -0,0 +1,216 @@
+"""
+Fuzzy Skill Matching Module
+
+This module finds skills written with typos or split differently from the
+vocabulary ("Pyhton", "Postgre SQL", "Node JS", "Scikit Learn"). Text is
+cut into windows of one to a few words; each window is normalized
+(lowercased, punctuation and spaces removed) and looked up in a SkillIndex:
+- an exact hit on a normalized skill is taken directly
+- otherwise a character n-gram inverted index shortlists the few skills
+  that share enough n-grams to be within the edit budget, and only those
+  are compared with a bounded edit distance
+
+Short skills ("Go", "AWS", "SQL") only match exactly after normalization,
+since a single edit turns them into ordinary words.
+"""
+
+import re
+import logging
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from config import FUZZY_EDIT_THRESHOLDS, FUZZY_NGRAM, FUZZY_MAX_WORDS, FUZZY_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Word characters of a skill; '+' and '#' keep C++ and C# apart from C
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+_PAD = "\x00"
+
+
+def normalize_term(text: str) -> str:
+    """
+    Reduce a skill or text window to the form compared by the index.
+
+    Example:
+        >>> normalize_term("Node JS"), normalize_term("Node.js")
+        ('nodejs', 'nodejs')
+    """
+    return "".join(_WORD.findall(text.lower()))
+
+
+def ngrams(term: str, n: int = FUZZY_NGRAM) -> Counter:
+    """Count the character n-grams of a term padded at both ends."""
+    padded = _PAD * (n - 1) + term + _PAD * (n - 1)
+    return Counter(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (edits plus adjacent transpositions).
+
+    Stops early once every alignment exceeds max_distance.
+
+    Args:
+        a (str): First term.
+        b (str): Second term.
+        max_distance (int): Largest distance of interest.
+
+    Returns:
+        int: The distance, or max_distance + 1 if it is larger.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def allowed_edits(length: int, thresholds: Sequence[int] = FUZZY_EDIT_THRESHOLDS) -> int:
+    """Number of edits tolerated for a normalized skill of this length."""
+    return sum(1 for threshold in thresholds if length >= threshold)
+
+
+class SkillIndex:
+    """
+    Precomputed lookup structure over a skill vocabulary.
+
+    Args:
+        skills (Iterable[str]): Skill vocabulary.
+        n (int): N-gram size.
+        thresholds (Sequence[int]): Normalized lengths at which the first,
+            second, ... edit is tolerated.
+        max_words (int): Largest number of words joined into one window.
+        cache_size (int): Window lookups remembered across documents.
+
+    Example:
+        >>> index = SkillIndex(["Python", "PostgreSQL"])
+        >>> index.find("Pyhton and Postgre SQL")
+        {'Python', 'PostgreSQL'}
+    """
+
+    def __init__(
+        self,
+        skills: Iterable[str],
+        n: int = FUZZY_NGRAM,
+        thresholds: Sequence[int] = FUZZY_EDIT_THRESHOLDS,
+        max_words: int = FUZZY_MAX_WORDS,
+        cache_size: int = FUZZY_CACHE_SIZE,
+    ):
+        self.n = n
+        self.max_words = max_words
+        self.cache_size = cache_size
+
+        self.skills: List[str] = []
+        self.terms: List[str] = []
+        self.edits: List[int] = []
+        self.exact: Dict[str, int] = {}
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for skill in skills:
+            term = normalize_term(skill)
+            if not term or term in self.exact:
+                continue
+            skill_id = len(self.skills)
+            self.skills.append(skill)
+            self.terms.append(term)
+            self.edits.append(allowed_edits(len(term), thresholds))
+            self.exact[term] = skill_id
+            if self.edits[-1]:
+                for gram, count in ngrams(term, n).items():
+                    self.postings.setdefault(gram, []).append((skill_id, count))
+
+        fuzzy_lengths = [len(t) for t, k in zip(self.terms, self.edits) if k]
+        max_edits = max(self.edits, default=0)
+        self.min_length = min(fuzzy_lengths, default=0) - max_edits
+        self.max_length = max(fuzzy_lengths, default=0) + max_edits
+        self.max_window = max([len(t) for t in self.terms] + [self.max_length])
+        self._cache: Dict[str, Optional[int]] = {}
+
+        logger.debug("Built skill index: %d terms, %d n-grams", len(self.terms), len(self.postings))
+
+    def shortlist(self, term: str) -> List[int]:
+        """
+        Skills that share enough n-grams with term to be within their edit budget.
+
+        Each edit changes at most n + 1 of the padded n-grams (n for an
+        insertion, deletion or substitution, n + 1 for a transposition), so a
+        skill with budget k must have at least
+        max(len(skill), len(term)) + n - 1 - k * (n + 1) n-grams in common
+        with term.
+        """
+        shared: Dict[int, int] = {}
+        for gram, count in ngrams(term, self.n).items():
+            for skill_id, skill_count in self.postings.get(gram, ()):
+                shared[skill_id] = shared.get(skill_id, 0) + min(count, skill_count)
+        candidates = []
+        for skill_id, common in shared.items():
+            skill_term, k = self.terms[skill_id], self.edits[skill_id]
+            if abs(len(skill_term) - len(term)) > k:
+                continue
+            if common >= max(len(skill_term), len(term)) + self.n - 1 - k * (self.n + 1):
+                candidates.append(skill_id)
+        return candidates
+
+    def lookup(self, term: str) -> Optional[int]:
+        """
+        Match one normalized window.
+
+        Args:
+            term (str): Normalized text window.
+
+        Returns:
+            Optional[int]: Index of the closest skill (ties go to the
+                earlier skill), or None.
+        """
+        skill_id = self.exact.get(term)
+        if skill_id is not None or not self.min_length <= len(term) <= self.max_length:
+            return skill_id
+        if term in self._cache:
+            return self._cache[term]
+
+        best, best_distance = None, None
+        for candidate in sorted(self.shortlist(term)):
+            k = self.edits[candidate]
+            distance = edit_distance(term, self.terms[candidate], k)
+            if distance <= k and (best_distance is None or distance < best_distance):
+                best, best_distance = candidate, distance
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[term] = best
+        return best
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Find the skills mentioned in text, tolerating typos and spacing.
+
+        Args:
+            text (str): Resume text (or its skills section).
+
+        Returns:
+            Set[str]: Matched skills, spelled as in the vocabulary.
+        """
+        words = _WORD.findall(text.lower())
+        found: Set[int] = set()
+        for start in range(len(words)):
+            term = ""
+            for word in words[start:start + self.max_words]:
+                term += word
+                if len(term) > self.max_window:
+                    break
+                skill_id = self.lookup(term)
+                if skill_id is not None:
+                    found.add(skill_id)
+        return {self.skills[skill_id] for skill_id in found}
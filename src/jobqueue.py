@@ -0,0 +1,315 @@
+"""
+Job Queue Module
+
+This module implements a durable job queue in a single SQLite file, so
+several worker processes on one or more machines can share a batch through
+a common volume. Workers lease one job at a time; a lease expires unless it
+is renewed by heartbeats, so work held by a crashed worker is picked up by
+another one. Failed jobs are retried up to a configurable number of
+attempts.
+
+The database uses SQLite's default rollback journal rather than WAL, since
+WAL requires shared memory and does not work across machines on a network
+filesystem.
+"""
+
+import os
+import time
+import socket
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from config import QUEUE_LEASE_SECONDS, QUEUE_MAX_ATTEMPTS, QUEUE_POLL_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires);
+"""
+
+
+def default_worker_id() -> str:
+    """Return an identifier unique to this process across machines."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class JobQueue:
+    """
+    SQLite-backed job queue with leases, heartbeats and retries.
+
+    Every method opens its own short-lived connection, so one JobQueue can
+    be used from several threads and the file from several processes.
+
+    Args:
+        db_path (str): Path to the SQLite file (created if missing).
+        lease_seconds (float): How long a lease lasts without a heartbeat.
+        max_attempts (int): Leases allowed per job before it is marked failed.
+
+    Example:
+        >>> queue = JobQueue("jobs.sqlite")
+        >>> queue.enqueue(["/shared/resumes/a.pdf"])
+        1
+        >>> job = queue.lease("worker-1")
+        >>> queue.complete(job[0], "worker-1")
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        lease_seconds: float = QUEUE_LEASE_SECONDS,
+        max_attempts: int = QUEUE_MAX_ATTEMPTS,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in autocommit mode and close it afterwards."""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a write transaction that locks out other writers."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def enqueue(self, paths: Iterable[str]) -> int:
+        """
+        Add jobs for the given paths; paths already queued are ignored.
+
+        Args:
+            paths (Iterable[str]): File paths, ideally absolute on the shared volume.
+
+        Returns:
+            int: Number of new jobs.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (path, updated_at) VALUES (?, ?)",
+                ((path, now) for path in paths),
+            )
+            added = conn.total_changes - before
+        logger.info("Enqueued %d new job(s) in %s", added, self.db_path)
+        return added
+
+    def lease(self, worker_id: str) -> Optional[Tuple[int, str]]:
+        """
+        Lease the next pending job, or a job whose lease has expired.
+
+        Jobs whose expired lease already used up all attempts are marked
+        failed instead of being handed out again.
+
+        Args:
+            worker_id (str): Identifier of the leasing worker.
+
+        Returns:
+            Optional[Tuple[int, str]]: (job id, path), or None if no job is available.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, lease_owner = NULL, last_error = ?, updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, "lease expired", now, LEASED, now, self.max_attempts),
+            )
+            row = conn.execute(
+                "SELECT id, path FROM jobs "
+                "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                "ORDER BY id LIMIT 1",
+                (PENDING, LEASED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires = ?, updated_at = ? WHERE id = ?",
+                (LEASED, worker_id, now + self.lease_seconds, now, row[0]),
+            )
+        return row[0], row[1]
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """
+        Extend a lease held by this worker.
+
+        Returns:
+            bool: False if the lease was lost (expired and taken by another worker).
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (now + self.lease_seconds, now, job_id, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def _finish(self, job_id: int, worker_id: str, status: str, error: Optional[str] = None) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, "
+                "last_error = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (status, error, time.time(), job_id, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str) -> bool:
+        """Mark a leased job as done. Returns False if the lease was lost."""
+        return self._finish(job_id, worker_id, DONE)
+
+    def skip(self, job_id: int, worker_id: str, reason: str) -> bool:
+        """Mark a leased job as intentionally not processed (e.g. by triage)."""
+        return self._finish(job_id, worker_id, SKIPPED, reason)
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """
+        Record a failed attempt; the job is retried until max_attempts is reached.
+
+        Returns:
+            bool: False if the lease was lost.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        status = PENDING if row and row[0] < self.max_attempts else FAILED
+        return self._finish(job_id, worker_id, status, error)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count jobs by status.
+
+        Returns:
+            Dict[str, int]: Status to number of jobs (all statuses present).
+        """
+        counts = {status: 0 for status in (PENDING, LEASED, DONE, FAILED, SKIPPED)}
+        with self._connect() as conn:
+            for status, count in conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+                counts[status] = count
+        return counts
+
+    def is_drained(self) -> bool:
+        """Return True when no job is pending or leased."""
+        counts = self.stats()
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+
+class _Heartbeat:
+    """Renew a job lease from a background thread while it is processed."""
+
+    def __init__(self, queue: JobQueue, job_id: int, worker_id: str):
+        self._queue = queue
+        self._job_id = job_id
+        self._worker_id = worker_id
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lease-heartbeat", daemon=True)
+
+    def __enter__(self) -> "_Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        interval = self._queue.lease_seconds / 3
+        while not self._stop.wait(interval):
+            try:
+                if not self._queue.heartbeat(self._job_id, self._worker_id):
+                    logger.warning("Lost lease on job %d", self._job_id)
+                    return
+            except sqlite3.Error as e:
+                logger.warning("Heartbeat for job %d failed: %s", self._job_id, e)
+
+
+def run_worker(
+    queue: JobQueue,
+    handler: Callable[[str], Tuple[str, Any]],
+    stop_event: threading.Event,
+    worker_id: Optional[str] = None,
+    poll_interval: float = QUEUE_POLL_INTERVAL,
+) -> Dict[str, int]:
+    """
+    Lease and handle jobs until the queue is drained or ``stop_event`` is set.
+
+    The handler returns ``(status, detail)`` where status is DONE, SKIPPED or
+    FAILED; an exception counts as a failed attempt. While the handler runs
+    the lease is renewed by heartbeats.
+
+    Args:
+        queue (JobQueue): Queue to work on.
+        handler (Callable[[str], Tuple[str, Any]]): Processes one path.
+        stop_event (threading.Event): Set to stop after the current job.
+        worker_id (Optional[str]): Worker identifier (default: host-pid).
+        poll_interval (float): Wait between lease attempts when no job is
+            available but other workers still hold leases.
+
+    Returns:
+        Dict[str, int]: Number of jobs this worker finished per status.
+    """
+    worker_id = worker_id or default_worker_id()
+    handled = {DONE: 0, SKIPPED: 0, FAILED: 0}
+    logger.info("Worker %s started on %s", worker_id, queue.db_path)
+
+    while not stop_event.is_set():
+        job = queue.lease(worker_id)
+        if job is None:
+            if queue.is_drained():
+                break
+            stop_event.wait(poll_interval)
+            continue
+
+        job_id, path = job
+        try:
+            with _Heartbeat(queue, job_id, worker_id):
+                status, detail = handler(path)
+        except Exception as e:
+            status, detail = FAILED, str(e)
+            logger.error("Job %d (%s) raised: %s", job_id, path, e, exc_info=True)
+
+        if status == DONE:
+            finished = queue.complete(job_id, worker_id)
+        elif status == SKIPPED:
+            finished = queue.skip(job_id, worker_id, str(detail))
+        else:
+            finished = queue.fail(job_id, worker_id, str(detail))
+        if not finished:
+            logger.warning("Job %d finished after its lease was lost; result may be duplicated", job_id)
+        handled[status] += 1
+
+    logger.info("Worker %s stopped: %s", worker_id, handled)
+    return handled
@@ -0,0 +1,192 @@
+"""
+Logging Setup Module
+
+This module configures logging for batch runs. In asynchronous mode log
+records are put on an in-memory queue and a background thread formats and
+writes them to the file and console handlers, so the processing thread never
+blocks on I/O. Per-document sampling keeps INFO/DEBUG records for only a
+fraction of documents; WARNING and above are always kept.
+"""
+
+import zlib
+import queue
+import logging
+import logging.handlers
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Whether INFO/DEBUG records of the current document should be kept
+_document_sampled: ContextVar[bool] = ContextVar("document_sampled", default=True)
+_sample_rate = 1.0
+_listener: Optional[logging.handlers.QueueListener] = None
+# Arguments of the last configure_logging call, for workers that inherit nothing
+_settings: Optional[Dict[str, Any]] = None
+
+# Resolution of the per-document sampling hash
+_SAMPLE_BUCKETS = 10000
+
+
+class DocumentSampleFilter(logging.Filter):
+    """Drop INFO/DEBUG records of documents that were not sampled."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or _document_sampled.get()
+
+
+class _ThreadQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that defers all formatting to the listener thread.
+
+    The stock QueueHandler formats each record in the caller so it can be
+    pickled; the listener here lives in the same process, so the record is
+    enqueued untouched.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def is_document_sampled(name: str, sample_rate: float) -> bool:
+    """
+    Decide whether a document's INFO/DEBUG logs are kept.
+
+    The decision is a stable hash of the name, so the same document is
+    sampled consistently across runs.
+
+    Args:
+        name (str): Document identifier (e.g. file name).
+        sample_rate (float): Fraction of documents to keep (0-1).
+
+    Returns:
+        bool: True if the document's logs are kept.
+    """
+    if sample_rate >= 1:
+        return True
+    bucket = zlib.crc32(name.encode("utf-8", "surrogateescape")) % _SAMPLE_BUCKETS
+    return bucket < sample_rate * _SAMPLE_BUCKETS
+
+
+@contextmanager
+def log_document(name: str) -> Iterator[bool]:
+    """
+    Scope log sampling to the processing of one document.
+
+    Args:
+        name (str): Document identifier.
+
+    Yields:
+        bool: Whether the document's INFO/DEBUG logs are kept.
+
+    Example:
+        >>> with log_document("resume.pdf"):
+        ...     process_resume("resume.pdf")
+    """
+    sampled = is_document_sampled(name, _sample_rate)
+    token = _document_sampled.set(sampled)
+    try:
+        yield sampled
+    finally:
+        _document_sampled.reset(token)
+
+
+def configure_logging(
+    level: int,
+    fmt: str,
+    log_file: Optional[str] = None,
+    async_logging: bool = False,
+    sample_rate: float = 1.0,
+) -> Optional[logging.handlers.QueueListener]:
+    """
+    Configure root logging with console and optional file output.
+
+    Args:
+        level (int): Root log level.
+        fmt (str): Log record format.
+        log_file (Optional[str]): Log file path, or None for console only.
+        async_logging (bool): Write records from a background thread.
+        sample_rate (float): Fraction of documents whose INFO/DEBUG records
+            are kept (see log_document).
+
+    Returns:
+        Optional[logging.handlers.QueueListener]: The running listener in
+            asynchronous mode (call ``stop()`` to flush), otherwise None.
+
+    Raises:
+        ValueError: If sample_rate is outside (0, 1].
+    """
+    global _sample_rate, _listener, _settings
+    if not 0 < sample_rate <= 1:
+        raise ValueError("sample_rate must be in (0, 1]")
+    _sample_rate = sample_rate
+    _settings = {"level": level, "fmt": fmt, "log_file": log_file, "sample_rate": sample_rate}
+
+    formatter = logging.Formatter(fmt)
+    handlers: List[logging.Handler] = [logging.StreamHandler()]
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(level)
+
+    sample_filter = DocumentSampleFilter()
+    listener = None
+    if async_logging:
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = _ThreadQueueHandler(log_queue)
+        queue_handler.addFilter(sample_filter)
+        root.addHandler(queue_handler)
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+    else:
+        for handler in handlers:
+            handler.addFilter(sample_filter)
+            root.addHandler(handler)
+    _listener = listener
+
+    logger.debug(
+        "Logging configured (async=%s, sample rate=%g)", async_logging, sample_rate
+    )
+    return listener
+
+
+def worker_logging_settings() -> Optional[Dict[str, Any]]:
+    """Return the logging configuration to pass to configure_worker_logging."""
+    return _settings
+
+
+def configure_worker_logging(settings: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Let a forked worker process write its own log records.
+
+    A forked child inherits the queue handler but not the listener thread,
+    so queued records would be lost. In asynchronous mode the queue handler
+    is replaced by the listener's file and console handlers; otherwise the
+    inherited configuration is kept. A worker forked from a fork server
+    inherits no configuration and applies ``settings`` (synchronously). Use
+    as a process pool initializer.
+
+    Args:
+        settings (Optional[Dict[str, Any]]): worker_logging_settings() of
+            the parent process.
+    """
+    if settings is not None and _settings is None:
+        configure_logging(**settings)
+        return
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, _ThreadQueueHandler):
+            root.removeHandler(handler)
+    sample_filter = DocumentSampleFilter()
+    for handler in _listener.handlers:
+        handler.addFilter(sample_filter)
+        root.addHandler(handler)
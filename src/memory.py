@@ -0,0 +1,57 @@
+"""
+Process Memory Module
+
+This module measures the memory of the current process (or another one on
+the same host): peak and current RSS, and unique memory (USS). It has no
+dependencies on the rest of the package, so extraction, the worker pool
+and the capacity planner can all use it.
+"""
+
+import os
+import sys
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss() -> int:
+    """Peak resident memory of the current process in bytes (0 if unknown)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux and the BSDs
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss() -> int:
+    """Resident memory of the current process in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return peak_rss()
+
+
+def unique_memory(pid: Optional[int] = None) -> int:
+    """
+    Memory only this process uses (USS: private pages, not shared with its
+    template or siblings) in bytes.
+
+    Args:
+        pid (Optional[int]): Process id (default: the current process).
+
+    Returns:
+        int: Private clean + dirty bytes, or 0 where /proc is unavailable.
+    """
+    total = 0
+    try:
+        with open(f"/proc/{pid or 'self'}/smaps_rollup") as fh:
+            for line in fh:
+                if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                    total += int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return 0
+    return total
@@ -6,10 +6,11 @@ using regex patterns and keyword matching. Each extraction function is specializ
 for a particular field (name, email, skills, education, etc.).
 """
 
-import re
 import logging
 from typing import List, Optional, Dict, Any
-from config import SKILLS_KEYWORDS, EDUCATION_KEYWORDS, EMAIL_PATTERN, PHONE_PATTERN
+from src.contact import find_email, find_phone
+from src.profiles import ParserProfile, DEFAULT_PROFILE
+from src.sections import find_sections, get_section
 
 logger = logging.getLogger(__name__)
 
@@ -41,14 +42,14 @@ def extract_name(text: str) -> Optional[str]:
         
         if name_words:
             name = " ".join(name_words[:2])
-            logger.debug(f"Extracted name: {name}")
+            logger.debug("Extracted name: %s", name)
             return name
         
         logger.warning("Could not extract name from resume")
         return None
         
     except Exception as e:
-        logger.error(f"Error extracting name: {str(e)}")
+        logger.error("Error extracting name: %s", e)
         return None
 
 
@@ -56,6 +57,9 @@ def extract_email(text: str) -> Optional[str]:
     """
     Extract email address from resume text.
     
+    Uses the linear-time scanner in src.contact, so long runs of word
+    characters and dots cannot stall extraction.
+    
     Args:
         text (str): Resume text.
         
@@ -63,17 +67,17 @@ def extract_email(text: str) -> Optional[str]:
         Optional[str]: Email address or None if not found.
     """
     try:
-        match = re.search(EMAIL_PATTERN, text, re.IGNORECASE)
-        if match:
-            email = match.group(0).lower()
-            logger.debug(f"Extracted email: {email}")
+        email = find_email(text)
+        if email:
+            email = email.lower()
+            logger.debug("Extracted email: %s", email)
             return email
         
         logger.debug("No email found in resume")
         return None
         
     except Exception as e:
-        logger.error(f"Error extracting email: {str(e)}")
+        logger.error("Error extracting email: %s", e)
         return None
 
 
@@ -93,21 +97,20 @@ def extract_phone(text: str) -> Optional[str]:
         Optional[str]: Phone number or None if not found.
     """
     try:
-        match = re.search(PHONE_PATTERN, text)
-        if match:
-            phone = match.group(0)
-            logger.debug(f"Extracted phone: {phone}")
+        phone = find_phone(text)
+        if phone:
+            logger.debug("Extracted phone: %s", phone)
             return phone
         
         logger.debug("No phone number found in resume")
         return None
         
     except Exception as e:
-        logger.error(f"Error extracting phone: {str(e)}")
+        logger.error("Error extracting phone: %s", e)
         return None
 
 
-def extract_education(text: str) -> Optional[str]:
+def extract_education(text: str, profile: Optional[ParserProfile] = None) -> Optional[str]:
     """
     Extract education qualification from resume text.
     
@@ -115,55 +118,63 @@ def extract_education(text: str) -> Optional[str]:
     
     Args:
         text (str): Resume text.
+        profile (Optional[ParserProfile]): Vocabularies to match (default: config.py).
         
     Returns:
         Optional[str]: First matched education degree or None.
     """
     try:
         text_lower = text.lower()
+        profile = profile or DEFAULT_PROFILE
         
-        for keyword in EDUCATION_KEYWORDS:
-            if keyword.lower() in text_lower:
-                logger.debug(f"Extracted education: {keyword}")
+        for keyword, keyword_lower in profile.education_lower:
+            if keyword_lower in text_lower:
+                logger.debug("Extracted education: %s", keyword)
                 return keyword
         
         logger.debug("No education qualifications found in resume")
         return None
         
     except Exception as e:
-        logger.error(f"Error extracting education: {str(e)}")
+        logger.error("Error extracting education: %s", e)
         return None
 
 
-def extract_skills(text: str) -> List[str]:
+def extract_skills(text: str, profile: Optional[ParserProfile] = None) -> List[str]:
     """
     Extract technical and professional skills from resume text.
     
     Performs case-insensitive matching against a predefined skills database.
+    Profiles built with fuzzy=True also match misspelled or differently
+    spaced skills ("Pyhton", "Node JS") through their SkillIndex.
     
     Args:
         text (str): Resume text.
+        profile (Optional[ParserProfile]): Vocabularies to match (default: config.py).
         
     Returns:
         List[str]: List of found skills (empty list if none found).
     """
     try:
         text_lower = text.lower()
-        found_skills = []
+        profile = profile or DEFAULT_PROFILE
         
-        for skill in SKILLS_KEYWORDS:
-            if skill.lower() in text_lower and skill not in found_skills:
-                found_skills.append(skill)
+        # Profile vocabularies are already de-duplicated
+        fuzzy_skills = profile.skill_index.find(text) if profile.skill_index else ()
+        found_skills = [
+            skill for skill, skill_lower in profile.skills_lower
+            if skill_lower in text_lower or skill in fuzzy_skills
+        ]
         
-        logger.debug(f"Extracted {len(found_skills)} skills")
+        logger.debug("Extracted %d skills", len(found_skills))
         return found_skills
         
     except Exception as e:
-        logger.error(f"Error extracting skills: {str(e)}")
+        logger.error("Error extracting skills: %s", e)
         return []
 
 
-def parse_resume(text: str) -> Dict[str, Any]:
+def parse_resume(text: str, profile: Optional[ParserProfile] = None) -> Dict[str, Any]:
     """
     Parse resume text and extract all structured information.
     
@@ -171,8 +182,17 @@ def parse_resume(text: str) -> Dict[str, Any]:
     the extraction of all individual fields and returns a dictionary
     with the complete structured resume data.
     
+    Section headers are detected once up front; education and skills are
+    then extracted from their own sections only, falling back to the full
+    text when a resume has no such section.
+    
+    A profile bundles the skill, education and section-header vocabularies
+    with their compiled matchers; pass one from get_profile to parse with a
+    client's own vocabularies without recompiling anything per call.
+    
     Args:
         text (str): Preprocessed resume text.
+        profile (Optional[ParserProfile]): Vocabularies to use (default: config.py).
         
     Returns:
         Dict[str, Any]: Dictionary containing:
@@ -185,19 +205,23 @@ def parse_resume(text: str) -> Dict[str, Any]:
     try:
         logger.debug("Starting resume parsing...")
         
+        profile = profile or DEFAULT_PROFILE
+        sections = find_sections(text, profile.header_pattern)
+        
         parsed_data = {
             "Name": extract_name(text),
             "Email": extract_email(text),
             "Phone": extract_phone(text),
-            "Education": extract_education(text),
-            "Skills": extract_skills(text),
+            "Education": extract_education(get_section(text, sections, "education"), profile),
+            "Skills": extract_skills(get_section(text, sections, "skills"), profile),
         }
         
-        logger.info(f"Successfully parsed resume with {len([v for v in parsed_data.values() if v])} fields")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Successfully parsed resume with %d fields", sum(1 for v in parsed_data.values() if v))
         return parsed_data
         
     except Exception as e:
-        logger.error(f"Error parsing resume: {str(e)}")
+        logger.error("Error parsing resume: %s", e)
         return {
             "Name": None,
             "Email": None,
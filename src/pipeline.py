@@ -2,7 +2,7 @@
 Resume Processing Pipeline Module
 
 This module orchestrates the complete resume processing workflow:
-1. Extract text from PDF
+1. Extract text from the document (PDF, DOCX or TXT)
 2. Preprocess and normalize text
 3. Parse and extract structured information
 
@@ -13,25 +13,46 @@ import os
 import logging
 from typing import Dict, Any, Optional
 
-from src.extract_text import extract_text_from_pdf
+from src.extractors import extract_text, get_extractor
 from src.preprocess import normalize_text
 from src.parser import parse_resume
+from src.profiles import ParserProfile
+from src.profiling import stage
+from src.cache import ResultCache, content_key, default_cache
 
 logger = logging.getLogger(__name__)
 
 
-def process_resume(pdf_path: str) -> Optional[Dict[str, Any]]:
+def process_resume(
+    pdf_path: str,
+    data: Optional[bytes] = None,
+    profile: Optional[ParserProfile] = None,
+    cache: Optional[ResultCache] = None,
+    use_cache: bool = True,
+) -> Optional[Dict[str, Any]]:
     """
-    Process a single resume PDF and extract structured information.
+    Process a single resume and extract structured information.
     
     This function executes the complete pipeline:
-    1. Extract raw text from PDF
+    1. Extract raw text with the extractor for the file type
     2. Normalize and clean text
     3. Parse structured fields (name, email, skills, education)
     4. Add metadata (filename)
     
+    With a result cache, steps 1-3 are skipped for a file whose content
+    was parsed before with the same parser configuration.
+    
     Args:
-        pdf_path (str): Full path to the resume PDF file.
+        pdf_path (str): Full path to the resume file (.pdf, .docx or .txt).
+            When ``data`` is given this is the display path stored in
+            File/FilePath (e.g. "/data/export.zip/batch1/john.pdf" or
+            "s3://bucket/john.pdf").
+        data (Optional[bytes]): File contents already in memory.
+        profile (Optional[ParserProfile]): Parser vocabularies (default: config.py).
+        cache (Optional[ResultCache]): Result cache (default: the shared cache
+            if RESULT_CACHE_ENABLED, else none).
+        use_cache (bool): False always extracts and parses, e.g. when timing
+            the pipeline.
         
     Returns:
         Optional[Dict[str, Any]]: Dictionary with parsed resume data and metadata.
@@ -48,32 +69,60 @@ def process_resume(pdf_path: str) -> Optional[Dict[str, Any]]:
         if not pdf_path or not pdf_path.strip():
             raise ValueError("PDF path cannot be empty")
         
-        logger.info(f"Processing resume: {pdf_path}")
+        logger.info("Processing resume: %s", pdf_path)
+        
+        cache = (cache or default_cache()) if use_cache else None
+        key = None
+        if cache is not None:
+            if data is None:
+                with open(pdf_path, "rb") as fh:
+                    data = fh.read()
+            extractor = get_extractor(pdf_path, data)
+            key = content_key(data, profile, f"{extractor.__module__}.{extractor.__qualname__}")
+            parsed_data = cache.get(key)
+            if parsed_data is not None:
+                logger.debug("Result cache hit for %s", pdf_path)
+                return _add_metadata(parsed_data, pdf_path)
         
-        # Step 1: Extract text from PDF
-        logger.debug("Extracting text from PDF...")
-        raw_text = extract_text_from_pdf(pdf_path)
+        # Step 1: Extract text (dispatched by file type)
+        logger.debug("Extracting text...")
+        with stage("extract"):
+            if data is None:
+                raw_text = extract_text(pdf_path)
+            else:
+                raw_text = extract_text(pdf_path, data=data)
         
         if not raw_text or not raw_text.strip():
-            logger.warning(f"No text extracted from {pdf_path}")
+            logger.warning("No text extracted from %s", pdf_path)
             return None
         
         # Step 2: Preprocess text
         logger.debug("Preprocessing text...")
-        clean_text = normalize_text(raw_text)
+        with stage("normalize"):
+            clean_text = normalize_text(raw_text)
         
         # Step 3: Parse resume
         logger.debug("Parsing resume information...")
-        parsed_data = parse_resume(clean_text)
+        with stage("parse"):
+            parsed_data = parse_resume(clean_text, profile)
+        
+        if key is not None:
+            cache.put(key, parsed_data)
         
         # Step 4: Add metadata
-        parsed_data["File"] = os.path.basename(pdf_path)
-        parsed_data["FilePath"] = os.path.abspath(pdf_path)
+        _add_metadata(parsed_data, pdf_path)
         
-        logger.info(f"Successfully processed: {os.path.basename(pdf_path)}")
+        logger.info("Successfully processed: %s", os.path.basename(pdf_path))
         return parsed_data
         
     except Exception as e:
-        logger.error(f"Error processing resume {pdf_path}: {str(e)}")
+        logger.error("Error processing resume %s: %s", pdf_path, e)
         return None
 
+
+def _add_metadata(parsed_data: Dict[str, Any], pdf_path: str) -> Dict[str, Any]:
+    """Add File and FilePath for the path the resume was processed as."""
+    parsed_data["File"] = os.path.basename(pdf_path)
+    # Object store URIs (s3://bucket/key) are kept as they are
+    parsed_data["FilePath"] = pdf_path if "://" in pdf_path else os.path.abspath(pdf_path)
+    return parsed_data
@@ -0,0 +1,360 @@
+"""
+Capacity Planner Module
+
+This module predicts how long a batch will take before it is started. It
+processes a stratified sample of the input with the real pipeline and
+extrapolates wall time, CPU-hours and peak memory for several worker
+counts.
+
+Sampling is done in two phases so a 500k-document input is never read in
+full:
+1. A uniform random pool of candidates is read for their file size and
+   page count, which places each candidate in a stratum (file type x size
+   quantile x page count class).
+2. The measured sample is drawn from the pool, proportionally per stratum
+   (at least one document per stratum), and each document's per-stage
+   wall and CPU seconds are recorded.
+
+Totals are stratified estimates (stratum mean x estimated stratum size)
+with a 95% confidence interval. Predictions assume each worker gets its own
+CPU; memory is the peak RSS of one worker times the worker count.
+"""
+
+import math
+import time
+import random
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import fitz  # PyMuPDF
+import numpy as np
+
+from config import (
+    PLAN_SAMPLE_SIZE,
+    PLAN_CANDIDATE_FACTOR,
+    PLAN_SIZE_BINS,
+    PLAN_PAGE_CLASSES,
+    PLAN_WORKER_COUNTS,
+    PLAN_SEED,
+    TRIAGE_ENABLED,
+)
+from src.extractors import file_type
+from src.pipeline import process_resume
+from src.profiling import StageTimer, stage
+from src.storage import StorageBackend
+from src.triage import probe_pdf, SCANNED, SUSPICIOUS
+from src.memory import peak_rss
+
+logger = logging.getLogger(__name__)
+
+# z value of the two-sided 95% confidence interval
+_Z95 = 1.96
+
+Stratum = Tuple[str, int, int]
+
+
+class Candidate(NamedTuple):
+    """A document of the candidate pool."""
+
+    key: str
+    size: int
+    pages: int
+    fetch_wall: float
+    fetch_cpu: float
+
+
+def page_count(name: str, data: bytes) -> int:
+    """
+    Return the page count of a PDF (0 for other types or unreadable files).
+
+    Args:
+        name (str): File name (used for the type).
+        data (bytes): File contents.
+    """
+    if file_type(name) != ".pdf":
+        return 0
+    try:
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def _page_class(pages: int, classes: Sequence[int]) -> int:
+    """Index of the first class whose upper bound holds pages."""
+    for index, bound in enumerate(classes):
+        if pages <= bound:
+            return index
+    return len(classes)
+
+
+def stratify(
+    candidates: Sequence[Candidate],
+    size_bins: int = PLAN_SIZE_BINS,
+    page_classes: Sequence[int] = PLAN_PAGE_CLASSES,
+) -> Tuple[Dict[Stratum, List[Candidate]], List[float]]:
+    """
+    Group candidates by file type, size quantile and page count class.
+
+    Args:
+        candidates (Sequence[Candidate]): Candidate pool.
+        size_bins (int): Number of size quantile bins.
+        page_classes (Sequence[int]): Upper bounds of the page classes.
+
+    Returns:
+        Tuple[Dict[Stratum, List[Candidate]], List[float]]: Candidates per
+            (type, size bin, page class) and the size bin edges.
+    """
+    sizes = [c.size for c in candidates]
+    edges = list(np.quantile(sizes, [i / size_bins for i in range(1, size_bins)])) if sizes else []
+    strata: Dict[Stratum, List[Candidate]] = {}
+    for candidate in candidates:
+        size_bin = int(np.searchsorted(edges, candidate.size, side="left"))
+        key = (file_type(candidate.key), size_bin, _page_class(candidate.pages, page_classes))
+        strata.setdefault(key, []).append(candidate)
+    return strata, edges
+
+
+def allocate(strata: Dict[Stratum, List[Candidate]], sample_size: int) -> Dict[Stratum, int]:
+    """
+    Split the sample size over strata in proportion to their pool share.
+
+    Every stratum gets at least one document, so the sample can exceed
+    sample_size when there are many small strata.
+
+    Args:
+        strata (Dict[Stratum, List[Candidate]]): Candidates per stratum.
+        sample_size (int): Documents to measure.
+
+    Returns:
+        Dict[Stratum, int]: Documents to measure per stratum.
+    """
+    pool = sum(len(members) for members in strata.values())
+    return {
+        key: min(len(members), max(1, round(sample_size * len(members) / pool)))
+        for key, members in strata.items()
+    }
+
+
+def _stratified_total(
+    population: int,
+    weights: Dict[Stratum, float],
+    values: Dict[Stratum, List[float]],
+) -> Tuple[float, float]:
+    """
+    Estimate a population total and its 95% confidence half-width.
+
+    Args:
+        population (int): Documents in the input.
+        weights (Dict[Stratum, float]): Share of the population per stratum.
+        values (Dict[Stratum, List[float]]): Measurements per stratum.
+
+    Returns:
+        Tuple[float, float]: Estimated total and half-width of its interval.
+    """
+    everything = [v for vs in values.values() for v in vs]
+    pooled_var = float(np.var(everything, ddof=1)) if len(everything) > 1 else 0.0
+    mean = 0.0
+    variance = 0.0
+    for key, weight in weights.items():
+        vs = values[key]
+        mean += weight * float(np.mean(vs))
+        # Strata with a single measurement borrow the pooled variance
+        var = float(np.var(vs, ddof=1)) if len(vs) > 1 else pooled_var
+        variance += weight ** 2 * var / len(vs)
+    return population * mean, _Z95 * population * math.sqrt(variance)
+
+
+def _measure(backend: StorageBackend, key: str, triage: bool, timer: StageTimer) -> Dict[str, Dict[str, float]]:
+    """Process one document with the real pipeline and return its stage costs."""
+    data = backend.read(key)
+    path = backend.display_path(key)
+    with timer.document() as stages:
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            if triage and file_type(key) == ".pdf":
+                with stage("triage"):
+                    probe = probe_pdf(path, data=data)
+                if probe["category"] in (SCANNED, SUSPICIOUS):
+                    return _with_other(stages, wall, cpu)
+            # Cache hits would make the sample look cheaper than the backfill
+            process_resume(path, data=data, use_cache=False)
+        except Exception as e:
+            logger.warning("Plan: error processing %s: %s", key, e)
+        return _with_other(stages, wall, cpu)
+
+
+def _with_other(stages: Dict[str, Dict[str, float]], wall: float, cpu: float) -> Dict[str, Dict[str, float]]:
+    """Copy stage costs and add the time spent outside any stage (logging, metadata)."""
+    result = dict(stages)
+    result["other"] = {
+        "wall": max(0.0, time.perf_counter() - wall - sum(s["wall"] for s in stages.values())),
+        "cpu": max(0.0, time.process_time() - cpu - sum(s["cpu"] for s in stages.values())),
+    }
+    return result
+
+
+def plan_capacity(
+    backend: StorageBackend,
+    sample_size: int = PLAN_SAMPLE_SIZE,
+    worker_counts: Sequence[int] = PLAN_WORKER_COUNTS,
+    triage: bool = TRIAGE_ENABLED,
+    seed: int = PLAN_SEED,
+    candidate_factor: int = PLAN_CANDIDATE_FACTOR,
+) -> Dict[str, Any]:
+    """
+    Measure a stratified sample and predict the cost of the full input.
+
+    Args:
+        backend (StorageBackend): Input documents.
+        sample_size (int): Documents to measure.
+        worker_counts (Sequence[int]): Worker counts to predict for.
+        triage (bool): Probe PDFs first, as the batch run would.
+        seed (int): Random seed for candidate and sample selection.
+        candidate_factor (int): Candidates read per sampled document.
+
+    Returns:
+        Dict[str, Any]: JSON-serializable plan with the per-document and
+            per-stage costs, the strata and one prediction per worker count.
+
+    Raises:
+        ValueError: If sample_size is not positive.
+
+    Example:
+        >>> plan = plan_capacity(LocalStorage("/data/backfill"), sample_size=100)
+        >>> plan["predictions"][-1]["wall_hours"]
+    """
+    if sample_size <= 0:
+        raise ValueError("sample_size must be positive")
+
+    rng = random.Random(seed)
+    keys = list(backend.list())
+    population = len(keys)
+    if not population:
+        raise ValueError("No documents to plan for")
+
+    # Phase 1: candidate pool, read for size and page count
+    pool_keys = rng.sample(keys, min(population, sample_size * candidate_factor))
+    candidates = []
+    for key in pool_keys:
+        wall, cpu = time.perf_counter(), time.process_time()
+        data = backend.read(key)
+        fetch_wall, fetch_cpu = time.perf_counter() - wall, time.process_time() - cpu
+        candidates.append(Candidate(key, len(data), page_count(key, data), fetch_wall, fetch_cpu))
+    strata, edges = stratify(candidates)
+    allocation = allocate(strata, sample_size)
+
+    # Phase 2: measure the sample with the real pipeline
+    sample = {key: rng.sample(strata[key], count) for key, count in allocation.items()}
+    first = next(iter(sample.values()))[0]
+    with StageTimer() as timer:
+        _measure(backend, first.key, triage, timer)  # warm-up, not counted
+        measurements: Dict[Stratum, List[Dict[str, Dict[str, float]]]] = {}
+        for key, members in sample.items():
+            for candidate in members:
+                stages = _measure(backend, candidate.key, triage, timer)
+                stages["fetch"] = {"wall": candidate.fetch_wall, "cpu": candidate.fetch_cpu}
+                measurements.setdefault(key, []).append(stages)
+    worker_rss = peak_rss()
+
+    weights = {key: len(members) / len(candidates) for key, members in strata.items()}
+
+    def total(metric: str, stage_name: Optional[str] = None) -> Tuple[float, float]:
+        values = {
+            key: [
+                sum(s[metric] for name, s in stages.items() if stage_name in (None, name))
+                for stages in docs
+            ]
+            for key, docs in measurements.items()
+        }
+        return _stratified_total(population, weights, values)
+
+    wall_total, wall_ci = total("wall")
+    cpu_total, cpu_ci = total("cpu")
+    stage_names = sorted({name for docs in measurements.values() for stages in docs for name in stages})
+
+    predictions = []
+    for workers in worker_counts:
+        predictions.append({
+            "workers": workers,
+            "wall_hours": wall_total / workers / 3600,
+            "wall_hours_ci": wall_ci / workers / 3600,
+            "docs_per_sec": population * workers / wall_total if wall_total else None,
+            "cpu_hours": cpu_total / 3600,
+            "peak_memory_gb": workers * worker_rss / 2 ** 30,
+        })
+
+    return {
+        "documents": population,
+        "candidates": len(candidates),
+        "sampled": sum(len(docs) for docs in measurements.values()),
+        "seed": seed,
+        "size_bin_edges": edges,
+        "per_document": {
+            "wall_ms": wall_total / population * 1000,
+            "cpu_ms": cpu_total / population * 1000,
+        },
+        "stages_ms": {
+            name: {
+                "wall": total("wall", name)[0] / population * 1000,
+                "cpu": total("cpu", name)[0] / population * 1000,
+            }
+            for name in stage_names
+        },
+        "total_wall_hours": wall_total / 3600,
+        "total_wall_hours_ci": wall_ci / 3600,
+        "total_cpu_hours": cpu_total / 3600,
+        "total_cpu_hours_ci": cpu_ci / 3600,
+        "worker_peak_rss_mb": worker_rss / 2 ** 20,
+        "strata": [
+            {
+                "type": key[0],
+                "size_bin": key[1],
+                "page_class": key[2],
+                "share": weights[key],
+                "sampled": len(measurements[key]),
+                "mean_wall_ms": float(np.mean([sum(s["wall"] for s in d.values()) for d in measurements[key]])) * 1000,
+            }
+            for key in sorted(measurements)
+        ],
+        "predictions": predictions,
+    }
+
+
+def _duration(hours: float) -> str:
+    """Format hours as e.g. '2d 03:15' or '00:42:10'."""
+    seconds = int(round(hours * 3600))
+    days, seconds = divmod(seconds, 86400)
+    hh, rem = divmod(seconds, 3600)
+    mm, ss = divmod(rem, 60)
+    if days:
+        return f"{days}d {hh:02d}:{mm:02d}"
+    return f"{hh:02d}:{mm:02d}:{ss:02d}"
+
+
+def format_plan(plan: Dict[str, Any]) -> List[str]:
+    """
+    Render a plan as table lines.
+
+    Args:
+        plan (Dict[str, Any]): Result of plan_capacity.
+
+    Returns:
+        List[str]: Header lines, per-stage costs and the prediction table.
+    """
+    per_doc = plan["per_document"]
+    lines = [
+        f"{plan['documents']} document(s); measured {plan['sampled']} from a pool of {plan['candidates']}",
+        f"Per document: {per_doc['wall_ms']:.1f} ms wall, {per_doc['cpu_ms']:.1f} ms CPU; "
+        f"worker peak RSS {plan['worker_peak_rss_mb']:.0f} MB",
+        "Per stage (ms wall / CPU): " + ", ".join(
+            f"{name} {cost['wall']:.1f}/{cost['cpu']:.1f}" for name, cost in plan["stages_ms"].items()
+        ),
+        f"{'workers':>8}{'wall time':>14}{'+/-':>10}{'docs/s':>10}{'CPU-hours':>11}{'peak mem GB':>13}",
+    ]
+    for row in plan["predictions"]:
+        lines.append(
+            f"{row['workers']:>8}{_duration(row['wall_hours']):>14}{_duration(row['wall_hours_ci']):>10}"
+            f"{row['docs_per_sec'] or 0:>10.1f}{row['cpu_hours']:>11.2f}{row['peak_memory_gb']:>13.2f}"
+        )
+    return lines
@@ -8,7 +8,9 @@ for pattern matching and information extraction.
 
 import re
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import REPEATED_LINE_EDGE, REPEATED_LINE_MIN_PAGES
 
 logger = logging.getLogger(__name__)
 
@@ -46,11 +48,11 @@ def normalize_text(text: str) -> str:
         # Strip leading/trailing whitespace
         text = text.strip()
         
-        logger.debug(f"Normalized text from {len(text)} to {len(text)} characters")
+        logger.debug("Normalized text to %d characters", len(text))
         return text
         
     except Exception as e:
-        logger.error(f"Error normalizing text: {str(e)}")
+        logger.error("Error normalizing text: %s", e)
         return text
 
 
@@ -76,3 +78,86 @@ def clean_text(text: str, remove_special: bool = False) -> str:
     
     return text
 
+
+# Page numbers: "Page 2" or "Page 2 of 3" anywhere in a line, and lines
+# that are only "2", "- 2 -", "2/3" or "2 of 3" (not dates such as 01/2020)
+_PAGE_NUMBER = re.compile(
+    r"\bpage\s+\d{1,3}(?:\s*(?:of|/)\s*\d{1,3})?\b"
+    r"|^[-\u2013(\s]*\d{1,3}(?:\s*(?:/|of)\s*\d{1,3})?[-\u2013)\s]*$",
+    re.IGNORECASE,
+)
+
+
+def _line_key(line: str) -> str:
+    """Compare lines ignoring spacing and page numbers ("Page 2 of 3" ~ "Page 3 of 3")."""
+    return _PAGE_NUMBER.sub("#", " ".join(line.split()))
+
+
+def strip_repeated_lines(
+    pages: Sequence[str],
+    edge_lines: int = REPEATED_LINE_EDGE,
+    min_pages: int = REPEATED_LINE_MIN_PAGES,
+) -> List[str]:
+    """
+    Remove page headers and footers repeated across pages.
+
+    A line is a header or footer when the same text sits at the same
+    position on at least min_pages pages and on more than half of the
+    pages, where the position is its rank among the first or last
+    edge_lines non-blank lines of the page (at most half the page's lines
+    from each end). Only spacing and page numbers ("Page 2 of 3", "2/3")
+    are ignored when comparing, so dates and headings that merely look
+    alike on two pages are kept. Its first occurrence is kept, so the name
+    and contact line on page one still reach the parser.
+
+    Args:
+        pages (Sequence[str]): Text of each page, in order.
+        edge_lines (int): Lines at the top and bottom of a page considered.
+        min_pages (int): Pages a line must repeat on to be removed.
+
+    Returns:
+        List[str]: Page texts without the repeated lines.
+
+    Example:
+        >>> strip_repeated_lines(["CV\\nJohn\\n1/3\\n", "CV\\nPython\\n2/3\\n", "CV\\nSQL\\n3/3\\n"])
+        ['CV\\nJohn\\n1/3\\n', 'Python\\n', 'SQL\\n']
+    """
+    # A repeated line must also appear on most pages
+    min_pages = max(min_pages, len(pages) // 2 + 1)
+    if len(pages) < max(min_pages, 2) or edge_lines <= 0:
+        return list(pages)
+
+    split = [page.split("\n") for page in pages]
+    candidates: List[Dict[int, Tuple[str, int, str]]] = []
+    first_page: Dict[Tuple[str, int, str], int] = {}
+    page_counts: Dict[Tuple[str, int, str], int] = {}
+    for page_num, lines in enumerate(split):
+        filled = [i for i, line in enumerate(lines) if line.strip()]
+        # Top and bottom edges never overlap, so a page keeps its body
+        edge = min(edge_lines, len(filled) // 2)
+        positions: Dict[int, Tuple[str, int, str]] = {}
+        for rank in range(edge):
+            top, bottom = filled[rank], filled[-1 - rank]
+            positions[top] = ("top", rank, _line_key(lines[top]))
+            positions[bottom] = ("bottom", rank, _line_key(lines[bottom]))
+        for key in positions.values():
+            if key not in first_page:
+                first_page[key] = page_num
+                page_counts[key] = 0
+            page_counts[key] += 1
+        candidates.append(positions)
+
+    removed = 0
+    stripped = list(pages)
+    for page_num, (lines, positions) in enumerate(zip(split, candidates)):
+        drop = {
+            i for i, key in positions.items()
+            if page_counts[key] >= min_pages and first_page[key] != page_num
+        }
+        if drop:
+            removed += len(drop)
+            stripped[page_num] = "\n".join(line for i, line in enumerate(lines) if i not in drop)
+
+    if removed:
+        logger.debug("Removed %d repeated header/footer lines from %d pages", removed, len(pages))
+    return stripped
@@ -0,0 +1,231 @@
+"""
+Parser Profiles Module
+
+This module bundles the vocabularies used by the parser (skills, education
+keywords and section headers) into a ParserProfile whose matchers are
+compiled once. Different clients can use different vocabularies in the same
+process by passing their own profile to parse_resume. Profiles are cached
+by their contents, so a warm process serving many tenants never recompiles
+a profile it has already seen.
+"""
+
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from config import SKILLS_KEYWORDS, EDUCATION_KEYWORDS, SECTION_HEADERS, PROFILE_CACHE_SIZE, SKILLS_FUZZY
+from src.fuzzy import SkillIndex
+from src.sections import compile_header_pattern
+
+logger = logging.getLogger(__name__)
+
+
+def _unique(items: Iterable[str]) -> Tuple[str, ...]:
+    """Drop duplicates while keeping the first occurrence order."""
+    return tuple(dict.fromkeys(items))
+
+
+def profile_hash(
+    skills_keywords: Iterable[str],
+    education_keywords: Iterable[str],
+    section_headers: Dict[str, List[str]],
+    fuzzy: bool = False,
+) -> str:
+    """
+    Compute the content hash that identifies a profile.
+
+    Args:
+        skills_keywords (Iterable[str]): Skill vocabulary.
+        education_keywords (Iterable[str]): Education keywords, in priority order.
+        section_headers (Dict[str, List[str]]): Section name to header phrases.
+        fuzzy (bool): Whether skills are matched fuzzily.
+
+    Returns:
+        str: Hex SHA-256 of the canonical JSON form of the vocabularies.
+    """
+    canonical = json.dumps(
+        {
+            "skills": list(_unique(skills_keywords)),
+            "education": list(_unique(education_keywords)),
+            "sections": {name: list(phrases) for name, phrases in sorted(section_headers.items())},
+            "fuzzy": bool(fuzzy),
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ParserProfile:
+    """
+    Vocabularies and compiled matchers used by parse_resume.
+
+    Instances are immutable after construction; build them with
+    get_profile to reuse compiled profiles across calls.
+
+    Args:
+        skills_keywords (Iterable[str]): Skill vocabulary (case-insensitive match).
+        education_keywords (Iterable[str]): Education keywords; the first one
+            found in list order is reported.
+        section_headers (Dict[str, List[str]]): Section name to header phrases.
+        name (Optional[str]): Label for logs (e.g. tenant name).
+        fuzzy (bool): Also match skills with typos or different spacing
+            through a precomputed SkillIndex (see src/fuzzy.py).
+
+    Example:
+        >>> profile = get_profile(skills_keywords=["Python", "Kotlin"])
+        >>> parse_resume(text, profile=profile)["Skills"]
+        ['Kotlin']
+    """
+
+    def __init__(
+        self,
+        skills_keywords: Iterable[str] = SKILLS_KEYWORDS,
+        education_keywords: Iterable[str] = EDUCATION_KEYWORDS,
+        section_headers: Optional[Dict[str, List[str]]] = None,
+        name: Optional[str] = None,
+        fuzzy: bool = SKILLS_FUZZY,
+    ):
+        section_headers = SECTION_HEADERS if section_headers is None else section_headers
+
+        self.skills: Tuple[str, ...] = _unique(skills_keywords)
+        self.education: Tuple[str, ...] = _unique(education_keywords)
+        # Sorted by section name, the order profile_hash and the header
+        # pattern use
+        self.section_headers: Dict[str, Tuple[str, ...]] = {
+            section: tuple(phrases) for section, phrases in sorted(section_headers.items())
+        }
+        self.fuzzy = bool(fuzzy)
+        self.hash = profile_hash(self.skills, self.education, section_headers, self.fuzzy)
+        self.name = name or self.hash[:12]
+
+        # Compiled matchers
+        self.skills_lower: Tuple[Tuple[str, str], ...] = tuple((s, s.lower()) for s in self.skills)
+        self.education_lower: Tuple[Tuple[str, str], ...] = tuple((k, k.lower()) for k in self.education)
+        self.header_pattern: Pattern = compile_header_pattern(section_headers)
+        self.skill_index: Optional[SkillIndex] = SkillIndex(self.skills) if self.fuzzy else None
+
+        logger.debug("Compiled parser profile %s (%d skills)", self.name, len(self.skills))
+
+    def __repr__(self) -> str:
+        return (
+            f"ParserProfile(name={self.name!r}, skills={len(self.skills)}, "
+            f"education={len(self.education)}, fuzzy={self.fuzzy})"
+        )
+
+
+def _cache_key(
+    skills_keywords: Iterable[str],
+    education_keywords: Iterable[str],
+    section_headers: Dict[str, List[str]],
+    fuzzy: bool,
+) -> Tuple:
+    """Hashable form of the vocabularies; much cheaper than profile_hash on every lookup."""
+    return (
+        tuple(skills_keywords),
+        tuple(education_keywords),
+        tuple((section, tuple(phrases)) for section, phrases in sorted(section_headers.items())),
+        bool(fuzzy),
+    )
+
+
+class ProfileCache:
+    """
+    Thread-safe LRU cache of compiled profiles keyed by their vocabularies.
+
+    Args:
+        maxsize (int): Maximum number of profiles kept.
+    """
+
+    def __init__(self, maxsize: int = PROFILE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._profiles: "OrderedDict[Tuple, ParserProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def get(
+        self,
+        skills_keywords: Iterable[str],
+        education_keywords: Iterable[str],
+        section_headers: Dict[str, List[str]],
+        name: Optional[str] = None,
+        fuzzy: bool = SKILLS_FUZZY,
+    ) -> ParserProfile:
+        """Return the cached profile for these vocabularies, compiling it on a miss."""
+        key = _cache_key(skills_keywords, education_keywords, section_headers, fuzzy)
+        skills_keywords, education_keywords = key[0], key[1]
+
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is not None:
+                self._profiles.move_to_end(key)
+                self.hits += 1
+                return profile
+            self.misses += 1
+
+        profile = ParserProfile(skills_keywords, education_keywords, section_headers, name=name, fuzzy=fuzzy)
+
+        with self._lock:
+            self._profiles[key] = profile
+            self._profiles.move_to_end(key)
+            while len(self._profiles) > self.maxsize:
+                _, evicted = self._profiles.popitem(last=False)
+                logger.debug("Evicted parser profile %s", evicted.name)
+        return profile
+
+    def clear(self) -> None:
+        """Drop all cached profiles and reset counters."""
+        with self._lock:
+            self._profiles.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_cache = ProfileCache()
+
+
+def get_profile(
+    skills_keywords: Optional[Iterable[str]] = None,
+    education_keywords: Optional[Iterable[str]] = None,
+    section_headers: Optional[Dict[str, List[str]]] = None,
+    name: Optional[str] = None,
+    fuzzy: Optional[bool] = None,
+) -> ParserProfile:
+    """
+    Get a compiled profile from the shared LRU cache.
+
+    Vocabularies that are not given default to those in config.py. Two calls
+    with the same vocabularies return the same compiled object.
+
+    Args:
+        skills_keywords (Optional[Iterable[str]]): Skill vocabulary.
+        education_keywords (Optional[Iterable[str]]): Education keywords.
+        section_headers (Optional[Dict[str, List[str]]]): Section headers.
+        name (Optional[str]): Label used if the profile is compiled now.
+        fuzzy (Optional[bool]): Tolerate typos in skills (default: SKILLS_FUZZY).
+
+    Returns:
+        ParserProfile: Compiled profile.
+    """
+    return _cache.get(
+        SKILLS_KEYWORDS if skills_keywords is None else skills_keywords,
+        EDUCATION_KEYWORDS if education_keywords is None else education_keywords,
+        SECTION_HEADERS if section_headers is None else section_headers,
+        name=name,
+        fuzzy=SKILLS_FUZZY if fuzzy is None else fuzzy,
+    )
+
+
+def profile_cache() -> ProfileCache:
+    """Return the shared profile cache (for statistics or clearing)."""
+    return _cache
+
+
+DEFAULT_PROFILE = get_profile(name="default")
@@ -0,0 +1,355 @@
+"""
+Run Profiling Module
+
+This module captures CPU and memory profiles for a batch run:
+- cProfile statistics (binary pstats plus a text summary)
+- Collapsed stacks from a low-rate stack sampler, for flamegraph tools
+- tracemalloc peaks and top allocation sites per pipeline stage
+- Per-file wall time and peak memory, to tag the slowest PDFs and the
+  biggest allocators
+
+StageTimer is a lightweight alternative that only records wall and CPU
+time per stage of each document (used by the capacity planner).
+
+Only a fraction of documents (the sample rate) run under cProfile and
+tracemalloc, which keeps the overhead acceptable on production batches.
+"""
+
+import os
+import sys
+import json
+import time
+import cProfile
+import pstats
+import logging
+import threading
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from config import PROFILE_SAMPLE_INTERVAL, PROFILE_TOP_N
+
+logger = logging.getLogger(__name__)
+
+# Profiler currently collecting data, consulted by stage()
+_active_profiler: Optional[Union["RunProfiler", "StageTimer"]] = None
+_NULL_STAGE = nullcontext()
+
+
+def stage(name: str):
+    """
+    Mark a pipeline stage for the active profiler.
+
+    Returns a no-op context manager when no profiler is running, so the
+    pipeline can call this unconditionally.
+
+    Args:
+        name (str): Stage name (e.g. "extract", "normalize", "parse").
+
+    Example:
+        >>> with stage("parse"):
+        ...     parsed = parse_resume(text)
+    """
+    if _active_profiler is None:
+        return _NULL_STAGE
+    return _active_profiler.stage(name)
+
+
+class StackSampler:
+    """
+    Periodically sample one thread's Python stack into collapsed stacks.
+
+    Each sample is stored as "outer;...;inner" with a count, which is the
+    format flamegraph.pl, speedscope and inferno accept.
+    """
+
+    def __init__(self, thread_id: int, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the sampling thread."""
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                module = os.path.splitext(os.path.basename(code.co_filename))[0]
+                frames.append(f"{module}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(frames))] += 1
+
+    def write(self, path: str) -> None:
+        """Write collapsed stacks ("stack count" per line) to path."""
+        with open(path, "w", encoding="utf-8") as fh:
+            for stack, count in self.stacks.most_common():
+                fh.write(f"{stack} {count}\n")
+
+
+class StageTimer:
+    """
+    Record wall and CPU seconds per stage of each document.
+
+    Example:
+        >>> with StageTimer() as timer:
+        ...     with timer.document() as stages:
+        ...         process_resume(path)
+        >>> stages["extract"]
+        {'wall': 0.0123, 'cpu': 0.0119}
+    """
+
+    def __init__(self):
+        self._current: Optional[Dict[str, Dict[str, float]]] = None
+
+    def __enter__(self) -> "StageTimer":
+        global _active_profiler
+        _active_profiler = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        global _active_profiler
+        _active_profiler = None
+
+    @contextmanager
+    def document(self) -> Iterator[Dict[str, Dict[str, float]]]:
+        """
+        Time the stages of one document.
+
+        Yields:
+            Dict[str, Dict[str, float]]: Filled with {"wall", "cpu"} seconds
+                per stage as the document is processed.
+        """
+        self._current = {}
+        try:
+            yield self._current
+        finally:
+            self._current = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time one stage of the current document.
+
+        Args:
+            name (str): Stage name.
+        """
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            if self._current is not None:
+                stats = self._current.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+                stats["wall"] += time.perf_counter() - wall
+                stats["cpu"] += time.process_time() - cpu
+
+
+class RunProfiler:
+    """
+    Collect CPU and memory profiles for a batch run and write them to a directory.
+
+    Args:
+        output_dir (str): Directory that receives the profile files.
+        sample_rate (float): Fraction of documents profiled with cProfile and
+            tracemalloc (0 < rate <= 1). Wall time is recorded for all files.
+        interval (float): Stack sampler interval in seconds.
+        top_n (int): Number of entries kept in the "top" lists.
+
+    Example:
+        >>> profiler = RunProfiler("profile_out", sample_rate=0.1)
+        >>> with profiler:
+        ...     for path in pdf_paths:
+        ...         with profiler.document(path):
+        ...             process_resume(path)
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        sample_rate: float = 1.0,
+        interval: float = PROFILE_SAMPLE_INTERVAL,
+        top_n: int = PROFILE_TOP_N,
+    ):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.top_n = top_n
+
+        self._profile = cProfile.Profile()
+        self._sampler: Optional[StackSampler] = None
+        self._documents_seen = 0
+        self._sampled = False
+
+        self.file_stats: List[Dict[str, Any]] = []
+        self.stage_stats: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"calls": 0, "seconds": 0.0, "max_peak_bytes": 0}
+        )
+        self.stage_allocations: Dict[str, Counter] = defaultdict(Counter)
+
+    def __enter__(self) -> "RunProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start collecting and make this the active profiler."""
+        global _active_profiler
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._sampler = StackSampler(threading.get_ident(), self.interval)
+        self._sampler.start()
+        _active_profiler = self
+        logger.info("Profiling enabled (sample rate %g), output: %s", self.sample_rate, self.output_dir)
+
+    def stop(self) -> None:
+        """Stop collecting and write all profile files."""
+        global _active_profiler
+        _active_profiler = None
+        if self._sampler is not None:
+            self._sampler.stop()
+        self.write()
+
+    def _should_sample(self) -> bool:
+        """Deterministically select sample_rate of the documents seen so far."""
+        seen = self._documents_seen
+        self._documents_seen += 1
+        return int((seen + 1) * self.sample_rate) > int(seen * self.sample_rate)
+
+    @contextmanager
+    def document(self, name: str) -> Iterator[None]:
+        """
+        Profile the processing of one document.
+
+        Args:
+            name (str): Document identifier used to tag the results.
+        """
+        self._sampled = self._should_sample()
+        if self._sampled:
+            tracemalloc.start()
+            self._profile.enable()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            record: Dict[str, Any] = {"file": name, "seconds": elapsed, "sampled": self._sampled}
+            if self._sampled:
+                self._profile.disable()
+                record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self.file_stats.append(record)
+            self._sampled = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Profile one pipeline stage of the current document.
+
+        Args:
+            name (str): Stage name.
+        """
+        tracing = self._sampled and tracemalloc.is_tracing()
+        if tracing:
+            # Keep snapshot bookkeeping out of the CPU profile
+            self._profile.disable()
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            self._profile.enable()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats = self.stage_stats[name]
+            stats["calls"] += 1
+            stats["seconds"] += time.perf_counter() - start
+            if tracing:
+                self._profile.disable()
+                peak = tracemalloc.get_traced_memory()[1] - base
+                stats["max_peak_bytes"] = max(stats["max_peak_bytes"], peak)
+                after = tracemalloc.take_snapshot()
+                for diff in after.compare_to(before, "lineno")[: self.top_n]:
+                    if diff.size_diff > 0:
+                        frame = diff.traceback[0]
+                        self.stage_allocations[name][f"{frame.filename}:{frame.lineno}"] += diff.size_diff
+                self._profile.enable()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Build the JSON-serializable profile summary.
+
+        Returns:
+            Dict[str, Any]: Stage statistics, slowest files and biggest allocators.
+        """
+        sampled = [r for r in self.file_stats if r["sampled"]]
+        stages = {}
+        for name, stats in self.stage_stats.items():
+            stages[name] = {
+                **stats,
+                "top_allocations": [
+                    {"site": site, "bytes": size}
+                    for site, size in self.stage_allocations[name].most_common(self.top_n)
+                ],
+            }
+        return {
+            "documents": len(self.file_stats),
+            "sampled_documents": len(sampled),
+            "sample_rate": self.sample_rate,
+            "stages": stages,
+            "slowest_files": sorted(self.file_stats, key=lambda r: r["seconds"], reverse=True)[: self.top_n],
+            "biggest_allocators": sorted(sampled, key=lambda r: r["peak_bytes"], reverse=True)[: self.top_n],
+        }
+
+    def write(self) -> None:
+        """
+        Write profile files to the output directory.
+
+        Files written:
+            - profile.pstats: cProfile data (load with pstats or snakeviz)
+            - profile.txt: cProfile summary sorted by cumulative time
+            - stacks.folded: collapsed stacks for flamegraph tools
+            - summary.json: per-stage stats, slowest files, biggest allocators
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        pstats_path = os.path.join(self.output_dir, "profile.pstats")
+        self._profile.dump_stats(pstats_path)
+        with open(os.path.join(self.output_dir, "profile.txt"), "w", encoding="utf-8") as fh:
+            try:
+                stats = pstats.Stats(pstats_path, stream=fh)
+                stats.sort_stats("cumulative").print_stats(50)
+            except TypeError:
+                fh.write("No documents were profiled\n")
+
+        if self._sampler is not None:
+            self._sampler.write(os.path.join(self.output_dir, "stacks.folded"))
+
+        summary = self.summary()
+        with open(os.path.join(self.output_dir, "summary.json"), "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
+
+        logger.info("Profile written to %s", self.output_dir)
+        for record in summary["slowest_files"][:3]:
+            logger.info("  Slow file: %s (%.3fs)", record["file"], record["seconds"])
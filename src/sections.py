@@ -0,0 +1,133 @@
+"""
+Section Segmentation Module
+
+This module detects resume section headers (Education, Experience, Skills,
+Projects, Contact) in normalized text and records their character offsets.
+The resulting index lets field extractors scan only the region they care
+about instead of the whole document.
+"""
+
+import re
+import logging
+from typing import Dict, List, Pattern, Tuple
+
+from config import SECTION_HEADERS
+
+logger = logging.getLogger(__name__)
+
+# Mapping of section name -> (start, end) character offsets of the section body
+SectionIndex = Dict[str, Tuple[int, int]]
+
+
+def _header_variants(phrase: str) -> List[str]:
+    """Return the written, Title Case and UPPER CASE forms of a header phrase."""
+    return sorted({phrase, phrase.title(), phrase.upper()}, key=len, reverse=True)
+
+
+def compile_header_pattern(headers: Dict[str, List[str]]) -> Pattern:
+    """
+    Compile a single regex matching every header phrase of every section.
+
+    Each section becomes a named group so one ``finditer`` pass over the text
+    finds all headers. Longer phrases are tried first so "Work Experience"
+    wins over "Experience". Groups are ordered by section name, so the
+    pattern does not depend on the order of ``headers``.
+
+    Args:
+        headers (Dict[str, List[str]]): Section name to header phrases.
+
+    Returns:
+        Pattern: Compiled, case-sensitive header pattern.
+    """
+    groups = []
+    for section, phrases in sorted(headers.items()):
+        variants = sorted(
+            {v for phrase in phrases for v in _header_variants(phrase)},
+            key=len,
+            reverse=True,
+        )
+        alternation = "|".join(re.escape(v) for v in variants)
+        groups.append(f"(?P<{section}>{alternation})")
+
+    return re.compile(r"(?<!\w)(?:" + "|".join(groups) + r")(?!\w)(?P<colon>\s?:)?")
+
+
+HEADER_PATTERN = compile_header_pattern(SECTION_HEADERS)
+
+
+def find_sections(text: str, pattern: Pattern = HEADER_PATTERN) -> SectionIndex:
+    """
+    Detect section headers once and record the offsets of each section body.
+
+    For every section the first "strong" header (UPPER CASE or followed by a
+    colon) is preferred over the first Title Case occurrence, which keeps
+    mid-sentence mentions like "strong Skills in" from opening a section.
+    A section body runs from the end of its header to the start of the next
+    strong header; Title Case headers only end sections in text that has no
+    strong header, so "SKILLS Python Experience with Docker" keeps Docker.
+
+    Args:
+        text (str): Normalized resume text.
+        pattern (Pattern): Compiled header pattern (see compile_header_pattern).
+
+    Returns:
+        SectionIndex: Section name to (start, end) offsets. Sections that were
+            not detected are absent.
+
+    Example:
+        >>> text = "John Smith SKILLS Python, SQL EDUCATION B.Tech"
+        >>> sections = find_sections(text)
+        >>> text[slice(*sections["skills"])]
+        ' Python, SQL '
+    """
+    if not text:
+        return {}
+
+    strong: Dict[str, Tuple[int, int]] = {}
+    weak: Dict[str, Tuple[int, int]] = {}
+
+    for match in pattern.finditer(text):
+        section = next(
+            name for name, value in match.groupdict().items()
+            if value is not None and name != "colon"
+        )
+        header = match.group(section)
+        is_strong = header.isupper() or match.group("colon") is not None
+        target = strong if is_strong else weak
+        if section not in target:
+            target[section] = (match.start(), match.end())
+
+    headers = {**weak, **strong}
+    ordered = sorted(headers.items(), key=lambda item: item[1][0])
+    bounds = sorted(start for start, _ in (strong or weak).values())
+
+    sections: SectionIndex = {}
+    for section, (start, body_start) in ordered:
+        body_end = next((bound for bound in bounds if bound > start), len(text))
+        sections[section] = (body_start, max(body_start, body_end))
+
+    logger.debug("Detected sections: %s", sections)
+    return sections
+
+
+def get_section(text: str, sections: SectionIndex, name: str) -> str:
+    """
+    Return the body of a section, falling back to the full text.
+
+    A detected section with an empty body (e.g. a header directly followed
+    by another header) also falls back to the full text.
+
+    Args:
+        text (str): Normalized resume text the index was built from.
+        sections (SectionIndex): Index returned by find_sections.
+        name (str): Section name (e.g. "skills").
+
+    Returns:
+        str: Section body if the section was detected and is not empty,
+            otherwise ``text``.
+    """
+    span = sections.get(name)
+    if span is None:
+        return text
+    body = text[span[0]:span[1]]
+    return body if body.strip() else text
@@ -0,0 +1,370 @@
+"""
+Candidate Similarity Module
+
+This module answers "candidates like this one" over a pool of parsed
+results. Each result is encoded as an L2-normalized vector over the profile
+vocabulary (one dimension per skill, plus a weighted one-hot education), so
+the dot product of two vectors is their cosine similarity.
+
+Vectors are stored in segments, one per added batch, each holding a float32
+matrix and random-projection LSH codes: several tables of sign bits
+against random hyperplanes, kept sorted per table. A query looks up its own
+code and the codes one bit away in every table (binary search), then ranks
+only those candidates exactly. When the buckets hold fewer than k
+candidates the query falls back to a full scan of the matrices.
+
+Adding a batch appends a segment; a FilePath that is added again replaces
+its earlier vector. The index is saved to a single .npz file.
+"""
+
+import os
+import heapq
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    ANALYTICS_CHUNK_SIZE,
+    CSV_ENCODING,
+    SIMILARITY_EDUCATION_WEIGHT,
+    SIMILARITY_LSH_BITS,
+    SIMILARITY_LSH_TABLES,
+    SIMILARITY_MAX_SEGMENTS,
+    SIMILARITY_SEED,
+    SIMILARITY_TOP_K,
+)
+from src.analytics import split_skills
+from src.profiles import ParserProfile, DEFAULT_PROFILE
+
+logger = logging.getLogger(__name__)
+
+KEY_COLUMN = "FilePath"
+
+
+class _Segment:
+    """One block of vectors with its LSH codes sorted per table."""
+
+    def __init__(self, keys: np.ndarray, vectors: np.ndarray, codes: np.ndarray, order: Optional[np.ndarray] = None):
+        self.keys = keys
+        self.vectors = vectors
+        self.codes = codes
+        # order[t] sorts the rows by their code in table t
+        if order is None:
+            order = np.argsort(codes, axis=0, kind="stable").T.astype(np.int32)
+        self.order = order
+        self.sorted_codes = np.take_along_axis(codes.T, self.order, axis=1)
+        self.alive = np.ones(len(keys), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def candidates(self, probes: np.ndarray) -> np.ndarray:
+        """Live rows whose code equals one of the probes in any table."""
+        ranges = []
+        for table, table_probes in enumerate(probes):
+            lo = np.searchsorted(self.sorted_codes[table], table_probes, side="left")
+            hi = np.searchsorted(self.sorted_codes[table], table_probes, side="right")
+            ranges.extend(self.order[table][a:b] for a, b in zip(lo, hi) if b > a)
+        if not ranges:
+            return np.empty(0, dtype=np.intp)
+        rows = np.unique(np.concatenate(ranges))
+        return rows[self.alive[rows]]
+
+
+class SimilarityIndex:
+    """
+    Top-k cosine similarity over parsed results.
+
+    Args:
+        skills (Optional[Sequence[str]]): Skill vocabulary (default: the
+            default parser profile).
+        education (Optional[Sequence[str]]): Education vocabulary (default:
+            the default parser profile).
+        bits (int): Hyperplanes (code bits) per LSH table, at most 32.
+        tables (int): Number of LSH tables.
+        education_weight (float): Weight of the education dimension
+            relative to one skill.
+        seed (int): Seed of the random hyperplanes.
+
+    Example:
+        >>> index = SimilarityIndex()
+        >>> index.add_csv("data/processed_output/parsed_resumes.csv")
+        >>> index.similar_to("/data/raw_resumes/john.pdf", k=5)
+        [('/data/raw_resumes/maria.pdf', 0.94), ...]
+    """
+
+    def __init__(
+        self,
+        skills: Optional[Sequence[str]] = None,
+        education: Optional[Sequence[str]] = None,
+        bits: int = SIMILARITY_LSH_BITS,
+        tables: int = SIMILARITY_LSH_TABLES,
+        education_weight: float = SIMILARITY_EDUCATION_WEIGHT,
+        seed: int = SIMILARITY_SEED,
+    ):
+        if not 0 < bits <= 32:
+            raise ValueError(f"bits must be between 1 and 32, got {bits}")
+        self.skills: Tuple[str, ...] = tuple(DEFAULT_PROFILE.skills if skills is None else skills)
+        self.education: Tuple[str, ...] = tuple(DEFAULT_PROFILE.education if education is None else education)
+        self.bits = bits
+        self.tables = tables
+        self.education_weight = education_weight
+        self.seed = seed
+        self.dims = len(self.skills) + len(self.education)
+        self._skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self._education_index = {keyword: len(self.skills) + i for i, keyword in enumerate(self.education)}
+
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((tables * bits, self.dims)).astype(np.float32)
+        self._weights = (1 << np.arange(bits, dtype=np.uint32)).astype(np.uint32)
+        # Probe a query's own bucket and every bucket one bit away
+        self._flips = np.concatenate([[0], self._weights]).astype(np.uint32)
+
+        self._segments: List[_Segment] = []
+        self._location: Dict[str, Tuple[int, int]] = {}
+
+    @classmethod
+    def for_profile(cls, profile: ParserProfile, **kwargs: Any) -> "SimilarityIndex":
+        """Create an empty index over a parser profile's vocabularies."""
+        return cls(profile.skills, profile.education, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._location)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._location
+
+    def encode_frame(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Encode results as normalized vectors.
+
+        Args:
+            df (pd.DataFrame): Results with Skills (list or comma-joined
+                string) and Education columns.
+
+        Returns:
+            np.ndarray: float32 matrix, one row per result; results with no
+                known skill or education are all zeros.
+        """
+        vectors = np.zeros((len(df), self.dims), dtype=np.float32)
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, value in enumerate(df["Skills"]):
+            for skill in split_skills(value):
+                col = self._skill_index.get(skill)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        vectors[rows, cols] = 1.0
+        for row, value in enumerate(df["Education"]):
+            col = self._education_index.get(value)
+            if col is not None:
+                vectors[row, col] = self.education_weight
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    def encode(self, skills: Iterable[str], education: Optional[str] = None) -> np.ndarray:
+        """Encode a single result."""
+        return self.encode_frame(pd.DataFrame({"Skills": [list(skills)], "Education": [education]}))[0]
+
+    def _codes(self, vectors: np.ndarray) -> np.ndarray:
+        """LSH codes of vectors, shape (n, tables)."""
+        signs = (vectors @ self.planes.T > 0).reshape(len(vectors), self.tables, self.bits)
+        return (signs.astype(np.uint32) * self._weights).sum(axis=2, dtype=np.uint32)
+
+    def add_frame(self, df: pd.DataFrame) -> int:
+        """
+        Add a batch of results as a new segment.
+
+        Results are keyed by FilePath; a key already in the index is
+        replaced. Results with no known skill or education are not indexed
+        (and remove an earlier vector of the same key).
+
+        Args:
+            df (pd.DataFrame): Results with FilePath, Skills and Education.
+
+        Returns:
+            int: Number of results added.
+        """
+        if len(df) == 0:
+            return 0
+        vectors = self.encode_frame(df)
+        keys = df[KEY_COLUMN].astype(str).to_numpy()
+
+        # Last occurrence wins within a batch, as across batches
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = np.zeros(len(keys), dtype=bool)
+        keep[len(keys) - 1 - last] = True
+        for key in keys[keep]:
+            old = self._location.pop(key, None)
+            if old is not None:
+                self._segments[old[0]].alive[old[1]] = False
+
+        keep &= vectors.any(axis=1)
+        if not keep.any():
+            return 0
+        keys, vectors = keys[keep], vectors[keep]
+        segment_id = len(self._segments)
+        self._segments.append(_Segment(keys.astype(str), vectors, self._codes(vectors)))
+        for row, key in enumerate(keys):
+            self._location[key] = (segment_id, row)
+
+        if len(self._segments) > SIMILARITY_MAX_SEGMENTS:
+            self.compact()
+        logger.debug("Added %d result(s) to the similarity index (%d total)", len(keys), len(self))
+        return len(keys)
+
+    def add_csv(self, csv_path: str, chunksize: int = ANALYTICS_CHUNK_SIZE) -> int:
+        """
+        Add a results CSV, read in chunks.
+
+        Args:
+            csv_path (str): Results CSV written by run.py.
+            chunksize (int): Rows per chunk (one segment each).
+
+        Returns:
+            int: Number of results added.
+        """
+        added = 0
+        reader = pd.read_csv(
+            csv_path,
+            usecols=[KEY_COLUMN, "Skills", "Education"],
+            dtype=str,
+            keep_default_na=False,
+            chunksize=chunksize,
+            encoding=CSV_ENCODING,
+        )
+        with reader:
+            for chunk in reader:
+                added += self.add_frame(chunk)
+        return added
+
+    def compact(self) -> None:
+        """Merge all segments into one, dropping replaced vectors."""
+        if len(self._segments) <= 1 and all(s.alive.all() for s in self._segments):
+            return
+        keys = [s.keys[s.alive] for s in self._segments]
+        vectors = [s.vectors[s.alive] for s in self._segments]
+        codes = [s.codes[s.alive] for s in self._segments]
+        self._segments = []
+        self._location = {}
+        if keys and sum(len(k) for k in keys):
+            merged = _Segment(np.concatenate(keys), np.concatenate(vectors), np.concatenate(codes))
+            self._segments.append(merged)
+            self._location = {str(key): (0, row) for row, key in enumerate(merged.keys)}
+
+    def vector(self, key: str) -> np.ndarray:
+        """Return the stored vector of a key (KeyError if absent)."""
+        segment_id, row = self._location[key]
+        return self._segments[segment_id].vectors[row]
+
+    def query(
+        self,
+        vector: np.ndarray,
+        k: int = SIMILARITY_TOP_K,
+        exclude: Optional[str] = None,
+        exact: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the k most similar results to a vector.
+
+        Args:
+            vector (np.ndarray): Query vector from encode or vector().
+            k (int): Number of results.
+            exclude (Optional[str]): Key left out of the results (the query
+                candidate itself).
+            exact (bool): Scan every vector instead of the LSH buckets.
+
+        Returns:
+            List[Tuple[str, float]]: (FilePath, cosine similarity), best first.
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        wanted = k + (exclude is not None)
+        candidates: List[Tuple[_Segment, np.ndarray]] = []
+        if not exact:
+            probes = self._codes(vector[None, :])[0][:, None] ^ self._flips
+            candidates = [(segment, segment.candidates(probes)) for segment in self._segments]
+            if sum(len(rows) for _, rows in candidates) < wanted:
+                candidates = []
+        if not candidates:
+            candidates = [(s, np.flatnonzero(s.alive)) for s in self._segments]
+
+        best: List[Tuple[float, str]] = []
+        for segment, rows in candidates:
+            if not len(rows):
+                continue
+            scores = segment.vectors[rows] @ vector
+            if len(rows) > wanted:
+                top = np.argpartition(-scores, wanted - 1)[:wanted]
+                rows, scores = rows[top], scores[top]
+            best.extend((float(score), str(segment.keys[row])) for row, score in zip(rows, scores))
+
+        ranked = heapq.nlargest(wanted, best)
+        return [(key, round(score, 6)) for score, key in ranked if key != exclude][:k]
+
+    def similar_to(self, key: str, k: int = SIMILARITY_TOP_K, exact: bool = False) -> List[Tuple[str, float]]:
+        """
+        Find the k results most similar to an indexed result.
+
+        Args:
+            key (str): FilePath of a result in the index.
+            k (int): Number of results.
+            exact (bool): Scan every vector instead of the LSH buckets.
+
+        Returns:
+            List[Tuple[str, float]]: (FilePath, cosine similarity), best first.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+        return self.query(self.vector(key), k, exclude=key, exact=exact)
+
+    def save(self, path: str) -> None:
+        """
+        Compact the index and write it to a .npz file.
+
+        The file is written next to path and renamed over it, so a reader
+        never sees a partial index.
+        """
+        self.compact()
+        segment = self._segments[0] if self._segments else None
+        arrays = {
+            "skills": np.array(self.skills, dtype=str),
+            "education": np.array(self.education, dtype=str),
+            "params": np.array([self.bits, self.tables, self.seed], dtype=np.int64),
+            "education_weight": np.array(self.education_weight, dtype=np.float64),
+            "planes": self.planes,
+            "keys": segment.keys if segment else np.empty(0, dtype=str),
+            "vectors": segment.vectors if segment else np.empty((0, self.dims), dtype=np.float32),
+            "codes": segment.codes if segment else np.empty((0, self.tables), dtype=np.uint32),
+            "order": segment.order if segment else np.empty((self.tables, 0), dtype=np.int32),
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as fh:
+            np.savez(fh, **arrays)
+        os.replace(tmp_path, path)
+        logger.debug("Saved similarity index with %d result(s) to %s", len(self), path)
+
+    @classmethod
+    def load(cls, path: str) -> "SimilarityIndex":
+        """Read an index written by save."""
+        with np.load(path) as data:
+            bits, tables, seed = (int(v) for v in data["params"])
+            index = cls(
+                [str(s) for s in data["skills"]],
+                [str(e) for e in data["education"]],
+                bits=bits,
+                tables=tables,
+                education_weight=float(data["education_weight"]),
+                seed=seed,
+            )
+            index.planes = data["planes"]
+            if len(data["keys"]):
+                segment = _Segment(data["keys"], data["vectors"], data["codes"], order=data["order"])
+                index._segments.append(segment)
+                index._location = {str(key): (0, row) for row, key in enumerate(segment.keys)}
+        return index
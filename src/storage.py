@@ -0,0 +1,407 @@
+"""
+Input Storage Module
+
+This module abstracts where resumes are read from. A storage backend lists
+object keys and fetches their bytes; the bytes are passed straight to
+process_resume, so nothing is written to a temporary file.
+
+Backends:
+- LocalStorage: a directory on the local filesystem
+- S3Storage: a bucket prefix on an S3-compatible object store, spoken to
+  over pooled, kept-alive http.client connections
+
+prefetch() fetches objects on a thread pool ahead of the consumer, so
+network latency overlaps with extraction.
+"""
+
+import os
+import hmac
+import time
+import queue
+import hashlib
+import logging
+import datetime
+import http.client
+import xml.etree.ElementTree as ET
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import quote, urlsplit
+
+from config import (
+    SUPPORTED_EXTENSIONS,
+    S3_ENDPOINT_URL,
+    S3_REGION,
+    STORAGE_POOL_SIZE,
+    STORAGE_PREFETCH_WORKERS,
+    STORAGE_PREFETCH_DEPTH,
+    STORAGE_TIMEOUT,
+    STORAGE_RETRIES,
+)
+
+logger = logging.getLogger(__name__)
+
+_S3_NS = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+class StorageError(Exception):
+    """Raised when an object cannot be listed or fetched."""
+
+
+class StorageBackend(ABC):
+    """Interface of a storage backend."""
+
+    @abstractmethod
+    def list(self, extensions: Iterable[str] = SUPPORTED_EXTENSIONS) -> Iterator[str]:
+        """Yield the keys of objects with one of the given extensions, in key order."""
+
+    @abstractmethod
+    def read(self, key: str) -> bytes:
+        """Return the contents of an object."""
+
+    @abstractmethod
+    def display_path(self, key: str) -> str:
+        """Return the path shown for an object in results and logs."""
+
+    def close(self) -> None:
+        """Release connections held by the backend."""
+
+    def __enter__(self) -> "StorageBackend":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class LocalStorage(StorageBackend):
+    """
+    Files directly inside a local directory.
+
+    Args:
+        root (str): Directory path.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def list(self, extensions: Iterable[str] = SUPPORTED_EXTENSIONS) -> Iterator[str]:
+        suffixes = tuple(ext.lower() for ext in extensions)
+        for name in sorted(os.listdir(self.root)):
+            if name.lower().endswith(suffixes) and os.path.isfile(os.path.join(self.root, name)):
+                yield name
+
+    def read(self, key: str) -> bytes:
+        try:
+            with open(os.path.join(self.root, key), "rb") as fh:
+                return fh.read()
+        except OSError as e:
+            raise StorageError(f"Failed to read {key}: {str(e)}")
+
+    def display_path(self, key: str) -> str:
+        return os.path.abspath(os.path.join(self.root, key))
+
+
+class _ConnectionPool:
+    """
+    Thread-safe pool of kept-alive HTTP(S) connections to one host.
+
+    Args:
+        endpoint (str): Base URL, e.g. "https://s3.amazonaws.com".
+        size (int): Maximum number of idle connections kept.
+        timeout (float): Socket timeout in seconds.
+    """
+
+    def __init__(self, endpoint: str, size: int = STORAGE_POOL_SIZE, timeout: float = STORAGE_TIMEOUT):
+        parts = urlsplit(endpoint)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Invalid endpoint URL: {endpoint}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.netloc = parts.netloc
+        self.timeout = timeout
+        self.created = 0
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=size)
+
+    def _new(self) -> http.client.HTTPConnection:
+        self.created += 1
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def request(self, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send a request on an idle connection (or a new one) and read the response.
+
+        A kept-alive connection the server has already closed fails on
+        first use; the request is then retried once on a new connection.
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: Status, headers and body.
+        """
+        try:
+            conn = self._idle.get_nowait()
+            reused = True
+        except queue.Empty:
+            conn = self._new()
+            reused = False
+
+        try:
+            conn.request(method, target, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            conn = self._new()
+            conn.request(method, target, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        return response.status, dict(response.getheaders()), body
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class S3Storage(StorageBackend):
+    """
+    Objects under a prefix of an S3-compatible bucket.
+
+    Requests use path-style addressing and are signed with AWS Signature
+    Version 4 when credentials are available (AWS_ACCESS_KEY_ID and
+    AWS_SECRET_ACCESS_KEY), and sent unsigned otherwise.
+
+    Args:
+        bucket (str): Bucket name.
+        prefix (str): Key prefix to list under (e.g. "resumes/2024/").
+        endpoint (str): Object store base URL.
+        region (str): Signing region.
+        pool_size (int): Maximum number of kept-alive connections.
+        timeout (float): Socket timeout in seconds.
+        retries (int): Attempts per request on connection errors and 5xx.
+
+    Example:
+        >>> with S3Storage("hr-inbox", "resumes/") as store:
+        ...     for key, data, error in prefetch(store, store.list()):
+        ...         result = process_resume(store.display_path(key), data=data)
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint: str = S3_ENDPOINT_URL,
+        region: str = S3_REGION,
+        pool_size: int = STORAGE_POOL_SIZE,
+        timeout: float = STORAGE_TIMEOUT,
+        retries: int = STORAGE_RETRIES,
+    ):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.region = region
+        self.retries = max(1, retries)
+        self.pool = _ConnectionPool(endpoint, pool_size, timeout)
+        self._access_key = os.environ.get("AWS_ACCESS_KEY_ID")
+        self._secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
+        self._session_token = os.environ.get("AWS_SESSION_TOKEN")
+
+    def _signed_headers(self, method: str, path: str, query: Dict[str, str]) -> Dict[str, str]:
+        """Build request headers, adding a SigV4 Authorization header if credentials are set."""
+        headers = {"Host": self.pool.netloc}
+        if not (self._access_key and self._secret_key):
+            return headers
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date = now.strftime("%Y%m%d")
+        headers["x-amz-date"] = amz_date
+        headers["x-amz-content-sha256"] = _EMPTY_SHA256
+        if self._session_token:
+            headers["x-amz-security-token"] = self._session_token
+
+        signed = sorted(name.lower() for name in headers)
+        values = {name.lower(): value.strip() for name, value in headers.items()}
+        canonical_request = "\n".join([
+            method,
+            quote(path, safe="/-_.~"),
+            _canonical_query(query),
+            "".join(f"{name}:{values[name]}\n" for name in signed),
+            ";".join(signed),
+            _EMPTY_SHA256,
+        ])
+        scope = f"{date}/{self.region}/s3/aws4_request"
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ])
+
+        key = ("AWS4" + self._secret_key).encode("utf-8")
+        for part in (date, self.region, "s3", "aws4_request"):
+            key = hmac.new(key, part.encode("utf-8"), hashlib.sha256).digest()
+        signature = hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+        headers["Authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self._access_key}/{scope}, "
+            f"SignedHeaders={';'.join(signed)}, Signature={signature}"
+        )
+        return headers
+
+    def _get(self, path: str, query: Optional[Dict[str, str]] = None) -> bytes:
+        """GET a path with retries; returns the body of a 200 response."""
+        query = query or {}
+        target = quote(path, safe="/-_.~")
+        if query:
+            target += "?" + _canonical_query(query)
+
+        for attempt in range(1, self.retries + 1):
+            try:
+                status, _, body = self.pool.request("GET", target, self._signed_headers("GET", path, query))
+            except (OSError, http.client.HTTPException) as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                if status == 200:
+                    return body
+                error = f"HTTP {status}: {body[:200].decode('utf-8', 'replace')}"
+                if status < 500:
+                    break
+            if attempt < self.retries:
+                logger.debug("GET %s failed (%s); retrying", path, error)
+                time.sleep(0.1 * 2 ** (attempt - 1))
+        raise StorageError(f"GET {path} failed: {error}")
+
+    def list(self, extensions: Iterable[str] = SUPPORTED_EXTENSIONS) -> Iterator[str]:
+        suffixes = tuple(ext.lower() for ext in extensions)
+        query = {"list-type": "2", "prefix": self.prefix}
+        while True:
+            root = ET.fromstring(self._get(f"/{self.bucket}", query))
+            for contents in root.iter(f"{_S3_NS}Contents"):
+                key = contents.findtext(f"{_S3_NS}Key") or ""
+                if key.lower().endswith(suffixes):
+                    yield key
+            token = root.findtext(f"{_S3_NS}NextContinuationToken")
+            if root.findtext(f"{_S3_NS}IsTruncated") != "true" or not token:
+                return
+            query = {"list-type": "2", "prefix": self.prefix, "continuation-token": token}
+
+    def read(self, key: str) -> bytes:
+        return self._get(f"/{self.bucket}/{key}")
+
+    def display_path(self, key: str) -> str:
+        return f"s3://{self.bucket}/{key}"
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+def _canonical_query(query: Dict[str, str]) -> str:
+    """Encode query parameters in SigV4 canonical order."""
+    return "&".join(
+        f"{quote(name, safe='-_.~')}={quote(value, safe='-_.~')}" for name, value in sorted(query.items())
+    )
+
+
+def is_remote(location: str) -> bool:
+    """Return True if location is an object store URI (s3://bucket/prefix)."""
+    return location.startswith("s3://")
+
+
+def open_storage(location: str) -> StorageBackend:
+    """
+    Open the backend for an input location.
+
+    Args:
+        location (str): Local directory, or "s3://bucket/prefix".
+
+    Returns:
+        StorageBackend: Backend for the location.
+
+    Raises:
+        ValueError: If an s3:// URI has no bucket.
+    """
+    if is_remote(location):
+        bucket, _, prefix = location[len("s3://"):].partition("/")
+        if not bucket:
+            raise ValueError(f"Missing bucket in {location}")
+        return S3Storage(bucket, prefix)
+    return LocalStorage(location)
+
+
+def prefetch(
+    backend: StorageBackend,
+    keys: Iterable[str],
+    workers: int = STORAGE_PREFETCH_WORKERS,
+    depth: Union[int, Callable[[], int]] = STORAGE_PREFETCH_DEPTH,
+) -> Iterator[Tuple[str, Optional[bytes], Optional[Exception]]]:
+    """
+    Fetch objects concurrently, yielding them in key order.
+
+    At most ``depth`` objects are fetched or buffered ahead of the consumer,
+    which bounds memory. ``depth`` may be a callable returning the current
+    limit, so it can be tuned while objects are fetched (worker threads are
+    only started as fetches are queued). If the consumer stops early,
+    queued fetches are cancelled.
+
+    Args:
+        backend (StorageBackend): Backend to read from.
+        keys (Iterable[str]): Keys to fetch.
+        workers (int): Fetch threads.
+        depth (Union[int, Callable[[], int]]): Maximum objects in flight or
+            buffered, or a callable returning it.
+
+    Yields:
+        Tuple[str, Optional[bytes], Optional[Exception]]: (key, data, None)
+            on success or (key, None, error) if the fetch failed.
+
+    Raises:
+        ValueError: If workers or depth is not positive.
+    """
+    current_depth = depth if callable(depth) else lambda: depth
+    if workers <= 0 or current_depth() <= 0:
+        raise ValueError("workers and depth must be positive")
+
+    key_iter = iter(keys)
+    pending: Deque[Tuple[str, "Future[bytes]"]] = deque()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+
+    def fill() -> None:
+        while len(pending) < current_depth():
+            key = next(key_iter, None)
+            if key is None:
+                return
+            pending.append((key, executor.submit(backend.read, key)))
+
+    try:
+        fill()
+        while pending:
+            key, future = pending.popleft()
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.error("Failed to fetch %s: %s", key, e)
+                yield key, None, e
+            else:
+                yield key, data, None
+            fill()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
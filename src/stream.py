@@ -0,0 +1,136 @@
+"""
+Stream Input/Output Module
+
+This module lets run.py act as a filter in shell pipelines
+(``find ... | resume-parser --stdin | jq ...``). Documents are read from
+stdin in one of two formats:
+- paths: one file path per line
+- bytes: length-prefixed documents, each a header line
+  ``<length> [<name>]`` followed by exactly <length> bytes
+
+Results are written to stdout as newline-delimited JSON (one object per
+document), each flushed as soon as the document is done.
+"""
+
+import os
+import sys
+import json
+import logging
+from typing import Any, BinaryIO, Dict, Iterator, Optional, TextIO, Tuple
+
+from config import STREAM_MAX_FRAME_BYTES
+
+logger = logging.getLogger(__name__)
+
+PATHS = "paths"
+BYTES = "bytes"
+STREAM_FORMATS = (PATHS, BYTES)
+
+# Display path prefix for documents read as bytes from stdin
+STDIN_PREFIX = "stdin://"
+
+
+def read_paths(stream: TextIO) -> Iterator[Tuple[str, str, Optional[bytes]]]:
+    """
+    Read one file path per line.
+
+    Args:
+        stream (TextIO): Input, e.g. sys.stdin.
+
+    Yields:
+        Tuple[str, str, Optional[bytes]]: (file name, path, None); blank
+            lines are skipped.
+    """
+    for line in stream:
+        path = line.rstrip("\r\n")
+        if path.strip():
+            yield os.path.basename(path), path, None
+
+
+def read_frames(
+    stream: BinaryIO,
+    max_bytes: int = STREAM_MAX_FRAME_BYTES,
+) -> Iterator[Tuple[str, str, Optional[bytes]]]:
+    """
+    Read length-prefixed documents.
+
+    Each frame is a header line ``<length> [<name>]`` and <length> bytes of
+    content. The name picks the extractor by extension and defaults to
+    ``stdin-<n>.pdf``. For example, in bash::
+
+        for f in *.pdf; do printf '%d %s\\n' "$(stat -c %s "$f")" "$f"; cat "$f"; done
+
+    Args:
+        stream (BinaryIO): Binary input, e.g. sys.stdin.buffer.
+        max_bytes (int): Largest accepted length.
+
+    Yields:
+        Tuple[str, str, Optional[bytes]]: (name, "stdin://<name>", content).
+
+    Raises:
+        ValueError: If a header is malformed, too large, or the stream ends
+            inside a frame.
+    """
+    count = 0
+    while True:
+        header = stream.readline()
+        if not header:
+            return
+        if not header.strip():
+            continue
+        count += 1
+        length_text, _, name = header.decode("utf-8", errors="replace").strip().partition(" ")
+        if not length_text.isdigit():
+            raise ValueError(f"Malformed frame header {count}: {header[:80]!r}")
+        length = int(length_text)
+        if length > max_bytes:
+            raise ValueError(f"Frame {count} is {length} bytes (limit {max_bytes})")
+
+        data = stream.read(length)
+        if len(data) < length:
+            raise ValueError(f"Input ended inside frame {count} ({len(data)} of {length} bytes)")
+        name = os.path.basename(name.strip()) or f"stdin-{count}.pdf"
+        yield name, STDIN_PREFIX + name, data
+
+
+def stream_record(filename: str, path: str, status: str, value: Any) -> Dict[str, Any]:
+    """
+    Build the output object for one document.
+
+    Args:
+        filename (str): Document name.
+        path (str): File path or display path.
+        status (str): Outcome: "ok", "failed", "error", "scanned" or "suspicious".
+        value (Any): Parsed data for "ok", otherwise the detail message.
+
+    Returns:
+        Dict[str, Any]: Parsed fields plus Status, or File/FilePath/Status/Detail.
+    """
+    if status == "ok":
+        return {**value, "Status": status}
+    return {"File": filename, "FilePath": path, "Status": status, "Detail": value}
+
+
+def open_result_stream() -> TextIO:
+    """
+    Reserve stdout for results.
+
+    Returns a writer on the original stdout and points file descriptor 1
+    (and sys.stdout) at stderr, so stray prints from libraries or worker
+    processes cannot corrupt the JSON stream.
+
+    Returns:
+        TextIO: Stream to write results to.
+    """
+    sys.stdout.flush()
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    return out
+
+
+def write_record(out: TextIO, record: Dict[str, Any]) -> None:
+    """Write one JSON object per line and flush it."""
+    out.write(json.dumps(record, ensure_ascii=False, default=str))
+    out.write("\n")
+    out.flush()
@@ -0,0 +1,129 @@
+"""
+PDF Triage Module
+
+This module runs a cheap probe on a PDF before full extraction and
+classifies it as:
+- "text": has a usable text layer and looks like a resume
+- "scanned": pages are images without a text layer (needs OCR)
+- "suspicious": empty, very long, or no resume markers in the text
+
+Only the first few pages are inspected, and only their font and image
+resources are read (no content stream is parsed), so the probe costs a
+fraction of a full parse and the text is extracted once, by the parser.
+With TRIAGE_REQUIRE_RESUME_MARKERS the probe also extracts the text of pages
+that declare fonts, to check text density and look for resume markers.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import fitz  # PyMuPDF
+
+from config import (
+    TRIAGE_PROBE_PAGES,
+    TRIAGE_MAX_PAGES,
+    TRIAGE_MIN_CHARS_PER_PAGE,
+    TRIAGE_REQUIRE_RESUME_MARKERS,
+)
+from src.contact import find_email, find_phone
+from src.extract_text import MUPDF_LOCK
+from src.sections import HEADER_PATTERN
+
+logger = logging.getLogger(__name__)
+
+TEXT = "text"
+SCANNED = "scanned"
+SUSPICIOUS = "suspicious"
+
+
+def _has_resume_markers(text: str) -> bool:
+    """Look for an email, a phone number or a section header in any case."""
+    # Upper-casing the text lets the case-sensitive header pattern match
+    # "Experience" and "experience" as well as "EXPERIENCE"
+    return bool(find_email(text) or find_phone(text) or HEADER_PATTERN.search(text.upper()))
+
+
+def _classify(
+    page_count: int, pages_probed: int, text_pages: int, has_images: bool, probe_text: Optional[str]
+) -> Dict[str, str]:
+    """Map probe measurements to a category and reason."""
+    if page_count == 0:
+        return {"category": SUSPICIOUS, "reason": "no pages"}
+    if page_count > TRIAGE_MAX_PAGES:
+        return {"category": SUSPICIOUS, "reason": f"{page_count} pages (max {TRIAGE_MAX_PAGES})"}
+
+    if probe_text is None:
+        if text_pages:
+            return {"category": TEXT, "reason": f"{text_pages}/{pages_probed} pages with fonts"}
+        if has_images:
+            return {"category": SCANNED, "reason": "no fonts, images only"}
+        return {"category": SUSPICIOUS, "reason": "no fonts and no images"}
+
+    density = len(probe_text.strip()) / pages_probed
+    if density < TRIAGE_MIN_CHARS_PER_PAGE:
+        if has_images:
+            return {"category": SCANNED, "reason": f"{density:.0f} chars/page with images"}
+        return {"category": SUSPICIOUS, "reason": f"{density:.0f} chars/page and no images"}
+
+    if not _has_resume_markers(probe_text):
+        return {"category": SUSPICIOUS, "reason": "no contact details or section headers"}
+
+    return {"category": TEXT, "reason": f"{density:.0f} chars/page"}
+
+
+def probe_pdf(
+    pdf_path: str,
+    data: Optional[bytes] = None,
+    read_text: bool = TRIAGE_REQUIRE_RESUME_MARKERS,
+) -> Dict[str, Any]:
+    """
+    Classify a PDF as text, scanned or suspicious without full extraction.
+
+    Args:
+        pdf_path (str): Path to the PDF file (label only when data is given).
+        data (Optional[bytes]): PDF contents already in memory.
+        read_text (bool): Also extract the probed pages' text and require a
+            minimum density and resume markers (email, phone or header).
+
+    Returns:
+        Dict[str, Any]: Dictionary containing:
+            - category: "text", "scanned" or "suspicious"
+            - reason: Short human-readable explanation
+            - pages: Total page count
+            - chars: Characters found on the probed pages (None unless read_text)
+
+    Raises:
+        RuntimeError: If the PDF cannot be opened.
+
+    Example:
+        >>> probe_pdf("scan.pdf")["category"]
+        'scanned'
+    """
+    try:
+        with MUPDF_LOCK:
+            source = fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(pdf_path)
+            with source as doc:
+                page_count = doc.page_count
+                pages_probed = min(page_count, TRIAGE_PROBE_PAGES)
+                text_pages = 0
+                has_images = False
+                probe_text: List[str] = []
+
+                for page_num in range(pages_probed):
+                    page = doc.load_page(page_num)
+                    has_images = has_images or bool(page.get_images())
+                    # Pages without fonts have no text layer
+                    if page.get_fonts():
+                        text_pages += 1
+                        if read_text:
+                            probe_text.append(page.get_text())
+
+    except Exception as e:
+        raise RuntimeError(f"Failed to probe {pdf_path}: {str(e)}")
+
+    text = "\n".join(probe_text) if read_text else None
+    result: Dict[str, Any] = _classify(page_count, max(pages_probed, 1), text_pages, has_images, text)
+    result["pages"] = page_count
+    result["chars"] = len(text.strip()) if text is not None else None
+    logger.debug("Triage %s: %s (%s)", pdf_path, result["category"], result["reason"])
+    return result
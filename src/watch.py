@@ -0,0 +1,271 @@
+"""
+Directory Watch Module
+
+This module watches an input directory for new or changed resumes so a
+long-running process can parse them within seconds of arrival. On Linux it
+waits on inotify events; elsewhere it falls back to polling with cheap
+``os.scandir`` stat signatures. Files are only handed over once their size
+and modification time have been stable for a settle period, which skips
+files that are still being written. Files already in the directory when
+watching starts are parsed first, unless WATCH_INCLUDE_EXISTING is off.
+"""
+
+import os
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from config import SUPPORTED_EXTENSIONS, WATCH_POLL_INTERVAL, WATCH_SETTLE_SECONDS, WATCH_INCLUDE_EXISTING
+
+logger = logging.getLogger(__name__)
+
+# (st_mtime_ns, st_size) of a file, used to detect changes
+Signature = Tuple[int, int]
+
+# inotify event masks (from <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class Inotify:
+    """
+    Minimal ctypes binding to Linux inotify for a single directory.
+
+    Raises:
+        OSError: If inotify is not available on this platform.
+    """
+
+    def __init__(self, directory: str):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError(errno.ENOSYS, "libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {directory}")
+
+    def read(self, timeout: float) -> Optional[Set[str]]:
+        """
+        Wait up to ``timeout`` seconds for events.
+
+        Returns:
+            Optional[Set[str]]: Names of files with events, or None if the
+                kernel queue overflowed and a full rescan is needed.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        names: Set[str] = set()
+        while True:
+            try:
+                buffer = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buffer):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                name = buffer[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if name:
+                    names.add(os.fsdecode(name))
+        return names
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        os.close(self.fd)
+
+
+class DirectoryWatcher:
+    """
+    Detect new or changed files in a directory and debounce partial writes.
+
+    Files present when the watcher is created are reported once they have
+    settled, like new files, unless include_existing is False; then they
+    form the baseline and only later changes to them are reported.
+
+    Args:
+        directory (str): Directory to watch (not recursive).
+        extensions (Iterable[str]): File extensions to report.
+        settle_seconds (float): How long a file's size and mtime must stay
+            unchanged before it is reported.
+        poll_interval (float): Maximum time between checks.
+        use_inotify (bool): Use inotify when available.
+        include_existing (bool): Report files present at startup.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        extensions: Iterable[str] = SUPPORTED_EXTENSIONS,
+        settle_seconds: float = WATCH_SETTLE_SECONDS,
+        poll_interval: float = WATCH_POLL_INTERVAL,
+        use_inotify: bool = True,
+        include_existing: bool = WATCH_INCLUDE_EXISTING,
+    ):
+        self.directory = directory
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+
+        self._inotify: Optional[Inotify] = None
+        if use_inotify:
+            try:
+                self._inotify = Inotify(directory)
+                logger.info("Watching %s with inotify", directory)
+            except (OSError, AttributeError) as e:
+                logger.info("inotify unavailable (%s), polling %s every %gs", e, directory, poll_interval)
+
+        existing = self._scan()
+        self._known: Dict[str, Signature] = {}
+        # name -> (signature, time the signature was first seen)
+        self._pending: Dict[str, Tuple[Signature, float]] = {}
+        if include_existing:
+            # Pending files are re-checked on every poll, with or without
+            # inotify events, and reported once they have settled
+            now = time.monotonic()
+            self._pending = {name: (signature, now) for name, signature in existing.items()}
+            if existing:
+                logger.info("Queued %d file(s) already in %s", len(existing), directory)
+        else:
+            self._known = existing
+            if existing:
+                logger.info("Skipping %d file(s) already in %s (watching for changes only)", len(existing), directory)
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Whether change detection is event driven."""
+        return self._inotify is not None
+
+    def _is_candidate(self, name: str) -> bool:
+        return name.lower().endswith(self.extensions) and not name.startswith(".")
+
+    def _stat(self, name: str) -> Optional[Signature]:
+        try:
+            st = os.stat(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _scan(self) -> Dict[str, Signature]:
+        signatures = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and self._is_candidate(entry.name):
+                    st = entry.stat()
+                    signatures[entry.name] = (st.st_mtime_ns, st.st_size)
+        return signatures
+
+    def _wait(self) -> Dict[str, Optional[Signature]]:
+        """Wait for activity and return signatures of candidate files."""
+        timeout = self.poll_interval
+        if self._pending:
+            timeout = min(timeout, self.settle_seconds)
+
+        if self._inotify is None:
+            time.sleep(timeout)
+            return dict(self._scan())
+
+        names = self._inotify.read(timeout)
+        if names is None:
+            logger.warning("inotify queue overflowed, rescanning directory")
+            return dict(self._scan())
+        names = {name for name in names if self._is_candidate(name)} | set(self._pending)
+        return {name: self._stat(name) for name in names}
+
+    def poll(self) -> List[str]:
+        """
+        Wait for changes and return paths of files that are ready to parse.
+
+        Returns:
+            List[str]: Full paths of new or changed files whose contents have
+                been stable for ``settle_seconds``.
+        """
+        signatures = self._wait()
+        now = time.monotonic()
+        ready = []
+
+        for name, signature in signatures.items():
+            if signature is None:
+                self._pending.pop(name, None)
+                self._known.pop(name, None)
+                continue
+            if signature == self._known.get(name):
+                self._pending.pop(name, None)
+                continue
+
+            pending = self._pending.get(name)
+            if pending is None or pending[0] != signature:
+                self._pending[name] = (signature, now)
+            elif now - pending[1] >= self.settle_seconds:
+                del self._pending[name]
+                self._known[name] = signature
+                ready.append(os.path.join(self.directory, name))
+
+        return sorted(ready)
+
+    def close(self) -> None:
+        """Release watcher resources."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
+def watch_directory(
+    directory: str,
+    handler: Callable[[List[str]], None],
+    stop_event: threading.Event,
+    **watcher_kwargs,
+) -> int:
+    """
+    Hand ready files to ``handler`` until ``stop_event`` is set.
+
+    The batch being handled when the stop event is set is always finished
+    before returning, so a SIGTERM drains cleanly.
+
+    Args:
+        directory (str): Directory to watch.
+        handler (Callable[[List[str]], None]): Called with each batch of ready paths.
+        stop_event (threading.Event): Set to stop watching.
+        **watcher_kwargs: Passed to DirectoryWatcher.
+
+    Returns:
+        int: Number of files handed to the handler.
+    """
+    watcher = DirectoryWatcher(directory, **watcher_kwargs)
+    handled = 0
+    try:
+        while not stop_event.is_set():
+            ready = watcher.poll()
+            if ready:
+                logger.info("Detected %d new or changed file(s)", len(ready))
+                handler(ready)
+                handled += len(ready)
+    finally:
+        watcher.close()
+        logger.info("Watch stopped after %d file(s)", handled)
+    return handled
@@ -0,0 +1,10 @@
+"""
+Worker Template Module
+
+Imported by the worker fork server (see src.bootstrap): importing it
+preloads and freezes the server so every worker forked from it starts warm.
+"""
+
+from src.bootstrap import preload
+
+preload()
@@ -0,0 +1,399 @@
+"""
+Worker Pool Module
+
+This module runs document processing on a pool of worker processes, with a
+concurrency limit that can change while the batch runs.
+
+With ``--workers auto`` an AdaptiveController tunes two limits:
+- extraction workers: documents processed at once
+- prefetch depth: documents fetched ahead of extraction (remote input)
+
+Each worker reports the CPU time, wall time and peak RSS of every document
+it processes. The controller compares throughput between adjustment
+windows and keeps moving the worker count in the direction that improved
+docs/sec (hill climbing). The worker count is capped by the CPU count when
+documents are CPU-bound, and by a memory ceiling derived from the cgroup
+or physical memory limit. Prefetch depth grows when the pool waits for
+input. Every change is logged so the settings can be pinned later.
+
+Long-running workers are recycled: a worker process is replaced after
+WORKER_MAX_DOCUMENTS documents or when its RSS stays above
+WORKER_MAX_RSS_MB, which returns memory lost to MuPDF caching and heap
+fragmentation to the OS.
+
+Workers are forked from a preloaded template (see src.bootstrap), so
+starting or replacing one costs milliseconds and little unique memory.
+"""
+
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import (
+    WORKERS_MAX_PER_CPU,
+    WORKERS_MAX_PREFETCH,
+    WORKERS_ADJUST_INTERVAL,
+    WORKERS_TOLERANCE,
+    WORKERS_MEMORY_FRACTION,
+    WORKER_MAX_DOCUMENTS,
+    WORKER_MAX_RSS_MB,
+    WORKER_START_METHOD,
+    STORAGE_PREFETCH_DEPTH,
+)
+from src.bootstrap import init_worker, worker_context
+from src.logging_setup import worker_logging_settings
+from src.memory import current_rss, peak_rss
+
+logger = logging.getLogger(__name__)
+
+
+def _read_first_line(path: str) -> Optional[str]:
+    try:
+        with open(path) as fh:
+            return fh.readline().strip()
+    except OSError:
+        return None
+
+
+def available_cpus() -> int:
+    """
+    Return the number of CPUs this process may use.
+
+    Takes CPU affinity and cgroup (v2 cpu.max or v1 CFS) quotas into
+    account, so a container limited to 2 CPUs on a 64-core node reports 2.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    quota = None
+    line = _read_first_line("/sys/fs/cgroup/cpu.max")
+    if line:
+        limit, _, period = line.partition(" ")
+        if limit != "max" and period:
+            quota = int(limit) / int(period)
+    else:
+        limit = _read_first_line("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+        period = _read_first_line("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        if limit and period and int(limit) > 0:
+            quota = int(limit) / int(period)
+
+    if quota is not None:
+        cpus = min(cpus, max(1, int(quota + 0.5)))
+    return max(1, cpus)
+
+
+def memory_limit() -> Optional[int]:
+    """
+    Return the memory limit in bytes (cgroup limit, else physical memory).
+
+    Returns:
+        Optional[int]: Limit in bytes, or None if it cannot be determined.
+    """
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        line = _read_first_line(path)
+        if line and line.isdigit() and int(line) < 1 << 60:
+            return int(line)
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def recycle_reason(
+    documents: int,
+    rss_bytes: int,
+    max_documents: int = WORKER_MAX_DOCUMENTS,
+    max_rss_mb: float = WORKER_MAX_RSS_MB,
+) -> Optional[str]:
+    """
+    Decide whether a worker process should be replaced.
+
+    Args:
+        documents (int): Documents the worker has processed.
+        rss_bytes (int): Its current RSS.
+        max_documents (int): Document limit (0: none).
+        max_rss_mb (float): RSS limit in MB (0: none).
+
+    Returns:
+        Optional[str]: Why the worker should be replaced, or None.
+    """
+    if max_documents and documents >= max_documents:
+        return f"{documents} documents processed"
+    if max_rss_mb and rss_bytes > max_rss_mb * 2 ** 20:
+        return f"RSS {rss_bytes / 2 ** 20:.0f} MB above {max_rss_mb:g} MB"
+    return None
+
+
+def _measured(func: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, float, float, int, int]:
+    """Run func(*args) in a worker and return (result, cpu seconds, wall seconds, peak RSS, RSS)."""
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    result = func(*args)
+    return result, time.process_time() - cpu, time.perf_counter() - wall, peak_rss(), current_rss()
+
+
+class Limit:
+    """A thread-safe integer that can be read by one thread and changed by another."""
+
+    def __init__(self, value: int):
+        self._value = value
+        self._lock = threading.Lock()
+
+    def get(self) -> int:
+        with self._lock:
+            return self._value
+
+    def set(self, value: int) -> None:
+        with self._lock:
+            self._value = value
+
+
+class AdaptiveController:
+    """
+    Tune worker count and prefetch depth from observed throughput.
+
+    Args:
+        cpus (Optional[int]): CPUs available (default: available_cpus()).
+        max_workers (Optional[int]): Upper bound on workers (default:
+            WORKERS_MAX_PER_CPU x cpus).
+        memory_bytes (Optional[int]): Memory the workers may use together
+            (default: WORKERS_MEMORY_FRACTION of memory_limit()).
+        interval (float): Seconds between adjustments.
+        tolerance (float): Relative throughput change treated as noise.
+        clock (Callable[[], float]): Time source (for tests).
+    """
+
+    def __init__(
+        self,
+        cpus: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        memory_bytes: Optional[int] = None,
+        interval: float = WORKERS_ADJUST_INTERVAL,
+        tolerance: float = WORKERS_TOLERANCE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cpus = cpus or available_cpus()
+        self.max_workers = max_workers or self.cpus * WORKERS_MAX_PER_CPU
+        if memory_bytes is None:
+            limit = memory_limit()
+            memory_bytes = int(limit * WORKERS_MEMORY_FRACTION) if limit else None
+        self.memory_bytes = memory_bytes
+        self.interval = interval
+        self.tolerance = tolerance
+        self._clock = clock
+
+        self.workers = Limit(self.cpus)
+        self.prefetch = Limit(min(STORAGE_PREFETCH_DEPTH, WORKERS_MAX_PREFETCH))
+        self.max_prefetch = WORKERS_MAX_PREFETCH
+        self.rate: Optional[float] = None
+        self._direction = 1
+        self._peak_rss = 0
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._window_start = self._clock()
+        self._docs = 0
+        self._cpu = 0.0
+        self._wall = 0.0
+        self._input_wait = 0.0
+
+    def record(self, cpu_seconds: float, wall_seconds: float, rss_bytes: int) -> None:
+        """Record one processed document."""
+        self._docs += 1
+        self._cpu += cpu_seconds
+        self._wall += wall_seconds
+        self._peak_rss = max(self._peak_rss, rss_bytes)
+
+    def record_input_wait(self, seconds: float) -> None:
+        """Record time the pool spent waiting for the next input document."""
+        self._input_wait += seconds
+
+    def memory_cap(self) -> int:
+        """Most workers that fit in the memory ceiling at the observed peak RSS."""
+        if not self.memory_bytes or not self._peak_rss:
+            return self.max_workers
+        return max(1, self.memory_bytes // self._peak_rss)
+
+    def settings(self) -> Dict[str, Any]:
+        """Return the current settings and measurements."""
+        return {
+            "workers": self.workers.get(),
+            "prefetch": self.prefetch.get(),
+            "docs_per_sec": round(self.rate or 0.0, 2),
+            "cpu_bound": round(self._cpu / self._wall, 2) if self._wall else None,
+            "peak_rss_mb": round(self._peak_rss / 2 ** 20, 1),
+        }
+
+    def maybe_adjust(self) -> bool:
+        """
+        Adjust the limits if the current window is complete.
+
+        Returns:
+            bool: True if a window was evaluated.
+        """
+        elapsed = self._clock() - self._window_start
+        workers = self.workers.get()
+        if elapsed < self.interval or self._docs < workers:
+            return False
+
+        rate = self._docs / elapsed
+        cpu_ratio = self._cpu / self._wall if self._wall else 1.0
+        input_wait = self._input_wait / elapsed
+
+        upper = min(self.max_workers, self.memory_cap())
+        if cpu_ratio > 0.9:
+            # CPU-bound documents: workers beyond the CPU count only add overhead
+            upper = min(upper, self.cpus)
+
+        previous = self.rate
+        if previous is not None and rate < previous * (1 - self.tolerance):
+            # The last step made things worse: go back the other way
+            self._direction = -self._direction
+            step = self._direction
+        elif previous is None or rate > previous * (1 + self.tolerance):
+            step = self._direction
+        else:
+            # Within noise of the last window: hold
+            step = 0
+        target = max(1, min(upper, workers + step))
+
+        # Grow the prefetch buffer while the pool waits for input
+        prefetch = self.prefetch.get()
+        if input_wait > 0.1 and prefetch < self.max_prefetch:
+            self.prefetch.set(min(self.max_prefetch, prefetch * 2))
+
+        self.rate = rate
+        if target != workers:
+            self.workers.set(target)
+        logger.info(
+            "Concurrency: workers %d -> %d, prefetch %d (%.1f docs/s, cpu %.0f%%, input wait %.0f%%, "
+            "peak RSS %.0f MB, cap %d)",
+            workers, target, self.prefetch.get(), rate, cpu_ratio * 100, input_wait * 100,
+            self._peak_rss / 2 ** 20, upper,
+        )
+        self._reset_window()
+        return True
+
+
+class _WorkerProcess:
+    """One worker process, running one document at a time so it can be replaced on its own."""
+
+    def __init__(self, context: multiprocessing.context.BaseContext):
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(worker_logging_settings(),),
+        )
+        self.documents = 0
+
+    def submit(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> Future:
+        return self.executor.submit(_measured, func, args)
+
+    def retire(self, wait: bool = False) -> None:
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def run_pool(
+    items: Iterable[Tuple[Any, ...]],
+    func: Callable[..., Any],
+    workers: int,
+    controller: Optional[AdaptiveController] = None,
+    max_documents: int = WORKER_MAX_DOCUMENTS,
+    max_rss_mb: float = WORKER_MAX_RSS_MB,
+    start_method: str = WORKER_START_METHOD,
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Run func(*item) for every item on worker processes.
+
+    Items are pulled from ``items`` only when a worker is free, so a lazy
+    source (e.g. prefetched object store documents) is never read far
+    ahead. With a controller the number of workers follows its workers
+    limit. A worker is replaced by a fresh process once recycle_reason()
+    says so, or if it dies (e.g. killed for memory).
+
+    Args:
+        items (Iterable[Tuple[Any, ...]]): Argument tuples for func.
+        func (Callable[..., Any]): Picklable top-level function.
+        workers (int): Fixed number of workers (ignored with a controller).
+        controller (Optional[AdaptiveController]): Tunes the number of workers.
+        max_documents (int): Documents per worker process (0: no limit).
+        max_rss_mb (float): RSS in MB above which a worker is replaced (0: no limit).
+        start_method (str): How worker processes start (see worker_context).
+
+    Yields:
+        Tuple[int, Any]: (item index, func result) in completion order.
+        An exception raised by func is yielded as the result.
+    """
+    limit = controller.workers if controller else Limit(workers)
+    context = worker_context(start_method)
+    source = enumerate(items)
+    idle: List[_WorkerProcess] = []
+    busy: Dict[Future, Tuple[_WorkerProcess, int]] = {}
+    exhausted = False
+    recycled = 0
+
+    try:
+        while True:
+            while not exhausted and len(busy) < limit.get():
+                started = time.perf_counter()
+                item = next(source, None)
+                if controller:
+                    controller.record_input_wait(time.perf_counter() - started)
+                if item is None:
+                    exhausted = True
+                    break
+                index, args = item
+                # Processes are started on demand, so unused slots cost nothing
+                worker = idle.pop() if idle else _WorkerProcess(context)
+                busy[worker.submit(func, args)] = (worker, index)
+
+            # Stop idle workers above a lowered limit
+            while idle and len(idle) + len(busy) > limit.get():
+                idle.pop().retire()
+
+            if not busy:
+                break
+
+            done, _ = wait(busy, return_when=FIRST_COMPLETED)
+            for future in done:
+                worker, index = busy.pop(future)
+                try:
+                    result, cpu, wall, peak, rss = future.result()
+                except BrokenProcessPool as e:
+                    worker.retire()
+                    yield index, e
+                    continue
+                except Exception as e:
+                    idle.append(worker)
+                    yield index, e
+                    continue
+
+                worker.documents += 1
+                reason = recycle_reason(worker.documents, rss, max_documents, max_rss_mb)
+                if reason:
+                    logger.info("Recycling worker process after %d document(s): %s", worker.documents, reason)
+                    worker.retire()
+                    recycled += 1
+                else:
+                    idle.append(worker)
+                if controller:
+                    controller.record(cpu, wall, peak)
+                yield index, result
+
+            if controller:
+                controller.maybe_adjust()
+    finally:
+        for worker in idle:
+            worker.retire(wait=True)
+        for worker, _ in busy.values():
+            worker.retire()
+        if recycled:
+            logger.info("Recycled %d worker process(es)", recycled)
@@ -0,0 +1,129 @@
+"""
+Tests for the asyncio processing module.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from src.aio import aprocess_resume, aprocess_many, create_executor
+
+
+def _fake_process_resume(pdf_path):
+    """Stand-in for process_resume that takes longer for later files."""
+    time.sleep(0.01 * int(pdf_path.split(".")[0]))
+    return {"File": pdf_path}
+
+
+class TestAprocessResume:
+    """Test suite for aprocess_resume function."""
+    
+    @patch('src.aio.process_resume', side_effect=_fake_process_resume)
+    def test_aprocess_resume_returns_result(self, mock_process):
+        """Test that the pipeline result is returned to the coroutine."""
+        with ThreadPoolExecutor(2) as executor:
+            result = asyncio.run(aprocess_resume("1.pdf", executor=executor))
+        assert result == {"File": "1.pdf"}
+        mock_process.assert_called_once_with("1.pdf")
+
+
+class TestAprocessMany:
+    """Test suite for aprocess_many function."""
+    
+    @patch('src.aio.process_resume', side_effect=_fake_process_resume)
+    def test_aprocess_many_yields_all_results(self, mock_process):
+        """Test that every path is processed, in completion order."""
+        async def collect():
+            with ThreadPoolExecutor(4) as executor:
+                return [item async for item in aprocess_many(["5.pdf", "1.pdf", "3.pdf"], executor=executor)]
+        
+        results = asyncio.run(collect())
+        assert [path for path, _ in results] == ["1.pdf", "3.pdf", "5.pdf"]
+    
+    def test_aprocess_many_respects_concurrency(self):
+        """Test that no more than `concurrency` documents run at once."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+        
+        def tracked(pdf_path):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return {}
+        
+        async def collect():
+            with ThreadPoolExecutor(8) as executor:
+                return [item async for item in aprocess_many(
+                    (f"{i}.pdf" for i in range(12)), executor=executor, concurrency=3
+                )]
+        
+        with patch('src.aio.process_resume', side_effect=tracked):
+            results = asyncio.run(collect())
+        assert len(results) == 12
+        assert state["peak"] <= 3
+    
+    @patch('src.aio.process_resume', side_effect=_fake_process_resume)
+    def test_aprocess_many_accepts_async_iterable(self, mock_process):
+        """Test that paths may come from an async generator."""
+        async def paths():
+            for i in range(3):
+                yield f"{i}.pdf"
+        
+        async def collect():
+            with ThreadPoolExecutor(2) as executor:
+                return [path async for path, _ in aprocess_many(paths(), executor=executor)]
+        
+        assert sorted(asyncio.run(collect())) == ["0.pdf", "1.pdf", "2.pdf"]
+    
+    @patch('src.aio.process_resume', side_effect=_fake_process_resume)
+    def test_aprocess_many_cancels_queued_work(self, mock_process):
+        """Test that closing the iterator early stops pulling new paths."""
+        async def first_only():
+            with ThreadPoolExecutor(1) as executor:
+                stream = aprocess_many((f"{i}.pdf" for i in range(1, 50)), executor=executor, concurrency=2)
+                item = await stream.__anext__()
+                await stream.aclose()
+                return item
+        
+        path, _ = asyncio.run(first_only())
+        assert path == "1.pdf"
+        assert mock_process.call_count <= 3
+    
+    def test_aprocess_many_invalid_concurrency(self):
+        """Test that a non-positive concurrency raises ValueError."""
+        async def consume():
+            async for _ in aprocess_many(["a.pdf"], concurrency=0):
+                pass
+        
+        with pytest.raises(ValueError):
+            asyncio.run(consume())
+
+
+class TestCreateExecutor:
+    """Test suite for create_executor function."""
+    
+    def test_create_executor_invalid_kind(self):
+        """Test that an unknown executor kind raises ValueError."""
+        with pytest.raises(ValueError):
+            create_executor("gpu")
+    
+    def test_create_process_executor_runs_pipeline(self, tmp_path):
+        """Test the default process executor end to end on a real PDF."""
+        import fitz
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Jane Doe\njane@example.com\nSKILLS\nPython")
+        pdf_path = str(tmp_path / "jane.pdf")
+        doc.save(pdf_path)
+        
+        executor = create_executor("process", max_workers=1)
+        try:
+            result = asyncio.run(aprocess_resume(pdf_path, executor=executor))
+        finally:
+            executor.shutdown()
+        assert result["Email"] == "jane@example.com"
+        assert result["Skills"] == ["Python"]
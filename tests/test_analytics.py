@@ -0,0 +1,118 @@
+"""
+Tests for the skill analytics module.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from src.analytics import SkillAggregate, aggregate_results, iter_result_chunks, split_skills, UNKNOWN_EDUCATION
+
+
+@pytest.fixture
+def results_csv(tmp_path):
+    """Write a small results CSV in run.py's format."""
+    df = pd.DataFrame({
+        "Name": ["A", "B", "C", "D"],
+        "Skills": ["Python, SQL, Docker", "Python, SQL", "", "Java, Cobol"],
+        "Education": ["Bachelor", "Master", None, "Bachelor"],
+    })
+    path = tmp_path / "parsed_resumes.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+class TestSplitSkills:
+    """Test suite for split_skills function."""
+    
+    def test_list_string_and_missing(self):
+        """Test parser lists, CSV cells and empty values."""
+        assert split_skills(["Python", "SQL"]) == ["Python", "SQL"]
+        assert split_skills("Python, SQL,") == ["Python", "SQL"]
+        assert split_skills(float("nan")) == []
+        assert split_skills("") == []
+
+
+class TestSkillAggregate:
+    """Test suite for SkillAggregate class."""
+    
+    def test_add_counts_and_cooccurrence(self):
+        """Test skill counts and the symmetric co-occurrence matrix."""
+        agg = SkillAggregate(["Python", "SQL", "Java"], ["Bachelor"])
+        agg.add(["Python", "SQL"], "Bachelor")
+        agg.add(["Python"], None)
+        assert agg.skill_counts.tolist() == [2, 1, 0]
+        assert agg.cooccurrence.tolist() == [[2, 1, 0], [1, 1, 0], [0, 0, 0]]
+        assert agg.top_pairs() == [("Python", "SQL", 1)]
+    
+    def test_education_breakdown(self):
+        """Test education x skill counts, with unknown education grouped."""
+        agg = SkillAggregate(["Python", "SQL"], ["Bachelor", "Master"])
+        agg.add_frame(pd.DataFrame({
+            "Skills": ["Python, SQL", "SQL", "Python"],
+            "Education": ["Bachelor", "Bachelor", "Diploma"],
+        }))
+        breakdown = agg.education_breakdown()
+        assert breakdown["Bachelor"] == {"documents": 2, "top_skills": [("SQL", 2), ("Python", 1)]}
+        assert breakdown[UNKNOWN_EDUCATION]["documents"] == 1
+        assert "Master" not in breakdown
+    
+    def test_unknown_skills_are_counted(self):
+        """Test that skills outside the vocabulary are ignored but counted."""
+        agg = SkillAggregate(["Python"], [])
+        agg.add(["Python", "Cobol"])
+        assert agg.unknown_skills == 1
+        assert agg.skill_counts.tolist() == [1]
+    
+    def test_merge_equals_single_pass(self):
+        """Test that merged shards equal one aggregate over all rows."""
+        rows = [(["Python", "SQL"], "Bachelor"), (["SQL"], "Master"), (["Python"], None)]
+        whole = SkillAggregate(["Python", "SQL"], ["Bachelor", "Master"])
+        first = SkillAggregate(["Python", "SQL"], ["Bachelor", "Master"])
+        second = SkillAggregate(["Python", "SQL"], ["Bachelor", "Master"])
+        for i, (skills, education) in enumerate(rows):
+            whole.add(skills, education)
+            (first if i == 0 else second).add(skills, education)
+        merged = first.merge(second)
+        assert np.array_equal(merged.cooccurrence, whole.cooccurrence)
+        assert np.array_equal(merged.education_skill, whole.education_skill)
+        assert merged.documents == 3
+    
+    def test_merge_different_vocabulary_raises(self):
+        """Test that aggregates over different vocabularies cannot be merged."""
+        with pytest.raises(ValueError):
+            SkillAggregate(["Python"], []).merge(SkillAggregate(["Java"], []))
+    
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test that a saved aggregate loads back identically."""
+        agg = SkillAggregate(["Python", "SQL"], ["Bachelor"])
+        agg.add(["Python", "SQL"], "Bachelor")
+        path = str(tmp_path / "agg.json")
+        agg.save(path)
+        loaded = SkillAggregate.load(path)
+        assert loaded.to_dict() == agg.to_dict()
+
+
+class TestAggregateResults:
+    """Test suite for aggregate_results function."""
+    
+    def test_aggregate_csv_in_chunks(self, results_csv):
+        """Test that chunk size does not change the result."""
+        small = aggregate_results([results_csv], chunksize=1)
+        large = aggregate_results([results_csv], chunksize=1000)
+        assert small.to_dict() == large.to_dict()
+        assert small.documents == 4
+        assert dict(small.top_skills())["Python"] == 2
+    
+    def test_aggregate_merges_saved_shards(self, results_csv, tmp_path):
+        """Test that saved reports are merged as shards."""
+        shard = str(tmp_path / "shard.json")
+        aggregate_results([results_csv]).save(shard)
+        total = aggregate_results([results_csv, shard])
+        assert total.documents == 8
+        assert dict(total.top_skills())["SQL"] == 4
+    
+    def test_iter_result_chunks_columns(self, results_csv):
+        """Test that only the needed columns are read."""
+        chunks = list(iter_result_chunks(results_csv, chunksize=3))
+        assert [len(c) for c in chunks] == [3, 1]
+        assert list(chunks[0].columns) == ["Skills", "Education"]
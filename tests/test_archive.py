@@ -0,0 +1,94 @@
+"""
+Tests for the archive input module.
+"""
+
+import io
+import os
+import tarfile
+import zipfile
+import pytest
+from src.archive import is_archive, iter_archive_members, count_archive_members, member_path
+
+
+MEMBERS = {
+    "batch1/alice.pdf": b"%PDF-alice",
+    "batch1/notes.md": b"not a resume",
+    "bob.PDF": b"%PDF-bob",
+}
+
+
+@pytest.fixture
+def zip_archive(tmp_path):
+    """Create a ZIP archive with MEMBERS."""
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in MEMBERS.items():
+            zf.writestr(name, data)
+    return str(path)
+
+
+@pytest.fixture
+def tar_archive(tmp_path):
+    """Create a gzip-compressed TAR archive with MEMBERS."""
+    path = tmp_path / "export.tar.gz"
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in MEMBERS.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+class TestIterArchiveMembers:
+    """Test suite for iter_archive_members function."""
+    
+    @pytest.mark.parametrize("archive", ["zip_archive", "tar_archive"])
+    def test_iter_yields_pdf_members(self, archive, request):
+        """Test that only PDF members are yielded with their contents."""
+        path = request.getfixturevalue(archive)
+        members = dict(iter_archive_members(path))
+        assert members == {"batch1/alice.pdf": b"%PDF-alice", "bob.PDF": b"%PDF-bob"}
+    
+    def test_iter_skips_oversized_members(self, zip_archive):
+        """Test that members above the size limit are skipped."""
+        members = dict(iter_archive_members(zip_archive, max_member_bytes=9))
+        assert members == {"bob.PDF": b"%PDF-bob"}
+    
+    def test_iter_rejects_non_archive(self, tmp_path):
+        """Test that a non-archive file raises ValueError."""
+        path = tmp_path / "fake.zip"
+        path.write_bytes(b"plain bytes")
+        with pytest.raises(ValueError):
+            list(iter_archive_members(str(path)))
+
+
+class TestArchiveHelpers:
+    """Test suite for archive helper functions."""
+    
+    def test_is_archive(self, zip_archive, tar_archive, tmp_path):
+        """Test archive detection by extension and existence."""
+        assert is_archive(zip_archive)
+        assert is_archive(tar_archive)
+        assert not is_archive(str(tmp_path))
+        assert not is_archive(str(tmp_path / "missing.zip"))
+    
+    def test_count_archive_members(self, zip_archive, tar_archive):
+        """Test that ZIP members are counted and TAR counts are unknown."""
+        assert count_archive_members(zip_archive) == 2
+        assert count_archive_members(tar_archive) is None
+    
+    def test_count_matches_iteration(self, tmp_path):
+        """Test that hidden and oversized members are not counted."""
+        path = tmp_path / "export.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            for name, data in MEMBERS.items():
+                zf.writestr(name, data)
+            zf.writestr("batch1/._alice.pdf", b"%PDF-meta")
+        for limit in (9, 100):
+            count = count_archive_members(str(path), max_member_bytes=limit)
+            assert count == len(list(iter_archive_members(str(path), max_member_bytes=limit)))
+        assert count_archive_members(str(path), max_member_bytes=9) == 1
+    
+    def test_member_path(self, zip_archive):
+        """Test the display path of a member."""
+        assert member_path(zip_archive, "batch1/alice.pdf") == os.path.join(zip_archive, "batch1/alice.pdf")
@@ -0,0 +1,61 @@
+"""
+Tests for the batch parsing module.
+"""
+
+import pytest
+import pandas as pd
+from src.batch import parse_resumes, iter_parse_resumes
+from src.parser import parse_resume
+
+
+SAMPLE_TEXTS = [
+    "John Smith john.smith@example.com 1234567890 Bachelor of Science Python, SQL",
+    "Jane Doe EDUCATION MBA SKILLS Docker, AWS EXPERIENCE Tableau consulting",
+    "No contact details here",
+    "",
+    "ALICE JONES (123) 456-7890 M.Tech Machine Learning, Pandas, NumPy",
+]
+
+
+class TestParseResumes:
+    """Test suite for parse_resumes function."""
+    
+    def test_parse_resumes_matches_parse_resume(self):
+        """Test that batch results equal per-document parse_resume results."""
+        df = parse_resumes(SAMPLE_TEXTS, batch_size=2)
+        assert len(df) == len(SAMPLE_TEXTS)
+        for idx, text in enumerate(SAMPLE_TEXTS):
+            expected = parse_resume(text)
+            row = df.iloc[idx].to_dict()
+            assert row == expected
+    
+    def test_parse_resumes_columns(self):
+        """Test the columnar result layout."""
+        df = parse_resumes(SAMPLE_TEXTS[:1])
+        assert list(df.columns) == ["Name", "Email", "Phone", "Education", "Skills"]
+        assert df.loc[0, "Skills"] == ["Python", "SQL"]
+    
+    def test_parse_resumes_empty_input(self):
+        """Test that empty input yields an empty DataFrame."""
+        df = parse_resumes([])
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 0
+    
+    def test_parse_resumes_accepts_generator(self):
+        """Test that any iterable of texts is accepted."""
+        df = parse_resumes(text for text in SAMPLE_TEXTS)
+        assert len(df) == len(SAMPLE_TEXTS)
+
+
+class TestIterParseResumes:
+    """Test suite for iter_parse_resumes function."""
+    
+    def test_iter_parse_resumes_batches(self):
+        """Test that texts are split into batches of the given size."""
+        frames = list(iter_parse_resumes(SAMPLE_TEXTS, batch_size=2))
+        assert [len(f) for f in frames] == [2, 2, 1]
+    
+    def test_iter_parse_resumes_invalid_batch_size(self):
+        """Test that a non-positive batch size raises ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_parse_resumes(SAMPLE_TEXTS, batch_size=0))
@@ -0,0 +1,185 @@
+"""
+Tests for the result cache module.
+"""
+
+import os
+import time
+import pytest
+from unittest.mock import patch
+from src.cache import ResultCache, content_key, parser_version
+from src.pipeline import process_resume
+from src.profiles import ParserProfile
+
+RESULT = {"Name": "John Smith", "Email": "john@example.com", "Education": "Bachelor", "Skills": ["Python"]}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(memory_bytes=2 ** 20, disk_dir=str(tmp_path / "cache"), disk_bytes=2 ** 20)
+
+
+class TestKeys:
+    """Test suite for cache keys."""
+    
+    def test_key_depends_on_content(self):
+        """Test that equal bytes share a key and different bytes do not."""
+        assert content_key(b"resume") == content_key(b"resume")
+        assert content_key(b"resume") != content_key(b"resume 2")
+    
+    def test_key_depends_on_profile(self):
+        """Test that another parser profile gets another version."""
+        profile = ParserProfile(["Python"], ["Bachelor"], {})
+        assert parser_version(profile) != parser_version()
+        assert content_key(b"resume", profile) != content_key(b"resume")
+    
+    @patch('src.pipeline.extract_text')
+    def test_key_depends_on_file_type(self, mock_extract, cache):
+        """Test that the same bytes as .txt and .pdf are cached separately."""
+        mock_extract.side_effect = ["John Smith\njohn@example.com", "Jane Doe\njane@example.com"]
+        as_text = process_resume("resume.txt", data=b"%PDF-1.4 bytes", cache=cache)
+        as_pdf = process_resume("resume.pdf", data=b"%PDF-1.4 bytes", cache=cache)
+        
+        assert mock_extract.call_count == 2
+        assert (as_text["Email"], as_pdf["Email"]) == ("john@example.com", "jane@example.com")
+
+
+class TestResultCache:
+    """Test suite for ResultCache class."""
+    
+    def test_get_returns_copy(self, cache):
+        """Test that a hit cannot be modified through the caller's dict."""
+        cache.put("k", RESULT)
+        first = cache.get("k")
+        first["Skills"].append("SQL")
+        assert cache.get("k") == RESULT
+    
+    def test_counters(self, cache):
+        """Test hit, miss and store counters."""
+        assert cache.get("k") is None
+        cache.put("k", RESULT)
+        cache.get("k")
+        stats = cache.stats()
+        assert (stats["misses"], stats["stores"], stats["memory_hits"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+    
+    def test_memory_lru_eviction(self, tmp_path):
+        """Test that the least recently used entry leaves memory first."""
+        size = len(b'{"Name":"John Smith","Email":"john@example.com","Education":"Bachelor","Skills":["Python"]}')
+        cache = ResultCache(memory_bytes=2 * size, disk_dir=None)
+        cache.put("a", RESULT)
+        cache.put("b", RESULT)
+        cache.get("a")
+        cache.put("c", RESULT)
+        assert cache.get("b") is None
+        assert cache.get("a") == cache.get("c") == RESULT
+        stats = cache.stats()
+        assert stats["memory_bytes"] <= 2 * size
+        assert stats["memory_evictions"] == 1
+    
+    def test_disk_tier_is_shared(self, cache):
+        """Test that another cache on the same directory sees stored results."""
+        cache.put("k", RESULT)
+        other = ResultCache(memory_bytes=2 ** 20, disk_dir=cache.disk_dir, disk_bytes=2 ** 20)
+        assert other.stats()["disk_entries"] == 1
+        assert other.get("k") == RESULT
+        assert other.get("k") == RESULT
+        stats = other.stats()
+        assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+    
+    def test_disk_eviction(self, tmp_path):
+        """Test that the disk tier stays under its byte limit."""
+        cache = ResultCache(memory_bytes=0, disk_dir=str(tmp_path), disk_bytes=250)
+        for key in ("a1", "b2", "c3"):
+            cache.put(key, RESULT)
+        stats = cache.stats()
+        assert stats["disk_entries"] == 2
+        assert stats["disk_bytes"] <= 250
+        assert not os.path.exists(cache._path("a1"))
+        assert cache.get("a1") is None
+        assert cache.get("c3") == RESULT
+    
+    def test_disk_limit_is_shared(self, tmp_path):
+        """Test that caches on one directory keep it under the limit together."""
+        first = ResultCache(memory_bytes=0, disk_dir=str(tmp_path), disk_bytes=500)
+        second = ResultCache(memory_bytes=0, disk_dir=str(tmp_path), disk_bytes=500)
+        for i in range(10):
+            (first if i % 2 else second).put(f"k{i}", RESULT)
+        
+        files = [os.path.join(root, name) for root, _, names in os.walk(tmp_path) for name in names if name.endswith(".json")]
+        assert sum(os.path.getsize(path) for path in files) <= 500
+        assert first.stats()["disk_entries"] == second.stats()["disk_entries"] == len(files)
+        assert first.get("k0") is None
+        assert first.get("k9") == second.get("k9") == RESULT
+    
+    def test_unwritable_directory_is_not_fatal(self, tmp_path):
+        """Test that disk errors are counted instead of raised."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = ResultCache(disk_dir=str(blocker))
+        cache.put("k", RESULT)
+        assert cache.get("k") == RESULT
+        assert cache.stats()["errors"] >= 1
+    
+    def test_clear(self, cache):
+        """Test that clear empties both tiers."""
+        cache.put("k", RESULT)
+        cache.clear()
+        assert cache.get("k") is None
+        assert not os.path.exists(cache._path("k"))
+
+
+class TestProcessResumeCache:
+    """Test suite for process_resume with a result cache."""
+    
+    @patch('src.pipeline.parse_resume')
+    @patch('src.pipeline.normalize_text')
+    @patch('src.pipeline.extract_text')
+    def test_identical_content_skips_extraction(self, mock_extract, mock_normalize, mock_parse, cache):
+        """Test that the same bytes under another name are served from the cache."""
+        mock_extract.return_value = "Raw text"
+        mock_normalize.return_value = "Cleaned text"
+        mock_parse.return_value = dict(RESULT)
+        
+        first = process_resume("/in/a.pdf", data=b"%PDF same", cache=cache)
+        second = process_resume("/in/b.pdf", data=b"%PDF same", cache=cache)
+        
+        assert mock_extract.call_count == 1
+        assert second["Name"] == first["Name"]
+        assert (first["File"], second["File"]) == ("a.pdf", "b.pdf")
+        assert second["FilePath"] == os.path.abspath("/in/b.pdf")
+        assert cache.stats()["memory_hits"] == 1
+    
+    @patch('src.pipeline.extract_text')
+    def test_use_cache_false_bypasses_default_cache(self, mock_extract, cache):
+        """Test that use_cache=False parses even when a cache is enabled."""
+        mock_extract.return_value = "John Smith\njohn@example.com"
+        with patch('src.pipeline.default_cache', return_value=cache):
+            process_resume("a.pdf", data=b"%PDF same")
+            process_resume("b.pdf", data=b"%PDF same", use_cache=False)
+        
+        assert mock_extract.call_count == 2
+        assert cache.stats()["stores"] == 1
+        assert cache.stats()["memory_hits"] == 0
+    
+    @patch('src.pipeline.extract_text')
+    def test_reads_file_once(self, mock_extract, cache, tmp_path):
+        """Test that a path is read once and its bytes passed to the extractor."""
+        path = tmp_path / "resume.pdf"
+        path.write_bytes(b"%PDF bytes")
+        mock_extract.return_value = ""
+        
+        assert process_resume(str(path), cache=cache) is None
+        mock_extract.assert_called_once_with(str(path), data=b"%PDF bytes")
+        assert cache.stats()["stores"] == 0
+    
+    def test_hit_is_fast(self, cache):
+        """Test that a cached result is returned without parsing the PDF."""
+        data = b"%PDF-1.4 not a real document"
+        key = content_key(data, extractor="src.extract_text.extract_text_from_pdf")
+        cache.put(key, RESULT)
+        start = time.perf_counter()
+        for _ in range(1000):
+            result = process_resume("x.pdf", data=data, cache=cache)
+        elapsed = (time.perf_counter() - start) / 1000
+        assert result["Name"] == "John Smith"
+        assert elapsed < 0.001
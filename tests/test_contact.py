@@ -0,0 +1,86 @@
+"""
+Tests for the linear-time contact scanning module.
+"""
+
+import re
+import time
+import pytest
+from config import EMAIL_PATTERN, PHONE_PATTERN
+from src.contact import find_email, find_phone
+
+
+EMAIL_REGEX = re.compile(EMAIL_PATTERN, re.IGNORECASE)
+PHONE_REGEX = re.compile(PHONE_PATTERN)
+
+SAMPLES = [
+    "",
+    "john.smith@example.com",
+    "Contact me at john@company.co.uk for details",
+    "bad@domain, good@domain.org.",
+    "a@b.co-uk and x@@y.z",
+    "@example.com user@ user@host",
+    "x@abc@d.com",
+    "mail: first.last+tag@sub-domain.example.io!",
+    "1234567890",
+    "(123) 456-7890",
+    "(123)4567890 and (123) 456 7890",
+    "+1-1234567890",
+    "+911234567890 or +44 1234567890",
+    "12345678901 123456789 a1234567890",
+    "+12345 1234567890",
+    "Call (123 456-7890 or 123-456-7890",
+]
+
+# Inputs that make backtracking patterns scan quadratically
+ADVERSARIAL = {
+    "word_run": "a" * 200000,
+    "dotted_run": "a." * 100000,
+    "at_then_dots": "a@" + "a." * 100000,
+    "many_ats": "a@" * 100000,
+    "base64": "QUJD" * 50000 + "==",
+    "digit_run": "1" * 200000,
+    "plus_digits": "+1" * 100000,
+    "parens": "(123)" * 40000,
+}
+
+
+class TestFindEmail:
+    """Test suite for find_email function."""
+    
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_find_email_matches_regex(self, text):
+        """Test that results equal the first EMAIL_PATTERN match."""
+        match = EMAIL_REGEX.search(text)
+        assert find_email(text) == (match.group(0) if match else None)
+    
+    def test_find_email_not_found(self):
+        """Test when no email is present."""
+        assert find_email("No email here") is None
+    
+    @pytest.mark.parametrize("name", sorted(ADVERSARIAL))
+    def test_find_email_adversarial_is_fast(self, name):
+        """Test that pathological input is scanned in bounded time."""
+        start = time.perf_counter()
+        find_email(ADVERSARIAL[name])
+        assert time.perf_counter() - start < 1.0
+
+
+class TestFindPhone:
+    """Test suite for find_phone function."""
+    
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_find_phone_matches_regex(self, text):
+        """Test that results equal the first PHONE_PATTERN match."""
+        match = PHONE_REGEX.search(text)
+        assert find_phone(text) == (match.group(0) if match else None)
+    
+    def test_find_phone_not_found(self):
+        """Test when no phone number is present."""
+        assert find_phone("No phone number here") is None
+    
+    @pytest.mark.parametrize("name", sorted(ADVERSARIAL))
+    def test_find_phone_adversarial_is_fast(self, name):
+        """Test that pathological input is scanned in bounded time."""
+        start = time.perf_counter()
+        find_phone(ADVERSARIAL[name])
+        assert time.perf_counter() - start < 1.0
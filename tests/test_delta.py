@@ -0,0 +1,115 @@
+"""
+Tests for the delta output module.
+"""
+
+import pandas as pd
+import pytest
+
+from src.delta import (
+    DELETE, INSERT, UPDATE,
+    compute_delta, delta_path, delta_to_frame, normalize_record, record_hash,
+)
+
+
+def _result(name, skills, path):
+    return {"Name": name, "Email": None, "Skills": skills, "File": path.rsplit("/", 1)[-1], "FilePath": path}
+
+
+def _write_previous(tmp_path, results):
+    """Write results the way save_results does."""
+    df = pd.DataFrame(results)
+    df["Skills"] = df["Skills"].apply(lambda x: ", ".join(x) if isinstance(x, list) else x)
+    path = tmp_path / "previous.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+class TestNormalize:
+    """Test cases for normalize_record and record_hash."""
+    
+    def test_matches_csv_form(self):
+        """Test that lists are joined and missing values are empty."""
+        record = normalize_record({"Skills": ["Python", "SQL"], "Email": None, "Score": float("nan")})
+        assert record == {"Skills": "Python, SQL", "Email": "", "Score": ""}
+    
+    def test_hash_depends_on_content_and_columns(self):
+        """Test that a changed field changes the hash and missing columns hash as empty."""
+        columns = ["A", "B"]
+        assert record_hash({"A": "1", "B": "2"}, columns) != record_hash({"A": "1", "B": "3"}, columns)
+        assert record_hash({"A": "1"}, columns) == record_hash({"A": "1", "B": ""}, columns)
+        assert record_hash({"A": "12", "B": ""}, columns) != record_hash({"A": "1", "B": "2"}, columns)
+
+
+class TestComputeDelta:
+    """Test cases for compute_delta."""
+    
+    def test_no_previous_output(self, tmp_path):
+        """Test that every record is an insert without a previous output."""
+        results = [_result("Ann", ["Python"], "/r/a.pdf")]
+        delta = compute_delta(results, str(tmp_path / "missing.csv"))
+        assert len(delta.inserted) == 1
+        assert delta.updated == [] and delta.deleted == []
+    
+    def test_unchanged_round_trip(self, tmp_path):
+        """Test that results identical to the previous output produce no changes."""
+        results = [_result("Ann", ["Python", "SQL"], "/r/a.pdf"), _result("Bob", [], "/r/b.pdf")]
+        delta = compute_delta(results, _write_previous(tmp_path, results))
+        assert delta.changes == 0
+        assert delta.unchanged == 2
+    
+    def test_insert_update_delete(self, tmp_path):
+        """Test that each kind of change is detected with the changed fields."""
+        previous = [
+            _result("Ann", ["Python"], "/r/a.pdf"),
+            _result("Bob", ["Java"], "/r/b.pdf"),
+            _result("Cid", ["Go"], "/r/c.pdf"),
+        ]
+        current = [
+            _result("Ann", ["Python"], "/r/a.pdf"),
+            _result("Bob", ["Java", "SQL"], "/r/b.pdf"),
+            _result("Dee", ["C++"], "/r/d.pdf"),
+        ]
+        delta = compute_delta(current, _write_previous(tmp_path, previous), chunksize=1)
+        assert [r["FilePath"] for r in delta.inserted] == ["/r/d.pdf"]
+        assert [(r["FilePath"], fields) for r, fields in delta.updated] == [("/r/b.pdf", ["Skills"])]
+        assert delta.deleted == ["/r/c.pdf"]
+        assert delta.unchanged == 1
+    
+    def test_new_column_is_a_change(self, tmp_path):
+        """Test that a field added to the results shows as an update."""
+        previous = [_result("Ann", ["Python"], "/r/a.pdf")]
+        current = [dict(previous[0], Phone="555")]
+        delta = compute_delta(current, _write_previous(tmp_path, previous))
+        assert delta.updated[0][1] == ["Phone"]
+    
+    def test_previous_without_key_column(self, tmp_path):
+        """Test that a previous output without FilePath is rejected."""
+        path = tmp_path / "previous.csv"
+        path.write_text("Name\nAnn\n")
+        with pytest.raises(ValueError):
+            compute_delta([], str(path))
+
+
+class TestDeltaFrame:
+    """Test cases for delta_to_frame and delta_path."""
+    
+    def test_frame_layout(self, tmp_path):
+        """Test one row per change with the change kind and changed fields."""
+        previous = [_result("Ann", ["Python"], "/r/a.pdf"), _result("Bob", ["Go"], "/r/b.pdf")]
+        current = [_result("Ann", ["Rust"], "/r/a.pdf"), _result("Cid", ["C"], "/r/c.pdf")]
+        df = delta_to_frame(compute_delta(current, _write_previous(tmp_path, previous)))
+        assert list(df["Change"]) == [INSERT, UPDATE, DELETE]
+        assert list(df["FilePath"]) == ["/r/c.pdf", "/r/a.pdf", "/r/b.pdf"]
+        assert df["ChangedFields"][1] == "Skills"
+    
+    def test_empty_delta(self, tmp_path):
+        """Test that an empty delta still has a header."""
+        results = [_result("Ann", ["Python"], "/r/a.pdf")]
+        df = delta_to_frame(compute_delta(results, _write_previous(tmp_path, results)))
+        assert df.empty
+        assert "FilePath" in df.columns
+    
+    def test_delta_path(self):
+        """Test the delta file name."""
+        assert delta_path("/out/parsed_resumes.csv", ".delta") == "/out/parsed_resumes.delta.csv"
+        assert delta_path("/out/results", ".delta") == "/out/results.delta.csv"
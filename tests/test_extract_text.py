@@ -4,8 +4,12 @@ Tests for the text extraction module.
 
 import pytest
 import os
+import time
+import threading
+import fitz
 from unittest.mock import Mock, patch, MagicMock
-from src.extract_text import extract_text_from_pdf
+import src.extract_text as extract_module
+from src.extract_text import extract_text_from_pdf, ExtractOptions, text_flags
 
 
 class TestExtractTextFromPDF:
@@ -64,3 +68,146 @@ class TestExtractTextFromPDF:
             
             with pytest.raises(FileNotFoundError):
                 extract_text_from_pdf("nonexistent.pdf")
+    
+    def test_extract_text_from_bytes(self):
+        """Test extraction from PDF bytes already in memory."""
+        with patch('src.extract_text.fitz.open') as mock_open:
+            mock_doc = MagicMock()
+            mock_page = MagicMock()
+            mock_page.get_text.return_value = "Archived resume"
+            mock_doc.__iter__.return_value = [mock_page]
+            mock_doc.__enter__.return_value = mock_doc
+            mock_doc.__exit__.return_value = None
+            mock_open.return_value = mock_doc
+            
+            result = extract_text_from_pdf("export.zip/resume.pdf", data=b"%PDF")
+            
+            assert result == "Archived resume"
+            mock_open.assert_called_once_with(stream=b"%PDF", filetype="pdf")
+
+
+@pytest.fixture
+def annotated_pdf(tmp_path):
+    """Write a one-page PDF with a header, body lines, footer and annotation."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 30), "Careers Portal Header")
+    page.insert_text((72, 100), "John Smith john@example.com")
+    page.insert_text((72, 120), "SKILLS Python, SQL")
+    page.insert_text((72, 820), "Page 1 of 1")
+    page.add_freetext_annot(fitz.Rect(300, 300, 500, 340), "Reviewer note")
+    path = tmp_path / "annotated.pdf"
+    doc.save(str(path))
+    return str(path)
+
+
+class TestExtractOptions:
+    """Test suite for extraction options."""
+    
+    def test_default_includes_everything(self, annotated_pdf):
+        """Test that default options extract header, footer and annotation."""
+        text = extract_text_from_pdf(annotated_pdf)
+        assert "Careers Portal Header" in text
+        assert "Reviewer note" in text
+    
+    def test_skip_annotations(self, annotated_pdf):
+        """Test that annotation text is dropped but page content kept."""
+        text = extract_text_from_pdf(annotated_pdf, options=ExtractOptions(skip_annotations=True))
+        assert "Reviewer note" not in text
+        assert "SKILLS Python, SQL" in text
+    
+    def test_skip_annotations_on_rotated_page(self, tmp_path):
+        """Test skipping annotations and form fields on a rotated page."""
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((72, 100), "John Smith john@example.com")
+        page.add_freetext_annot(fitz.Rect(300, 300, 500, 340), "Reviewer note")
+        widget = fitz.Widget()
+        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+        widget.field_name = "comment"
+        widget.field_value = "Form value"
+        widget.rect = fitz.Rect(72, 400, 300, 420)
+        page.add_widget(widget)
+        page.set_rotation(90)
+        path = tmp_path / "rotated.pdf"
+        doc.save(str(path))
+        
+        options = ExtractOptions(skip_annotations=True, clip_margins=(0, 50, 0, 50))
+        text = extract_text_from_pdf(str(path), options=options)
+        assert text == "John Smith john@example.com\n"
+        with fitz.open(str(path)) as saved:
+            assert saved[0].rotation == 90
+            assert saved[0].first_annot is not None
+    
+    def test_clip_margins(self, annotated_pdf):
+        """Test that clipping drops text in the page margins."""
+        options = ExtractOptions(clip_margins=(0, 50, 0, 50))
+        text = extract_text_from_pdf(annotated_pdf, options=options)
+        assert "Careers Portal Header" not in text
+        assert "Page 1 of 1" not in text
+        assert "John Smith john@example.com" in text
+    
+    @pytest.mark.parametrize("mode", ["blocks", "words"])
+    def test_modes_match_text_lines(self, annotated_pdf, mode):
+        """Test that blocks and words modes produce the same lines as text mode."""
+        text = extract_text_from_pdf(annotated_pdf)
+        other = extract_text_from_pdf(annotated_pdf, options=ExtractOptions(mode=mode))
+        assert other.split("\n") == text.split("\n")
+    
+    def test_unknown_mode_raises(self, annotated_pdf):
+        """Test that an unknown mode raises RuntimeError."""
+        with pytest.raises(RuntimeError):
+            extract_text_from_pdf(annotated_pdf, options=ExtractOptions(mode="html"))
+    
+    def test_text_flags(self):
+        """Test combining flags by name and rejecting unknown names."""
+        assert text_flags(["preserve_whitespace", "MEDIABOX_CLIP"]) == (
+            fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+        )
+        with pytest.raises(ValueError):
+            text_flags(["no_such_flag"])
+    
+    def test_strip_repeated_headers(self, tmp_path):
+        """Test that page headers/footers are kept once when enabled."""
+        doc = fitz.open()
+        bodies = ["John Smith john@example.com", "SKILLS Python", "EXPERIENCE Initech"]
+        for number, body in enumerate(bodies, 1):
+            page = doc.new_page()
+            page.insert_text((72, 30), "Careers Portal Header")
+            page.insert_text((72, 100), body)
+            page.insert_text((72, 820), f"Page {number} of 3")
+        path = str(tmp_path / "three_pages.pdf")
+        doc.save(path)
+        
+        text = extract_text_from_pdf(path, options=ExtractOptions(strip_repeated=True))
+        assert text.count("Careers Portal Header") == 1
+        assert "Page 1 of 3" in text and "Page 2 of 3" not in text
+        assert "SKILLS Python" in text
+        
+        kept = extract_text_from_pdf(path)
+        assert kept.count("Careers Portal Header") == 3
+    
+    def test_threads_extract_one_at_a_time(self, annotated_pdf):
+        """Test that PyMuPDF work from several threads is serialized."""
+        active, peak = [0], [0]
+        counter_lock = threading.Lock()
+        real_page_text = extract_module._page_text
+        
+        def page_text(page, options):
+            with counter_lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            try:
+                return real_page_text(page, options)
+            finally:
+                with counter_lock:
+                    active[0] -= 1
+        
+        with patch("src.extract_text._page_text", side_effect=page_text):
+            threads = [threading.Thread(target=extract_text_from_pdf, args=(annotated_pdf,)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert peak[0] == 1
@@ -0,0 +1,131 @@
+"""
+Tests for the document extractors module.
+"""
+
+import io
+import zipfile
+import pytest
+from unittest.mock import patch
+from src.extractors import (
+    extract_text,
+    extract_text_from_docx,
+    extract_text_from_pdf,
+    extract_text_from_txt,
+    get_extractor,
+    is_supported,
+)
+from src.pipeline import process_resume
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document {W}><w:body>
+<w:p><w:r><w:t>John </w:t></w:r><w:r><w:t>Smith</w:t></w:r></w:p>
+<w:p><w:r><w:t>john@example.com</w:t><w:tab/><w:t>9876543210</w:t></w:r></w:p>
+<w:p><w:r><w:t>EDUCATION</w:t></w:r></w:p>
+<w:p><w:r><w:t>B.Tech</w:t><w:br/><w:t>State University</w:t></w:r></w:p>
+<w:p><w:r><w:t>SKILLS</w:t></w:r></w:p>
+<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Python</w:t></w:r></w:p></w:tc>
+<w:tc><w:p><w:r><w:t>SQL</w:t></w:r><w:del><w:r><w:delText>Cobol</w:delText></w:r></w:del></w:p></w:tc></w:tr></w:tbl>
+</w:body></w:document>"""
+
+
+def _docx_bytes(document_xml=DOCUMENT_XML):
+    """Build a minimal DOCX package in memory."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+        zf.writestr("word/document.xml", document_xml)
+    return buffer.getvalue()
+
+
+class TestExtractTextFromDocx:
+    """Test suite for extract_text_from_docx function."""
+    
+    def test_docx_paragraphs_tabs_and_breaks(self, tmp_path):
+        """Test paragraph, tab and line break handling."""
+        path = tmp_path / "resume.docx"
+        path.write_bytes(_docx_bytes())
+        lines = extract_text_from_docx(str(path)).splitlines()
+        assert lines[:5] == ["John Smith", "john@example.com\t9876543210", "EDUCATION", "B.Tech", "State University"]
+        assert "Python" in lines and "SQL" in lines
+    
+    def test_docx_skips_deleted_text(self):
+        """Test that deleted tracked changes are not extracted."""
+        text = extract_text_from_docx("resume.docx", data=_docx_bytes())
+        assert "Cobol" not in text
+    
+    def test_docx_invalid_raises(self):
+        """Test that a non-DOCX file raises RuntimeError."""
+        with pytest.raises(RuntimeError):
+            extract_text_from_docx("broken.docx", data=b"not a zip")
+    
+    def test_docx_missing_file_raises(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            extract_text_from_docx(str(tmp_path / "missing.docx"))
+
+
+class TestExtractTextFromTxt:
+    """Test suite for extract_text_from_txt function."""
+    
+    def test_txt_passthrough_drops_bom(self, tmp_path):
+        """Test that text is returned unchanged apart from the BOM."""
+        path = tmp_path / "resume.txt"
+        path.write_bytes("﻿José García\nPython".encode("utf-8"))
+        assert extract_text_from_txt(str(path)) == "José García\nPython"
+    
+    def test_txt_invalid_bytes_replaced(self):
+        """Test that undecodable bytes do not fail extraction."""
+        assert extract_text_from_txt("resume.txt", data=b"Python \xff SQL") == "Python � SQL"
+
+
+class TestExtractorRegistry:
+    """Test suite for extractor dispatch."""
+    
+    def test_dispatch_by_extension(self):
+        """Test that each supported type maps to its extractor."""
+        assert get_extractor("a.DOCX") is extract_text_from_docx
+        assert get_extractor("a.txt") is extract_text_from_txt
+        assert is_supported("a.pdf")
+    
+    def test_unsupported_type_raises(self):
+        """Test that unknown file types raise ValueError."""
+        assert not is_supported("a.odt")
+        with pytest.raises(ValueError):
+            extract_text("a.odt")
+    
+    def test_unknown_extension_recognized_from_contents(self, tmp_path):
+        """Test that files without a known extension are dispatched by their leading bytes."""
+        pdf = tmp_path / "upload_7f3a"
+        pdf.write_bytes(b"%PDF-1.7\n...")
+        backup = tmp_path / "resume.PDF.bak"
+        backup.write_bytes(b"%PDF-1.4\n...")
+        assert get_extractor(str(pdf)) is extract_text_from_pdf
+        assert get_extractor(str(backup)) is extract_text_from_pdf
+        assert get_extractor("upload.tmp", data=_docx_bytes()) is extract_text_from_docx
+        with pytest.raises(ValueError):
+            get_extractor("upload.tmp", data=b"plain words")
+    
+    def test_disabled_type_is_unsupported(self):
+        """Test that types removed from SUPPORTED_EXTENSIONS are rejected."""
+        with patch("src.extractors.SUPPORTED_EXTENSIONS", [".pdf"]):
+            assert not is_supported("a.docx")
+    
+    def test_process_resume_docx(self, tmp_path):
+        """Test the full pipeline on a DOCX resume without conversion."""
+        path = tmp_path / "john.docx"
+        path.write_bytes(_docx_bytes())
+        result = process_resume(str(path))
+        assert result["Email"] == "john@example.com"
+        assert result["Education"] == "B.Tech"
+        assert result["Skills"] == ["Python", "SQL"]
+        assert result["File"] == "john.docx"
+    
+    def test_process_resume_without_extension(self, tmp_path):
+        """Test that an upload saved without an extension is still parsed."""
+        path = tmp_path / "upload_7f3a"
+        path.write_bytes(_docx_bytes())
+        result = process_resume(str(path))
+        assert result["Email"] == "john@example.com"
+        assert result["File"] == "upload_7f3a"
@@ -0,0 +1,102 @@
+"""
+Tests for the fuzzy skill matching module.
+"""
+
+import pytest
+from src.fuzzy import SkillIndex, allowed_edits, edit_distance, normalize_term
+from src.parser import extract_skills
+from src.batch import parse_resumes
+from src.profiles import ParserProfile, get_profile, DEFAULT_PROFILE
+
+SKILLS = ["Python", "PostgreSQL", "Node.js", "Scikit-learn", "Kubernetes", "Go", "SQL", "C++", "C#"]
+
+
+class TestHelpers:
+    """Test suite for normalization and edit distance."""
+    
+    def test_normalize_term(self):
+        """Test that case, spaces and punctuation are ignored."""
+        assert normalize_term("Node JS") == normalize_term("node.js") == "nodejs"
+        assert normalize_term("Scikit Learn") == normalize_term("Scikit-learn")
+        assert normalize_term("C++") != normalize_term("C#")
+    
+    def test_edit_distance(self):
+        """Test insertions, deletions, substitutions and transpositions."""
+        assert edit_distance("python", "python", 2) == 0
+        assert edit_distance("pyhton", "python", 2) == 1
+        assert edit_distance("pythn", "python", 2) == 1
+        assert edit_distance("kubernetes", "kubernets", 2) == 1
+        assert edit_distance("java", "python", 2) == 3
+    
+    def test_allowed_edits(self):
+        """Test that short skills get no edits and long ones get more."""
+        assert [allowed_edits(n, [6, 10]) for n in (3, 6, 9, 10)] == [0, 1, 1, 2]
+
+
+class TestSkillIndex:
+    """Test suite for SkillIndex class."""
+    
+    @pytest.fixture
+    def index(self):
+        return SkillIndex(SKILLS)
+    
+    @pytest.mark.parametrize("text, skill", [
+        ("Pyhton", "Python"),
+        ("Postgre SQL", "PostgreSQL"),
+        ("Node JS", "Node.js"),
+        ("Scikit Learn", "Scikit-learn"),
+        ("Kubernets", "Kubernetes"),
+    ])
+    def test_finds_variants(self, index, text, skill):
+        """Test typos and re-spaced skills."""
+        assert skill in index.find(f"Skills: {text}, teamwork")
+    
+    def test_short_skills_need_exact_match(self, index):
+        """Test that a one-letter edit of a short skill is not a match."""
+        assert index.find("I used SQL and Go") == {"SQL", "Go"}
+        assert index.find("Sql2 and Gp") == set()
+    
+    def test_ordinary_words_do_not_match(self, index):
+        """Test that filler text finds nothing."""
+        assert index.find("Delivered features end to end and mentored junior engineers") == set()
+    
+    def test_shortlist_is_small(self, index):
+        """Test that only skills sharing enough n-grams are compared."""
+        assert index.shortlist("pyhton") == [SKILLS.index("Python")]
+        assert index.shortlist("delivered") == []
+    
+    def test_cache_is_bounded(self):
+        """Test that the window cache never exceeds its size."""
+        index = SkillIndex(SKILLS, cache_size=4)
+        index.find("alpha bravo charlie delta echo foxtrot golf hotel")
+        assert len(index._cache) <= 4
+
+
+class TestFuzzyProfiles:
+    """Test suite for fuzzy matching through parser profiles."""
+    
+    def test_default_profile_is_exact(self):
+        """Test that fuzzy matching is off unless requested."""
+        assert DEFAULT_PROFILE.skill_index is None
+        assert extract_skills("Pyhton, Kubernets") == []
+    
+    def test_extract_skills_fuzzy(self):
+        """Test that a fuzzy profile adds variants in vocabulary order."""
+        profile = ParserProfile(SKILLS, [], {}, fuzzy=True)
+        assert extract_skills("Kubernets, Pyhton and SQL", profile) == ["Python", "Kubernetes", "SQL"]
+    
+    def test_fuzzy_is_part_of_profile_identity(self):
+        """Test that fuzzy and exact profiles are cached separately."""
+        exact = get_profile(skills_keywords=SKILLS)
+        fuzzy = get_profile(skills_keywords=SKILLS, fuzzy=True)
+        assert exact is not fuzzy
+        assert exact.hash != fuzzy.hash
+        assert get_profile(skills_keywords=SKILLS, fuzzy=True) is fuzzy
+    
+    def test_batch_matches_single(self):
+        """Test that the batch API finds the same fuzzy skills."""
+        profile = get_profile(fuzzy=True)
+        texts = ["SKILLS Pyhton, Postgre SQL, Node JS", "SKILLS Scikit Learn"]
+        df = parse_resumes(texts, profile=profile)
+        for text, skills in zip(texts, df["Skills"]):
+            assert skills == extract_skills(text, profile)
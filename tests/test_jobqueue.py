@@ -0,0 +1,120 @@
+"""
+Tests for the SQLite job queue module.
+"""
+
+import time
+import threading
+import pytest
+from src.jobqueue import JobQueue, run_worker, DONE, FAILED, SKIPPED, PENDING
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Create an empty queue in a temporary directory."""
+    return JobQueue(str(tmp_path / "jobs.sqlite"), lease_seconds=60, max_attempts=2)
+
+
+class TestJobQueue:
+    """Test suite for JobQueue class."""
+    
+    def test_enqueue_ignores_duplicates(self, queue):
+        """Test that a path is only queued once."""
+        assert queue.enqueue(["a.pdf", "b.pdf"]) == 2
+        assert queue.enqueue(["b.pdf", "c.pdf"]) == 1
+        assert queue.stats()[PENDING] == 3
+    
+    def test_lease_is_exclusive(self, queue):
+        """Test that a leased job is not handed out again."""
+        queue.enqueue(["a.pdf", "b.pdf"])
+        first = queue.lease("w1")
+        second = queue.lease("w2")
+        assert first[1] == "a.pdf"
+        assert second[1] == "b.pdf"
+        assert queue.lease("w3") is None
+    
+    def test_concurrent_leases_do_not_overlap(self, queue):
+        """Test that concurrent workers never lease the same job."""
+        queue.enqueue([f"{i}.pdf" for i in range(50)])
+        leased = []
+        
+        def worker(worker_id):
+            while True:
+                job = queue.lease(worker_id)
+                if job is None:
+                    return
+                leased.append(job[0])
+        
+        threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(leased) == sorted(set(leased))
+        assert len(leased) == 50
+    
+    def test_expired_lease_is_reclaimed(self, tmp_path):
+        """Test that a crashed worker's job is leased again after expiry."""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite"), lease_seconds=0.05, max_attempts=3)
+        queue.enqueue(["a.pdf"])
+        job = queue.lease("crashed")
+        assert queue.lease("w2") is None
+        time.sleep(0.1)
+        assert queue.lease("w2") == job
+        assert not queue.complete(job[0], "crashed")
+        assert queue.complete(job[0], "w2")
+    
+    def test_heartbeat_extends_lease(self, tmp_path):
+        """Test that heartbeats keep a lease alive."""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite"), lease_seconds=0.2)
+        queue.enqueue(["a.pdf"])
+        job_id, _ = queue.lease("w1")
+        for _ in range(3):
+            time.sleep(0.1)
+            assert queue.heartbeat(job_id, "w1")
+        assert queue.lease("w2") is None
+    
+    def test_fail_retries_until_max_attempts(self, queue):
+        """Test that failed jobs are retried, then marked failed."""
+        queue.enqueue(["a.pdf"])
+        job_id, _ = queue.lease("w1")
+        queue.fail(job_id, "w1", "boom")
+        assert queue.stats()[PENDING] == 1
+        job_id, _ = queue.lease("w1")
+        queue.fail(job_id, "w1", "boom")
+        assert queue.stats()[FAILED] == 1
+        assert queue.lease("w1") is None
+        assert queue.is_drained()
+    
+    def test_invalid_max_attempts(self, tmp_path):
+        """Test that max_attempts below 1 raises ValueError."""
+        with pytest.raises(ValueError):
+            JobQueue(str(tmp_path / "jobs.sqlite"), max_attempts=0)
+
+
+class TestRunWorker:
+    """Test suite for run_worker function."""
+    
+    def test_run_worker_drains_queue(self, queue):
+        """Test that a worker handles every job and records outcomes."""
+        queue.enqueue(["ok.pdf", "skip.pdf", "bad.pdf"])
+        
+        def handler(path):
+            if path == "bad.pdf":
+                raise RuntimeError("corrupt")
+            return (SKIPPED, "scanned") if path == "skip.pdf" else (DONE, None)
+        
+        handled = run_worker(queue, handler, threading.Event(), worker_id="w1", poll_interval=0.01)
+        assert handled == {DONE: 1, SKIPPED: 1, FAILED: 2}
+        stats = queue.stats()
+        assert stats[DONE] == 1
+        assert stats[SKIPPED] == 1
+        assert stats[FAILED] == 1
+    
+    def test_run_worker_stops_on_event(self, queue):
+        """Test that a set stop event prevents further leases."""
+        queue.enqueue(["a.pdf"])
+        stop_event = threading.Event()
+        stop_event.set()
+        handled = run_worker(queue, lambda path: (DONE, None), stop_event, worker_id="w1")
+        assert sum(handled.values()) == 0
+        assert queue.stats()[PENDING] == 1
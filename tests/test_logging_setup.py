@@ -0,0 +1,92 @@
+"""
+Tests for the logging setup module.
+"""
+
+import logging
+import pytest
+import src.logging_setup as logging_setup
+from src.logging_setup import configure_logging, is_document_sampled, log_document
+
+
+@pytest.fixture
+def restore_root_logging():
+    """Restore root logger handlers and level after a test."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    settings = logging_setup._settings
+    yield
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+    logging_setup._sample_rate = 1.0
+    logging_setup._settings = settings
+
+
+class TestIsDocumentSampled:
+    """Test suite for is_document_sampled function."""
+    
+    def test_full_rate_samples_everything(self):
+        """Test that a rate of 1 keeps every document."""
+        assert all(is_document_sampled(f"{i}.pdf", 1.0) for i in range(100))
+    
+    def test_sampling_is_stable_and_proportional(self):
+        """Test that sampling is deterministic and close to the rate."""
+        names = [f"resume_{i}.pdf" for i in range(5000)]
+        first = [is_document_sampled(n, 0.1) for n in names]
+        second = [is_document_sampled(n, 0.1) for n in names]
+        assert first == second
+        assert 350 < sum(first) < 650
+
+
+class TestConfigureLogging:
+    """Test suite for configure_logging function."""
+    
+    def test_async_logging_writes_from_listener(self, tmp_path, restore_root_logging):
+        """Test that queued records reach the log file after stop()."""
+        log_file = tmp_path / "run.log"
+        listener = configure_logging(logging.INFO, "%(levelname)s %(message)s", str(log_file), async_logging=True)
+        assert listener is not None
+        logging.getLogger("test").info("hello %s", "world")
+        listener.stop()
+        assert "INFO hello world" in log_file.read_text()
+    
+    def test_sampling_keeps_errors(self, tmp_path, restore_root_logging):
+        """Test that unsampled documents drop INFO but keep ERROR records."""
+        log_file = tmp_path / "run.log"
+        configure_logging(logging.INFO, "%(levelname)s %(message)s", str(log_file), sample_rate=0.0001)
+        test_logger = logging.getLogger("test")
+        
+        with log_document("not-sampled.pdf") as sampled:
+            assert not sampled
+            test_logger.info("dropped info")
+            test_logger.error("kept error")
+        test_logger.info("outside documents")
+        
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        content = log_file.read_text()
+        assert "dropped info" not in content
+        assert "kept error" in content
+        assert "outside documents" in content
+    
+    def test_invalid_sample_rate(self, restore_root_logging):
+        """Test that an out-of-range sample rate raises ValueError."""
+        with pytest.raises(ValueError):
+            configure_logging(logging.INFO, "%(message)s", sample_rate=2)
+    
+    def test_worker_applies_parent_settings(self, tmp_path, restore_root_logging):
+        """Test that a worker with no inherited configuration uses the parent's."""
+        log_file = tmp_path / "run.log"
+        configure_logging(logging.INFO, "%(levelname)s %(message)s", str(log_file), async_logging=True).stop()
+        settings = logging_setup.worker_logging_settings()
+        assert settings["log_file"] == str(log_file)
+        
+        # A process forked from the fork server starts unconfigured
+        logging_setup._settings = None
+        logging_setup.configure_worker_logging(settings)
+        logging.getLogger("test").warning("from worker")
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        assert "WARNING from worker" in log_file.read_text()
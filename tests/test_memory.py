@@ -0,0 +1,133 @@
+"""
+Memory stability tests for long runs.
+
+Thousands of synthetic PDFs are pushed through the pipeline in one process;
+RSS must level off once MuPDF's caches are warm instead of growing with
+every document. Linux only (reads /proc/self/statm).
+"""
+
+import os
+import pytest
+from unittest import mock
+
+from config import MUPDF_STORE_RSS_LIMIT_MB
+from benchmarks.corpus import generate_corpus
+import src.extract_text as extract_module
+from src.extract_text import limit_mupdf_store, set_mupdf_store_limit
+from src.pipeline import process_resume
+import src.memory as memory
+from src.memory import current_rss, peak_rss
+from src.workers import recycle_reason, run_pool
+
+pytestmark = pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc")
+
+MB = 2 ** 20
+DOCUMENTS = 3000
+CHECKPOINT = 500
+
+
+def _pid(_):
+    return os.getpid()
+
+
+def _store_rss_limit(_):
+    return extract_module._store_rss_limit
+
+
+@pytest.fixture(scope="module")
+def documents(tmp_path_factory):
+    """Contents of 60 distinct synthetic resumes."""
+    out_dir = tmp_path_factory.mktemp("memory_corpus")
+    paths = generate_corpus(str(out_dir), count=60, seed=7)
+    contents = []
+    for path in paths:
+        with open(path, "rb") as fh:
+            contents.append((path, fh.read()))
+    return contents
+
+
+class TestMemoryStability:
+    """RSS must plateau over a long in-process run."""
+    
+    def test_rss_plateaus(self, documents):
+        """Test that RSS stops growing after warm-up over thousands of documents."""
+        samples = []
+        for i in range(DOCUMENTS):
+            path, data = documents[i % len(documents)]
+            assert process_resume(path, data=data, use_cache=False) is not None
+            if (i + 1) % CHECKPOINT == 0:
+                samples.append(current_rss())
+        
+        warm = samples[1:]
+        growth = (warm[-1] - warm[0]) / MB
+        assert growth < 16, f"RSS grew {growth:.1f} MB after warm-up: {[s // MB for s in samples]}"
+        assert (max(warm[-3:]) - min(warm[-3:])) / MB < 8
+    
+    def test_store_emptied_above_limit(self):
+        """Test that the store is only emptied when RSS is over the limit."""
+        try:
+            set_mupdf_store_limit(0)
+            assert limit_mupdf_store() is False
+            set_mupdf_store_limit(current_rss() / MB * 100)
+            assert limit_mupdf_store() is False
+            set_mupdf_store_limit(1, headroom_mb=64)
+            assert limit_mupdf_store() is True
+        finally:
+            set_mupdf_store_limit(0)
+    
+    def test_store_limit_hysteresis(self):
+        """Test that RSS staying above the limit does not empty the store every document."""
+        rss = [600 * MB, 560 * MB, 600 * MB, 700 * MB, 600 * MB, 400 * MB, 600 * MB, 560 * MB]
+        emptied = []
+        try:
+            set_mupdf_store_limit(512, headroom_mb=128)
+            with mock.patch.object(extract_module, "current_rss", side_effect=rss):
+                for _ in range(5):
+                    emptied.append(limit_mupdf_store())
+        finally:
+            set_mupdf_store_limit(0)
+        # 600 -> 560 after emptying: next threshold 688 MB; 400 re-arms the limit
+        assert emptied == [True, False, True, False, True]
+    
+    def test_store_limit_off_by_default(self):
+        """Test that the store limit is only turned on by worker processes."""
+        assert limit_mupdf_store() is False
+
+
+class TestPeakRss:
+    """Test cases for peak RSS units."""
+    
+    @pytest.mark.parametrize("platform, expected", [("linux", 2048 * 1024), ("darwin", 2048)])
+    def test_platform_units(self, platform, expected):
+        """Test that ru_maxrss is read as kilobytes on Linux and bytes on macOS."""
+        usage = mock.Mock(ru_maxrss=2048)
+        with mock.patch.object(memory.sys, "platform", platform), \
+                mock.patch.object(memory.resource, "getrusage", return_value=usage):
+            assert peak_rss() == expected
+
+
+class TestRecycling:
+    """Test cases for worker recycling."""
+    
+    def test_recycle_reason(self):
+        """Test the document and RSS thresholds."""
+        assert recycle_reason(9, 100 * MB, max_documents=10, max_rss_mb=200) is None
+        assert "documents" in recycle_reason(10, 100 * MB, max_documents=10, max_rss_mb=200)
+        assert "RSS" in recycle_reason(1, 300 * MB, max_documents=10, max_rss_mb=200)
+        assert recycle_reason(10 ** 6, 10 ** 12, max_documents=0, max_rss_mb=0) is None
+    
+    def test_pool_replaces_workers(self):
+        """Test that a worker process is replaced after max_documents."""
+        results = dict(run_pool(((i,) for i in range(9)), _pid, workers=1, max_documents=3, max_rss_mb=0))
+        assert len(results) == 9
+        assert len(set(results.values())) == 3
+    
+    def test_pool_workers_limit_store(self):
+        """Test that pool workers turn on the MuPDF store limit."""
+        results = dict(run_pool([(0,)], _store_rss_limit, workers=1))
+        assert results[0] == MUPDF_STORE_RSS_LIMIT_MB * MB
+    
+    def test_pool_replaces_worker_above_rss(self):
+        """Test that a worker over the RSS limit is replaced after each document."""
+        results = dict(run_pool(((i,) for i in range(3)), _pid, workers=1, max_documents=0, max_rss_mb=1))
+        assert len(set(results.values())) == 3
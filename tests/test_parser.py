@@ -187,3 +187,13 @@ class TestParseResume:
         assert "Phone" in result
         assert "Education" in result
         assert "Skills" in result
+    
+    def test_parse_resume_uses_sections(self):
+        """Test that skills and education are read from their own sections."""
+        text = (
+            "John Smith EXPERIENCE Built dashboards for a Tableau reseller "
+            "EDUCATION MBA, Bachelor of Commerce SKILLS Python, SQL"
+        )
+        result = parse_resume(text)
+        assert result["Skills"] == ["Python", "SQL"]
+        assert result["Education"] == "Bachelor"
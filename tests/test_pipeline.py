@@ -12,7 +12,7 @@ class TestProcessResume:
     
     @patch('src.pipeline.parse_resume')
     @patch('src.pipeline.normalize_text')
-    @patch('src.pipeline.extract_text_from_pdf')
+    @patch('src.pipeline.extract_text')
     def test_process_resume_valid(self, mock_extract, mock_normalize, mock_parse):
         """Test processing of a valid resume."""
         mock_extract.return_value = "Raw text"
@@ -42,7 +42,7 @@ class TestProcessResume:
         with pytest.raises(ValueError):
             process_resume(None)
     
-    @patch('src.pipeline.extract_text_from_pdf')
+    @patch('src.pipeline.extract_text')
     def test_process_resume_handles_extraction_error(self, mock_extract):
         """Test handling of extraction errors."""
         mock_extract.side_effect = Exception("Extraction failed")
@@ -51,3 +51,18 @@ class TestProcessResume:
         
         # Should return None on error
         assert result is None
+    
+    @patch('src.pipeline.parse_resume')
+    @patch('src.pipeline.normalize_text')
+    @patch('src.pipeline.extract_text')
+    def test_process_resume_from_bytes(self, mock_extract, mock_normalize, mock_parse):
+        """Test processing of in-memory PDF bytes with a display path."""
+        mock_extract.return_value = "Raw text"
+        mock_normalize.return_value = "Cleaned text"
+        mock_parse.return_value = {"Name": "John Smith"}
+        
+        result = process_resume("/data/export.zip/batch1/john.pdf", data=b"%PDF")
+        
+        assert result["File"] == "john.pdf"
+        assert result["FilePath"] == "/data/export.zip/batch1/john.pdf"
+        mock_extract.assert_called_once_with("/data/export.zip/batch1/john.pdf", data=b"%PDF")
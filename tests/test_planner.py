@@ -0,0 +1,109 @@
+"""
+Tests for the capacity planner module.
+"""
+
+import pytest
+
+from benchmarks.corpus import generate_corpus
+from src.planner import Candidate, allocate, format_plan, page_count, plan_capacity, stratify
+from src.storage import LocalStorage
+
+
+def _candidate(key, size, pages):
+    return Candidate(key, size, pages, 0.0, 0.0)
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    """A small synthetic corpus plus one text resume."""
+    out_dir = tmp_path_factory.mktemp("corpus")
+    generate_corpus(str(out_dir), count=12, seed=1)
+    (out_dir / "plain.txt").write_text("Jane Doe\njane@example.com\nSKILLS\nPython, SQL\n")
+    return str(out_dir)
+
+
+class TestStratify:
+    """Test cases for stratify and allocate."""
+    
+    def test_strata_by_type_size_and_pages(self):
+        """Test that candidates are split by type, size quantile and page class."""
+        candidates = [
+            _candidate("a.pdf", 100, 1), _candidate("b.pdf", 200, 1),
+            _candidate("c.pdf", 900, 4), _candidate("d.pdf", 1000, 9),
+            _candidate("e.txt", 50, 0),
+        ]
+        strata, edges = stratify(candidates, size_bins=2, page_classes=[1, 5])
+        assert len(edges) == 1
+        assert strata[(".pdf", 1, 1)] == [candidates[2]]
+        assert strata[(".pdf", 1, 2)] == [candidates[3]]
+        assert strata[(".txt", 0, 0)] == [candidates[4]]
+    
+    def test_allocation_is_proportional_with_minimum_one(self):
+        """Test proportional allocation and the one-per-stratum floor."""
+        strata = {
+            (".pdf", 0, 0): [_candidate(str(i), 1, 1) for i in range(90)],
+            (".pdf", 1, 0): [_candidate(str(i), 2, 1) for i in range(9)],
+            (".txt", 0, 0): [_candidate("t", 1, 0)],
+        }
+        allocation = allocate(strata, 20)
+        assert allocation == {(".pdf", 0, 0): 18, (".pdf", 1, 0): 2, (".txt", 0, 0): 1}
+    
+    def test_allocation_capped_by_stratum_size(self):
+        """Test that a stratum never gets more documents than it has."""
+        strata = {(".pdf", 0, 0): [_candidate("a", 1, 1), _candidate("b", 1, 1)]}
+        assert allocate(strata, 50) == {(".pdf", 0, 0): 2}
+
+
+class TestPageCount:
+    """Test cases for page_count."""
+    
+    def test_non_pdf(self):
+        """Test that other file types count zero pages."""
+        assert page_count("resume.txt", b"text") == 0
+    
+    def test_unreadable_pdf(self):
+        """Test that a broken PDF counts zero pages."""
+        assert page_count("broken.pdf", b"not a pdf") == 0
+
+
+class TestPlanCapacity:
+    """Test cases for plan_capacity."""
+    
+    def test_plan(self, corpus):
+        """Test the plan structure and the worker scaling of predictions."""
+        plan = plan_capacity(LocalStorage(corpus), sample_size=6, worker_counts=[1, 4], candidate_factor=2)
+        assert plan["documents"] == 13
+        assert plan["candidates"] == 12
+        assert plan["sampled"] >= 6
+        assert {"extract", "parse", "fetch"} <= set(plan["stages_ms"])
+        one, four = plan["predictions"]
+        assert four["wall_hours"] == pytest.approx(one["wall_hours"] / 4)
+        assert four["cpu_hours"] == one["cpu_hours"]
+        assert four["peak_memory_gb"] == pytest.approx(one["peak_memory_gb"] * 4)
+        assert plan["total_wall_hours"] > 0
+        assert sum(s["share"] for s in plan["strata"]) == pytest.approx(1.0)
+    
+    def test_same_seed_same_sample(self, corpus):
+        """Test that the sample is reproducible."""
+        first = plan_capacity(LocalStorage(corpus), sample_size=4, seed=3)
+        second = plan_capacity(LocalStorage(corpus), sample_size=4, seed=3)
+        def layout(plan):
+            return [(s["type"], s["size_bin"], s["page_class"], s["share"], s["sampled"]) for s in plan["strata"]]
+        assert layout(first) == layout(second)
+    
+    def test_format_plan(self, corpus):
+        """Test that the table has one row per worker count."""
+        plan = plan_capacity(LocalStorage(corpus), sample_size=3, worker_counts=[1, 2, 8])
+        lines = format_plan(plan)
+        assert "workers" in lines[3]
+        assert len(lines) == 4 + 3
+    
+    def test_empty_input(self, tmp_path):
+        """Test that an empty input is rejected."""
+        with pytest.raises(ValueError):
+            plan_capacity(LocalStorage(str(tmp_path)))
+    
+    def test_invalid_sample_size(self, corpus):
+        """Test that a non-positive sample size is rejected."""
+        with pytest.raises(ValueError):
+            plan_capacity(LocalStorage(corpus), sample_size=0)
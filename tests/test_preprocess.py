@@ -3,7 +3,7 @@ Tests for the text preprocessing module.
 """
 
 import pytest
-from src.preprocess import normalize_text, clean_text
+from src.preprocess import normalize_text, clean_text, strip_repeated_lines
 
 
 class TestNormalizeText:
@@ -69,3 +69,65 @@ class TestCleanText:
         text = "john@example.com"
         result = clean_text(text, remove_special=True)
         assert "john@example.com" in result
+
+
+class TestStripRepeatedLines:
+    """Test suite for strip_repeated_lines function."""
+    
+    PAGES = [
+        "ACME Careers\nJohn Smith | 555-0100\nEDUCATION\nMBA\nPage 1 of 3\n",
+        "ACME Careers\nEXPERIENCE\nInitech\nPage 2 of 3\n",
+        "ACME Careers\nSKILLS\nPython\nPage 3 of 3\n",
+    ]
+    
+    def test_keeps_first_occurrence(self):
+        """Test that headers and page numbers stay on the first page only."""
+        result = strip_repeated_lines(self.PAGES)
+        assert result[0] == self.PAGES[0]
+        assert result[1] == "EXPERIENCE\nInitech\n"
+        assert result[2] == "SKILLS\nPython\n"
+    
+    def test_body_lines_are_kept(self):
+        """Test that lines repeated away from the page edges stay."""
+        pages = [f"Name{i}\nA{i}\nB{i}\nC{i}\nPython\nD{i}\nE{i}\nF{i}\n" for i in range(3)]
+        assert strip_repeated_lines(pages) == pages
+    
+    def test_position_must_match(self):
+        """Test that the same text at a different rank is not removed."""
+        pages = ["Header\nBody\n", "Intro\nHeader\nMore\nText\nEnd\nLast\n", "Header\nOther\n", "Header\nLast\n"]
+        result = strip_repeated_lines(pages, edge_lines=1)
+        assert result == ["Header\nBody\n", pages[1], "Other\n", "Last\n"]
+    
+    def test_min_pages(self):
+        """Test that a line must repeat on min_pages pages."""
+        assert strip_repeated_lines(self.PAGES, min_pages=4) == self.PAGES
+    
+    def test_only_page_numbers_are_ignored(self):
+        """Test that dates and headings are compared as written."""
+        pages = [
+            "SKILLS\nPython\nGo\n2015 - 2019\n",
+            "SKILLS\nRust\nSQL\n2019 - 2021\n",
+            "SKILLS\nJava\nC\n05/19 - 08/21\n",
+        ]
+        result = strip_repeated_lines(pages)
+        assert result[1] == "Rust\nSQL\n2019 - 2021\n"
+        assert result[2] == "Java\nC\n05/19 - 08/21\n"
+    
+    def test_line_must_repeat_on_most_pages(self):
+        """Test that a line on only half of the pages is kept."""
+        pages = [f"{'Skills' if i < 3 else 'Notes'}\nBody {i}\nEnd {i}\n" for i in range(6)]
+        assert strip_repeated_lines(pages) == pages
+    
+    def test_two_page_header_and_footer(self):
+        """Test that a two-page resume loses its repeated header and footer."""
+        pages = [
+            "Jane Doe | jane@example.com\nEXPERIENCE\nInitech\nPage 1 of 2\n",
+            "Jane Doe | jane@example.com\nSKILLS\nPython\nPage 2 of 2\n",
+        ]
+        result = strip_repeated_lines(pages)
+        assert result[0] == pages[0]
+        assert result[1] == "SKILLS\nPython\n"
+    
+    def test_single_page_unchanged(self):
+        """Test that one page is returned as is."""
+        assert strip_repeated_lines(["Header\nBody\n"]) == ["Header\nBody\n"]
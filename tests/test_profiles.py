@@ -0,0 +1,105 @@
+"""
+Tests for the parser profiles module.
+"""
+
+from unittest.mock import patch
+from config import SKILLS_KEYWORDS
+from src.parser import parse_resume, extract_skills
+from src.batch import parse_resumes
+from src.profiles import ParserProfile, ProfileCache, get_profile, DEFAULT_PROFILE
+
+
+class TestParserProfile:
+    """Test suite for ParserProfile class."""
+    
+    def test_profile_deduplicates_vocabularies(self):
+        """Test that duplicate keywords are dropped, keeping order."""
+        profile = ParserProfile(["Go", "Rust", "Go"], ["MBA"], {})
+        assert profile.skills == ("Go", "Rust")
+        assert profile.skills_lower == (("Go", "go"), ("Rust", "rust"))
+    
+    def test_profile_hash_depends_on_content(self):
+        """Test that equal vocabularies hash equally and different ones do not."""
+        a = ParserProfile(["Go"], ["MBA"], {"skills": ["Skills"]})
+        b = ParserProfile(["Go"], ["MBA"], {"skills": ["Skills"]})
+        c = ParserProfile(["Rust"], ["MBA"], {"skills": ["Skills"]})
+        assert a.hash == b.hash
+        assert a.hash != c.hash
+    
+    def test_default_profile_matches_config(self):
+        """Test that the default profile uses the config vocabularies."""
+        assert list(DEFAULT_PROFILE.skills) == list(dict.fromkeys(SKILLS_KEYWORDS))
+
+
+class TestProfileCache:
+    """Test suite for ProfileCache class."""
+    
+    def test_cache_returns_same_object(self):
+        """Test that a second lookup reuses the compiled profile."""
+        cache = ProfileCache(maxsize=4)
+        first = cache.get(["Go"], ["MBA"], {})
+        second = cache.get(["Go"], ["MBA"], {})
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+    
+    def test_cache_evicts_least_recently_used(self):
+        """Test LRU eviction once maxsize is exceeded."""
+        cache = ProfileCache(maxsize=2)
+        go = cache.get(["Go"], [], {})
+        cache.get(["Rust"], [], {})
+        cache.get(["Go"], [], {})
+        cache.get(["Zig"], [], {})
+        assert len(cache) == 2
+        assert cache.get(["Go"], [], {}) is go
+        assert cache.misses == 3
+    
+    def test_hit_does_not_rehash(self):
+        """Test that a lookup of a cached profile skips the content hash."""
+        cache = ProfileCache(maxsize=4)
+        first = cache.get(["Go"], ["MBA"], {"skills": ["Skills"]})
+        with patch("src.profiles.profile_hash", side_effect=AssertionError("rehashed")):
+            assert cache.get(["Go"], ["MBA"], {"skills": ["Skills"]}) is first
+    
+    def test_header_order_does_not_matter(self):
+        """Test that reordered sections give the same key, hash and pattern."""
+        cache = ProfileCache(maxsize=4)
+        headers = {"skills": ["Skills"], "education": ["Education"]}
+        first = cache.get(["Go"], [], headers)
+        second = cache.get(["Go"], [], dict(reversed(list(headers.items()))))
+        assert first is second
+        reordered = ParserProfile(["Go"], [], dict(reversed(list(headers.items()))))
+        assert reordered.hash == first.hash
+        assert reordered.header_pattern.pattern == first.header_pattern.pattern
+    
+    def test_get_profile_defaults(self):
+        """Test that get_profile with no arguments returns the default profile."""
+        assert get_profile() is DEFAULT_PROFILE
+
+
+class TestParseWithProfile:
+    """Test suite for parsing with a custom profile."""
+    
+    def test_parse_resume_uses_profile_vocabulary(self):
+        """Test that only the profile's skills and degrees are reported."""
+        profile = get_profile(skills_keywords=["Kotlin", "Figma"], education_keywords=["Diplom"])
+        text = "Jane Doe Diplom Informatik SKILLS Kotlin, Python, Figma"
+        result = parse_resume(text, profile=profile)
+        assert result["Skills"] == ["Kotlin", "Figma"]
+        assert result["Education"] == "Diplom"
+    
+    def test_parse_resume_uses_profile_headers(self):
+        """Test that custom section headers scope the skills section."""
+        profile = get_profile(
+            skills_keywords=["Kotlin", "Java"],
+            section_headers={"skills": ["Kenntnisse"], "experience": ["Erfahrung"]},
+        )
+        text = "KENNTNISSE Kotlin ERFAHRUNG Java at Acme"
+        assert extract_skills(text, profile) == ["Kotlin", "Java"]
+        assert parse_resume(text, profile=profile)["Skills"] == ["Kotlin"]
+    
+    def test_parse_resumes_matches_parse_resume(self):
+        """Test that the batch API honours the profile too."""
+        profile = get_profile(skills_keywords=["Kotlin", "Swift"])
+        texts = ["Ann Lee SKILLS Swift", "Bob Ray Kotlin and Swift"]
+        df = parse_resumes(texts, profile=profile)
+        assert list(df["Skills"]) == [parse_resume(t, profile=profile)["Skills"] for t in texts]
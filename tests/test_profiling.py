@@ -0,0 +1,85 @@
+"""
+Tests for the run profiling module.
+"""
+
+import json
+import os
+import pytest
+import src.profiling as profiling
+from src.profiling import RunProfiler, StageTimer, stage
+
+
+class TestRunProfiler:
+    """Test suite for RunProfiler class."""
+    
+    def test_profiler_writes_outputs(self, tmp_path):
+        """Test that all profile files are written."""
+        with RunProfiler(str(tmp_path)) as profiler:
+            for name in ["a.pdf", "b.pdf"]:
+                with profiler.document(name):
+                    with stage("parse"):
+                        data = [str(i) for i in range(1000)]
+        
+        for filename in ["profile.pstats", "profile.txt", "stacks.folded", "summary.json"]:
+            assert os.path.exists(tmp_path / filename)
+        
+        summary = json.loads((tmp_path / "summary.json").read_text())
+        assert summary["documents"] == 2
+        assert summary["stages"]["parse"]["calls"] == 2
+        assert {r["file"] for r in summary["slowest_files"]} == {"a.pdf", "b.pdf"}
+        assert summary["biggest_allocators"][0]["peak_bytes"] > 0
+    
+    def test_profiler_sample_rate(self, tmp_path):
+        """Test that only the sampled fraction of documents is traced."""
+        with RunProfiler(str(tmp_path), sample_rate=0.25) as profiler:
+            for idx in range(8):
+                with profiler.document(f"{idx}.pdf"):
+                    pass
+        
+        summary = profiler.summary()
+        assert summary["documents"] == 8
+        assert summary["sampled_documents"] == 2
+    
+    def test_profiler_no_documents(self, tmp_path):
+        """Test that an empty run still writes a summary."""
+        with RunProfiler(str(tmp_path)):
+            pass
+        assert os.path.exists(tmp_path / "summary.json")
+    
+    def test_profiler_invalid_sample_rate(self, tmp_path):
+        """Test that an out-of-range sample rate raises ValueError."""
+        with pytest.raises(ValueError):
+            RunProfiler(str(tmp_path), sample_rate=0)
+
+
+class TestStage:
+    """Test suite for stage function."""
+    
+    def test_stage_without_profiler_is_noop(self):
+        """Test that stage works when no profiler is active."""
+        with stage("extract"):
+            pass
+
+
+class TestStageTimer:
+    """Test cases for StageTimer."""
+    
+    def test_records_stages_per_document(self):
+        """Test that stage() calls are timed into the current document."""
+        with StageTimer() as timer:
+            with timer.document() as stages:
+                with stage("extract"):
+                    sum(range(10000))
+                with stage("extract"):
+                    pass
+            with timer.document() as other:
+                pass
+        assert set(stages) == {"extract"}
+        assert stages["extract"]["wall"] > 0
+        assert other == {}
+    
+    def test_inactive_after_exit(self):
+        """Test that stage() is a no-op once the timer is closed."""
+        with StageTimer():
+            pass
+        assert stage("extract") is profiling._NULL_STAGE
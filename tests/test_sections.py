@@ -0,0 +1,75 @@
+"""
+Tests for the section segmentation module.
+"""
+
+from src.sections import find_sections, get_section
+
+
+class TestFindSections:
+    """Test suite for find_sections function."""
+    
+    def test_find_sections_basic(self):
+        """Test detection of upper-case section headers."""
+        text = "John Smith EDUCATION B.Tech in CS SKILLS Python, SQL"
+        sections = find_sections(text)
+        assert set(sections) == {"education", "skills"}
+        assert get_section(text, sections, "education").strip() == "B.Tech in CS"
+        assert get_section(text, sections, "skills").strip() == "Python, SQL"
+    
+    def test_find_sections_prefers_longest_phrase(self):
+        """Test that multi-word headers are matched as a whole."""
+        text = "WORK EXPERIENCE Acme Corp TECHNICAL SKILLS Docker"
+        sections = find_sections(text)
+        assert get_section(text, sections, "experience").strip() == "Acme Corp"
+        assert get_section(text, sections, "skills").strip() == "Docker"
+    
+    def test_find_sections_colon_header(self):
+        """Test that Title Case headers followed by a colon are detected."""
+        text = "Jane Doe Skills: Python Projects: Web scraper"
+        sections = find_sections(text)
+        assert get_section(text, sections, "skills").strip() == "Python"
+        assert get_section(text, sections, "projects").strip() == "Web scraper"
+    
+    def test_find_sections_prefers_strong_header(self):
+        """Test that a mid-sentence mention does not open a section."""
+        text = "Strong Skills in leadership EXPERIENCE Acme SKILLS Java"
+        sections = find_sections(text)
+        assert get_section(text, sections, "skills").strip() == "Java"
+    
+    def test_weak_header_does_not_end_strong_section(self):
+        """Test that a Title Case header in prose does not cut a section short."""
+        text = "SKILLS Python Experience with Docker EDUCATION B.Tech"
+        sections = find_sections(text)
+        assert get_section(text, sections, "skills").strip() == "Python Experience with Docker"
+        assert get_section(text, sections, "education").strip() == "B.Tech"
+    
+    def test_weak_headers_bound_sections_without_strong_ones(self):
+        """Test that Title Case headers still segment text without strong headers."""
+        text = "Jane Doe Education B.Tech Skills Python"
+        sections = find_sections(text)
+        assert get_section(text, sections, "education").strip() == "B.Tech"
+        assert get_section(text, sections, "skills").strip() == "Python"
+    
+    def test_find_sections_ignores_lowercase_prose(self):
+        """Test that lowercase words are not treated as headers."""
+        text = "5 years of experience with skills in Python"
+        assert find_sections(text) == {}
+    
+    def test_find_sections_empty_text(self):
+        """Test segmentation of empty text."""
+        assert find_sections("") == {}
+
+
+class TestGetSection:
+    """Test suite for get_section function."""
+    
+    def test_get_section_falls_back_to_full_text(self):
+        """Test fallback when the section was not detected."""
+        text = "Python, SQL"
+        assert get_section(text, {}, "skills") == text
+    
+    def test_get_section_empty_body_falls_back(self):
+        """Test fallback when the detected section has no body."""
+        text = "SKILLS EDUCATION B.Tech Python"
+        sections = find_sections(text)
+        assert get_section(text, sections, "skills") == text
@@ -0,0 +1,121 @@
+"""
+Tests for the candidate similarity module.
+"""
+
+import random
+import pytest
+import numpy as np
+import pandas as pd
+from src.similarity import SimilarityIndex
+
+SKILLS = ["Python", "SQL", "Docker", "Java", "Spring", "Kotlin", "React", "CSS"]
+EDUCATION = ["Bachelor", "Master"]
+
+
+def _frame(rows):
+    return pd.DataFrame(rows, columns=["FilePath", "Skills", "Education"])
+
+
+@pytest.fixture
+def index():
+    index = SimilarityIndex(SKILLS, EDUCATION, bits=4, tables=4)
+    index.add_frame(_frame([
+        ("/r/a.pdf", "Python, SQL, Docker", "Bachelor"),
+        ("/r/b.pdf", "Python, SQL", "Bachelor"),
+        ("/r/c.pdf", "Java, Spring, Kotlin", "Master"),
+        ("/r/d.pdf", "React, CSS", "Bachelor"),
+    ]))
+    return index
+
+
+def _random_frame(count, seed, start=0):
+    rng = random.Random(seed)
+    return _frame([
+        (f"/r/{i}.pdf", ", ".join(rng.sample(SKILLS, rng.randint(1, 4))), rng.choice(EDUCATION))
+        for i in range(start, start + count)
+    ])
+
+
+class TestEncoding:
+    """Test suite for result encoding."""
+    
+    def test_vectors_are_normalized(self, index):
+        """Test that encoded results have unit length."""
+        vector = index.encode(["Python", "SQL"], "Bachelor")
+        assert np.linalg.norm(vector) == pytest.approx(1.0)
+        assert vector[SKILLS.index("Python")] == pytest.approx(vector[SKILLS.index("SQL")])
+    
+    def test_unknown_values_are_ignored(self, index):
+        """Test that skills and education outside the vocabulary add nothing."""
+        assert not index.encode(["Cobol"], "PhD").any()
+
+
+class TestSimilarityIndex:
+    """Test suite for SimilarityIndex class."""
+    
+    def test_similar_to_ranks_by_cosine(self, index):
+        """Test that the closest result comes first and the query is excluded."""
+        matches = index.similar_to("/r/a.pdf", k=3)
+        assert [key for key, _ in matches][0] == "/r/b.pdf"
+        assert "/r/a.pdf" not in [key for key, _ in matches]
+        scores = [score for _, score in matches]
+        assert scores == sorted(scores, reverse=True)
+    
+    def test_lsh_matches_exact_scores(self):
+        """Test that LSH results score close to an exact scan."""
+        index = SimilarityIndex(SKILLS, EDUCATION, bits=8, tables=8)
+        index.add_frame(_random_frame(2000, seed=1))
+        for key in ("/r/0.pdf", "/r/7.pdf", "/r/42.pdf"):
+            lsh = index.similar_to(key, k=5)
+            exact = index.similar_to(key, k=5, exact=True)
+            assert len(lsh) == 5
+            assert lsh[0][1] == exact[0][1]
+    
+    def test_incremental_add_replaces_key(self, index):
+        """Test that adding a FilePath again replaces its vector."""
+        index.add_frame(_frame([("/r/d.pdf", "Python, SQL, Docker", "Bachelor")]))
+        assert len(index) == 4
+        assert index.similar_to("/r/a.pdf", k=1) == [("/r/d.pdf", 1.0)]
+    
+    def test_empty_results_are_not_indexed(self, index):
+        """Test that a result without known skills or education is dropped."""
+        assert index.add_frame(_frame([("/r/e.pdf", "Cobol", None)])) == 0
+        index.add_frame(_frame([("/r/d.pdf", "", None)]))
+        assert "/r/e.pdf" not in index and "/r/d.pdf" not in index
+        assert len(index) == 3
+    
+    def test_compact_keeps_results(self):
+        """Test that merging segments keeps the live results and answers."""
+        index = SimilarityIndex(SKILLS, EDUCATION, bits=6, tables=4)
+        for start in range(0, 300, 100):
+            index.add_frame(_random_frame(100, seed=start, start=start))
+        index.add_frame(_random_frame(50, seed=9))
+        before = [score for _, score in index.similar_to("/r/3.pdf", k=5, exact=True)]
+        index.compact()
+        assert len(index._segments) == 1
+        assert len(index) == 300
+        assert [score for _, score in index.similar_to("/r/3.pdf", k=5, exact=True)] == before
+    
+    def test_save_and_load(self, index, tmp_path):
+        """Test that a saved index answers the same queries."""
+        path = str(tmp_path / "index.npz")
+        index.save(path)
+        loaded = SimilarityIndex.load(path)
+        assert len(loaded) == len(index)
+        assert loaded.skills == index.skills
+        assert loaded.similar_to("/r/a.pdf") == index.similar_to("/r/a.pdf")
+        loaded.add_frame(_frame([("/r/f.pdf", "Java, Kotlin", "Master")]))
+        assert loaded.similar_to("/r/c.pdf", k=1)[0][0] == "/r/f.pdf"
+    
+    def test_add_csv(self, tmp_path):
+        """Test indexing a results CSV in chunks."""
+        path = tmp_path / "parsed_resumes.csv"
+        _random_frame(30, seed=2).assign(Name="x").to_csv(path, index=False)
+        index = SimilarityIndex(SKILLS, EDUCATION)
+        assert index.add_csv(str(path), chunksize=10) == 30
+        assert len(index._segments) == 3
+    
+    def test_missing_key_raises(self, index):
+        """Test that querying an unknown FilePath raises KeyError."""
+        with pytest.raises(KeyError):
+            index.similar_to("/r/missing.pdf")
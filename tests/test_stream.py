@@ -0,0 +1,94 @@
+"""
+Tests for the stream input/output module.
+"""
+
+import io
+import json
+import pytest
+
+from src.stream import read_frames, read_paths, stream_record, write_record
+
+
+def _frames(*documents):
+    """Encode (name, data) pairs as length-prefixed frames."""
+    out = b""
+    for name, data in documents:
+        header = f"{len(data)} {name}".strip() if name else str(len(data))
+        out += header.encode() + b"\n" + data
+    return io.BytesIO(out)
+
+
+class TestReadPaths:
+    """Test cases for read_paths."""
+    
+    def test_one_path_per_line(self):
+        """Test that each non-blank line is a document path."""
+        documents = list(read_paths(io.StringIO("/a/x.pdf\n\n/b/y.docx\r\n")))
+        assert documents == [("x.pdf", "/a/x.pdf", None), ("y.docx", "/b/y.docx", None)]
+    
+    def test_is_lazy(self):
+        """Test that a path is yielded before the rest of the input is read."""
+        stream = io.StringIO("/a/x.pdf\n/a/y.pdf\n")
+        documents = read_paths(stream)
+        assert next(documents)[1] == "/a/x.pdf"
+        assert stream.readline() == "/a/y.pdf\n"
+
+
+class TestReadFrames:
+    """Test cases for read_frames."""
+    
+    def test_frames(self):
+        """Test that frames are split by their length, including binary content."""
+        content = b"%PDF-1.4\n\x00\xff binary\n"
+        documents = list(read_frames(_frames(("john.pdf", content), ("jane.txt", b"Jane"))))
+        assert documents == [
+            ("john.pdf", "stdin://john.pdf", content),
+            ("jane.txt", "stdin://jane.txt", b"Jane"),
+        ]
+    
+    def test_default_name(self):
+        """Test that unnamed frames get a numbered PDF name."""
+        documents = list(read_frames(_frames((None, b"a"), (None, b"b"))))
+        assert [d[0] for d in documents] == ["stdin-1.pdf", "stdin-2.pdf"]
+    
+    def test_name_is_reduced_to_basename(self):
+        """Test that directories in a frame name are dropped."""
+        assert next(read_frames(_frames(("../etc/x.pdf", b"a"))))[0] == "x.pdf"
+    
+    def test_malformed_header(self):
+        """Test that a header without a length is rejected."""
+        with pytest.raises(ValueError, match="Malformed"):
+            list(read_frames(io.BytesIO(b"john.pdf\nxxxx")))
+    
+    def test_truncated_frame(self):
+        """Test that input ending inside a frame is rejected."""
+        with pytest.raises(ValueError, match="ended inside"):
+            list(read_frames(io.BytesIO(b"10 john.pdf\nshort")))
+    
+    def test_frame_too_large(self):
+        """Test that a length above the limit is rejected before reading."""
+        with pytest.raises(ValueError, match="limit"):
+            list(read_frames(io.BytesIO(b"1000 big.pdf\n"), max_bytes=100))
+
+
+class TestOutput:
+    """Test cases for stream_record and write_record."""
+    
+    def test_ok_record(self):
+        """Test that parsed data is written with its status."""
+        record = stream_record("a.pdf", "/r/a.pdf", "ok", {"Name": "Ann", "Skills": ["Python"]})
+        assert record == {"Name": "Ann", "Skills": ["Python"], "Status": "ok"}
+    
+    def test_failure_record(self):
+        """Test that failures carry the file, status and detail."""
+        record = stream_record("a.pdf", "/r/a.pdf", "scanned", "no text layer")
+        assert record == {"File": "a.pdf", "FilePath": "/r/a.pdf", "Status": "scanned", "Detail": "no text layer"}
+    
+    def test_write_record_ndjson(self):
+        """Test one JSON object per line, with non-ASCII kept."""
+        out = io.StringIO()
+        write_record(out, {"Name": "José"})
+        write_record(out, {"Name": "Ann"})
+        lines = out.getvalue().splitlines()
+        assert [json.loads(line)["Name"] for line in lines] == ["José", "Ann"]
+        assert "José" in lines[0]
@@ -0,0 +1,84 @@
+"""
+Tests for the PDF triage module.
+"""
+
+import fitz
+import pytest
+from unittest import mock
+from src.triage import probe_pdf, TEXT, SCANNED, SUSPICIOUS
+
+
+def _make_pdf(path, pages):
+    """Write a PDF with one page per entry: a text string or "IMAGE"."""
+    doc = fitz.open()
+    for content in pages:
+        page = doc.new_page()
+        if content == "IMAGE":
+            pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 20, 20), False)
+            pixmap.clear_with(128)
+            page.insert_image(fitz.Rect(50, 50, 300, 300), pixmap=pixmap)
+        elif content:
+            page.insert_text((72, 72), content)
+    doc.save(str(path))
+    return str(path)
+
+
+RESUME_TEXT = "John Smith\njohn@example.com\nEDUCATION\nB.Tech Computer Science\nSKILLS\nPython, SQL"
+
+
+class TestProbePDF:
+    """Test suite for probe_pdf function."""
+    
+    def test_probe_text_resume(self, tmp_path):
+        """Test that a resume with a text layer is classified as text."""
+        result = probe_pdf(_make_pdf(tmp_path / "resume.pdf", [RESUME_TEXT]))
+        assert result["category"] == TEXT
+        assert result["pages"] == 1
+        assert result["chars"] is None
+    
+    def test_probe_does_not_extract_text_by_default(self, tmp_path):
+        """Test that the default probe only reads font and image resources."""
+        path = _make_pdf(tmp_path / "resume.pdf", [RESUME_TEXT])
+        with mock.patch.object(fitz.Page, "get_text", side_effect=AssertionError("text extracted")):
+            assert probe_pdf(path)["category"] == TEXT
+    
+    def test_probe_reads_text_when_markers_required(self, tmp_path):
+        """Test that read_text measures the probed text."""
+        result = probe_pdf(_make_pdf(tmp_path / "resume.pdf", [RESUME_TEXT]), read_text=True)
+        assert result["category"] == TEXT
+        assert result["chars"] > 0
+    
+    def test_probe_scanned(self, tmp_path):
+        """Test that image-only pages are classified as scanned."""
+        result = probe_pdf(_make_pdf(tmp_path / "scan.pdf", ["IMAGE", "IMAGE"]))
+        assert result["category"] == SCANNED
+    
+    def test_probe_blank(self, tmp_path):
+        """Test that a blank document is suspicious."""
+        result = probe_pdf(_make_pdf(tmp_path / "blank.pdf", [""]))
+        assert result["category"] == SUSPICIOUS
+    
+    def test_probe_too_many_pages(self, tmp_path):
+        """Test that very long documents are suspicious."""
+        result = probe_pdf(_make_pdf(tmp_path / "book.pdf", [RESUME_TEXT] * 25))
+        assert result["category"] == SUSPICIOUS
+        assert result["pages"] == 25
+    
+    def test_probe_no_resume_markers(self, tmp_path):
+        """Test that text without contact details or headers is suspicious."""
+        text = "Invoice 55\nTotal amount due for services rendered in March, payable in 30 days."
+        result = probe_pdf(_make_pdf(tmp_path / "invoice.pdf", [text]), read_text=True)
+        assert result["category"] == SUSPICIOUS
+    
+    def test_probe_lowercase_headers_are_markers(self, tmp_path):
+        """Test that a resume without contact details or Title Case headers is kept."""
+        text = "jane doe\nexperience\nbackend developer at a small agency, 2018 to 2023\nskills\npython"
+        result = probe_pdf(_make_pdf(tmp_path / "resume.pdf", [text]), read_text=True)
+        assert result["category"] == TEXT
+    
+    def test_probe_invalid_file(self, tmp_path):
+        """Test that an unreadable file raises RuntimeError."""
+        path = tmp_path / "broken.pdf"
+        path.write_bytes(b"not a pdf")
+        with pytest.raises(RuntimeError):
+            probe_pdf(str(path))
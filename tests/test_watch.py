@@ -0,0 +1,102 @@
+"""
+Tests for the directory watch module.
+"""
+
+import threading
+import pytest
+from src.watch import DirectoryWatcher, watch_directory
+
+
+def _poll_until(watcher, attempts=20):
+    """Poll the watcher until it reports files or attempts run out."""
+    for _ in range(attempts):
+        ready = watcher.poll()
+        if ready:
+            return ready
+    return []
+
+
+class TestDirectoryWatcher:
+    """Test suite for DirectoryWatcher class."""
+    
+    @pytest.mark.parametrize("use_inotify", [False, True])
+    def test_watcher_reports_new_file(self, tmp_path, use_inotify):
+        """Test that a new file is reported once it has settled."""
+        watcher = DirectoryWatcher(
+            str(tmp_path), settle_seconds=0.05, poll_interval=0.05, use_inotify=use_inotify
+        )
+        (tmp_path / "resume.pdf").write_bytes(b"%PDF-1.4")
+        
+        assert _poll_until(watcher) == [str(tmp_path / "resume.pdf")]
+        watcher.close()
+    
+    @pytest.mark.parametrize("use_inotify", [False, True])
+    def test_watcher_reports_existing_files(self, tmp_path, use_inotify):
+        """Test that files present at startup are reported once."""
+        (tmp_path / "old.pdf").write_bytes(b"%PDF-1.4")
+        watcher = DirectoryWatcher(
+            str(tmp_path), settle_seconds=0.02, poll_interval=0.02, use_inotify=use_inotify, include_existing=True
+        )
+        assert _poll_until(watcher) == [str(tmp_path / "old.pdf")]
+        assert _poll_until(watcher, attempts=3) == []
+        watcher.close()
+    
+    def test_watcher_can_skip_existing_files(self, tmp_path):
+        """Test that files present at startup form the baseline when not included."""
+        (tmp_path / "old.pdf").write_bytes(b"%PDF-1.4")
+        watcher = DirectoryWatcher(
+            str(tmp_path), settle_seconds=0, poll_interval=0.01, use_inotify=False, include_existing=False
+        )
+        assert watcher.poll() == []
+    
+    def test_watcher_reports_changed_file(self, tmp_path):
+        """Test that a modified file is reported again."""
+        path = tmp_path / "resume.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        watcher = DirectoryWatcher(
+            str(tmp_path), settle_seconds=0.02, poll_interval=0.02, use_inotify=False, include_existing=False
+        )
+        path.write_bytes(b"%PDF-1.4 updated")
+        
+        assert _poll_until(watcher) == [str(path)]
+    
+    def test_watcher_waits_for_growing_file(self, tmp_path):
+        """Test that a file still being written is not reported."""
+        path = tmp_path / "partial.pdf"
+        watcher = DirectoryWatcher(str(tmp_path), settle_seconds=10, poll_interval=0.01, use_inotify=False)
+        with open(path, "wb") as fh:
+            for chunk in range(3):
+                fh.write(b"x" * 100)
+                fh.flush()
+                assert watcher.poll() == []
+    
+    def test_watcher_ignores_other_extensions(self, tmp_path):
+        """Test that unsupported files are ignored."""
+        watcher = DirectoryWatcher(str(tmp_path), settle_seconds=0, poll_interval=0.01, use_inotify=False)
+        (tmp_path / "notes.tmp").write_text("x")
+        assert watcher.poll() == []
+        assert watcher.poll() == []
+
+
+class TestWatchDirectory:
+    """Test suite for watch_directory function."""
+    
+    def test_watch_directory_stops_on_event(self, tmp_path):
+        """Test that watching stops once the stop event is set."""
+        stop_event = threading.Event()
+        handled = []
+        
+        def handler(paths):
+            handled.extend(paths)
+            stop_event.set()
+        
+        (tmp_path / "a.pdf").write_bytes(b"%PDF-1.4")
+        timer = threading.Timer(0.05, lambda: (tmp_path / "b.pdf").write_bytes(b"%PDF-1.4"))
+        timer.start()
+        count = watch_directory(
+            str(tmp_path), handler, stop_event,
+            settle_seconds=0.05, poll_interval=0.05, use_inotify=False, include_existing=False,
+        )
+        timer.join()
+        assert count == 1
+        assert handled == [str(tmp_path / "b.pdf")]
@@ -0,0 +1,238 @@
+"""
+Tests for the worker pool module.
+
+Controller decisions are driven with synthetic timings and a fake clock;
+the pool tests start real worker processes.
+"""
+
+import gc
+import os
+import sys
+import pytest
+import multiprocessing
+from unittest import mock
+
+import src.workers as workers
+from src.storage import LocalStorage, prefetch
+from src.bootstrap import TEMPLATE_MODULE, worker_context
+from src.memory import current_rss, unique_memory
+from src.workers import AdaptiveController, Limit, available_cpus, run_pool
+
+MB = 2 ** 20
+
+
+def _square(x):
+    return x * x
+
+
+def _fail_on_three(x):
+    if x == 3:
+        raise ValueError("three")
+    return x
+
+
+def _template_state(_):
+    return TEMPLATE_MODULE in sys.modules, gc.get_freeze_count() > 0
+
+
+class _Clock:
+    """Manually advanced time source."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def _window(controller, clock, docs, seconds, cpu_ratio=0.5, rss=100 * MB, input_wait=0.0):
+    """Feed one adjustment window of synthetic measurements."""
+    for _ in range(docs):
+        controller.record(cpu_ratio * 0.01, 0.01, rss)
+    controller.record_input_wait(input_wait)
+    clock.now += seconds
+    return controller.maybe_adjust()
+
+
+def _controller(clock, cpus=4, memory_bytes=0):
+    return AdaptiveController(
+        cpus=cpus, max_workers=16, memory_bytes=memory_bytes, interval=1.0, tolerance=0.05, clock=clock
+    )
+
+
+class TestAvailableCpus:
+    """Test cases for CPU quota detection."""
+    
+    def _cpus(self, files, affinity=8):
+        def read(path):
+            return files.get(path)
+        with mock.patch.object(workers, "_read_first_line", side_effect=read), \
+                mock.patch.object(os, "sched_getaffinity", return_value=set(range(affinity)), create=True):
+            return available_cpus()
+    
+    def test_no_quota_uses_affinity(self):
+        """Test that without a quota the affinity mask decides."""
+        assert self._cpus({"/sys/fs/cgroup/cpu.max": "max 100000"}) == 8
+    
+    def test_cgroup_v2_quota(self):
+        """Test that a cgroup v2 cpu.max quota limits the count."""
+        assert self._cpus({"/sys/fs/cgroup/cpu.max": "200000 100000"}) == 2
+    
+    def test_cgroup_v1_quota(self):
+        """Test that a cgroup v1 CFS quota limits the count."""
+        files = {
+            "/sys/fs/cgroup/cpu/cpu.cfs_quota_us": "150000",
+            "/sys/fs/cgroup/cpu/cpu.cfs_period_us": "100000",
+        }
+        assert self._cpus(files) == 2
+    
+    def test_fractional_quota_is_at_least_one(self):
+        """Test that a quota below one CPU still allows one worker."""
+        assert self._cpus({"/sys/fs/cgroup/cpu.max": "20000 100000"}) == 1
+
+
+class TestAdaptiveController:
+    """Test cases for AdaptiveController tuning decisions."""
+    
+    def test_starts_at_cpu_count(self):
+        """Test the initial worker count."""
+        assert _controller(_Clock()).workers.get() == 4
+    
+    def test_waits_for_full_window(self):
+        """Test that no decision is made before the interval has passed."""
+        clock = _Clock()
+        controller = _controller(clock)
+        assert _window(controller, clock, docs=10, seconds=0.5) is False
+        assert controller.workers.get() == 4
+    
+    def test_climbs_while_throughput_improves(self):
+        """Test that an I/O-bound workload gets more workers while it helps."""
+        clock = _Clock()
+        controller = _controller(clock)
+        _window(controller, clock, docs=40, seconds=1.0, cpu_ratio=0.2)
+        assert controller.workers.get() == 5
+        _window(controller, clock, docs=50, seconds=1.0, cpu_ratio=0.2)
+        assert controller.workers.get() == 6
+    
+    def test_reverses_when_throughput_drops(self):
+        """Test that a step that made things worse is undone."""
+        clock = _Clock()
+        controller = _controller(clock)
+        _window(controller, clock, docs=40, seconds=1.0, cpu_ratio=0.2)
+        _window(controller, clock, docs=30, seconds=1.0, cpu_ratio=0.2)
+        assert controller.workers.get() == 4
+    
+    def test_holds_on_plateau(self):
+        """Test that changes within the tolerance keep the current setting."""
+        clock = _Clock()
+        controller = _controller(clock)
+        _window(controller, clock, docs=40, seconds=1.0, cpu_ratio=0.2)
+        _window(controller, clock, docs=41, seconds=1.0, cpu_ratio=0.2)
+        assert controller.workers.get() == 5
+    
+    def test_cpu_bound_capped_at_cpus(self):
+        """Test that CPU-bound documents never get more workers than CPUs."""
+        clock = _Clock()
+        controller = _controller(clock)
+        for docs in (40, 60, 80):
+            _window(controller, clock, docs=docs, seconds=1.0, cpu_ratio=0.98)
+        assert controller.workers.get() == 4
+    
+    def test_memory_ceiling(self):
+        """Test that workers are capped by the memory ceiling over peak RSS."""
+        clock = _Clock()
+        controller = _controller(clock, memory_bytes=300 * MB)
+        _window(controller, clock, docs=40, seconds=1.0, cpu_ratio=0.2, rss=100 * MB)
+        assert controller.workers.get() == 3
+        assert controller.memory_cap() == 3
+    
+    def test_prefetch_grows_when_waiting_for_input(self):
+        """Test that prefetch depth doubles while the pool waits for input."""
+        clock = _Clock()
+        controller = _controller(clock)
+        depth = controller.prefetch.get()
+        _window(controller, clock, docs=40, seconds=1.0, input_wait=0.5)
+        assert controller.prefetch.get() == min(depth * 2, controller.max_prefetch)
+        _window(controller, clock, docs=40, seconds=1.0, input_wait=0.0)
+        assert controller.prefetch.get() == min(depth * 2, controller.max_prefetch)
+    
+    def test_settings(self):
+        """Test the reported settings."""
+        clock = _Clock()
+        controller = _controller(clock)
+        _window(controller, clock, docs=40, seconds=1.0, cpu_ratio=0.5, rss=64 * MB)
+        settings = controller.settings()
+        assert settings["workers"] == 5
+        assert settings["docs_per_sec"] == 40.0
+        assert settings["peak_rss_mb"] == 64.0
+
+
+class TestRunPool:
+    """Test cases for run_pool."""
+    
+    def test_fixed_workers(self):
+        """Test that every item is processed once."""
+        results = dict(run_pool(((i,) for i in range(20)), _square, workers=2))
+        assert results == {i: i * i for i in range(20)}
+    
+    def test_errors_are_yielded(self):
+        """Test that an exception in a worker is returned for its item only."""
+        results = dict(run_pool(((i,) for i in range(5)), _fail_on_three, workers=2))
+        assert isinstance(results[3], ValueError)
+        assert [results[i] for i in (0, 1, 2, 4)] == [0, 1, 2, 4]
+    
+    def test_with_controller(self):
+        """Test that the controller receives a measurement per item."""
+        controller = AdaptiveController(cpus=2, max_workers=2, memory_bytes=None, interval=3600)
+        results = dict(run_pool(((i,) for i in range(10)), _square, workers=0, controller=controller))
+        assert len(results) == 10
+        assert controller._docs == 10
+        assert controller.settings()["peak_rss_mb"] > 0
+
+
+class TestWorkerStartup:
+    """Test cases for worker start methods."""
+    
+    @pytest.mark.skipif(
+        "forkserver" not in multiprocessing.get_all_start_methods(), reason="no fork server"
+    )
+    def test_forkserver_workers_start_from_template(self):
+        """Test that workers forked from the server are preloaded and frozen."""
+        results = dict(run_pool([(0,)], _template_state, workers=1, start_method="forkserver"))
+        assert results[0] == (True, True)
+    
+    def test_spawn_workers_start_from_scratch(self):
+        """Test that spawned workers do not run the template."""
+        results = dict(run_pool([(0,)], _template_state, workers=1, start_method="spawn"))
+        assert results[0] == (False, False)
+    
+    def test_unknown_start_method(self):
+        """Test that an unknown start method raises ValueError."""
+        with pytest.raises(ValueError):
+            worker_context("thread")
+    
+    @pytest.mark.skipif(not os.path.exists("/proc/self/smaps_rollup"), reason="no /proc smaps")
+    def test_unique_memory(self):
+        """Test that USS is reported and is at most RSS."""
+        assert 0 < unique_memory() <= current_rss()
+
+
+class TestDynamicPrefetchDepth:
+    """Test cases for prefetch with a callable depth."""
+    
+    def test_depth_can_change_while_running(self, tmp_path):
+        """Test that a Limit can drive the prefetch depth."""
+        for i in range(6):
+            (tmp_path / f"{i}.txt").write_bytes(str(i).encode())
+        depth = Limit(1)
+        backend = LocalStorage(str(tmp_path))
+        seen = []
+        for key, data, error in prefetch(backend, sorted(backend.list()), workers=4, depth=depth.get):
+            seen.append(data)
+            depth.set(4)
+        assert seen == [str(i).encode() for i in range(6)]
+    
+    def test_depth_must_be_positive(self, tmp_path):
+        """Test that a non-positive depth is rejected."""
+        with pytest.raises(ValueError):
+            next(prefetch(LocalStorage(str(tmp_path)), [], depth=lambda: 0))